@@ -0,0 +1,42 @@
+"""Time FileCombiner with a varying number of reading processes.
+
+Run as ``python benchmarks/bench_file_combiner.py``.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from nektsrs.io import FileCombiner, write_pts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nfiles", type=int, default=16)
+    parser.add_argument("--npoints", type=int, default=20000)
+    parser.add_argument("--nt", type=int, default=100)
+    parser.add_argument("--nfields", type=int, default=4)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    locs = rng.random((args.npoints, 3))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.nfiles):
+            t = (np.arange(args.nt) + i * args.nt) * 1e-3
+            data = rng.random((args.npoints, args.nt, args.nfields))
+            fname = os.path.join(tmp, f"ptsbench{i % 2}.f{i + 1:05d}")
+            write_pts(fname, t, locs, data, t[0])
+
+        for workers in args.workers:
+            start = time.perf_counter()
+            FileCombiner("bench", tmp, workers=workers)
+            elapsed = time.perf_counter() - start
+            print(f"\t workers {workers:3d}: {elapsed:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
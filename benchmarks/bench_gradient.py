@@ -0,0 +1,46 @@
+"""Time the spectral gradient of a time series of plane data.
+
+The time of a dense matrix product over the same data, the lower bound
+of the element-wise differentiation, is printed for comparison.
+
+Run as ``python benchmarks/bench_gradient.py``.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from nektsrs.derivatives import gradient
+from nektsrs.grid import SimpleGrid2D
+from nektsrs.reference import reference_element
+
+
+def timed(label, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"\t {label:30s} {time.perf_counter() - start:8.4f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=32)
+    parser.add_argument("--lx", type=int, default=8)
+    parser.add_argument("--nt", type=int, default=100)
+    args = parser.parse_args()
+
+    g = SimpleGrid2D(0, 1, 0, 1, args.n, args.n, args.lx)
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((args.nt, g.gll1.size, g.gll2.size))
+
+    print(f"{args.nt} x {g.gll1.size} x {g.gll2.size} points")
+    timed("gradient, axis 0", gradient, g, data, axis=0)
+    timed("gradient, axis 1", gradient, g, data, axis=1)
+
+    dmat = reference_element(args.lx).diff_matrix
+    block = data[..., : data.shape[-1] // args.lx * args.lx]
+    timed("matmul", np.matmul, block.reshape((-1, args.lx)), dmat.T)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compare per-snapshot and per-probe reads for different hdf5 layouts.
+
+Run as ``python benchmarks/bench_hdf5_layout.py``.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import h5py
+import numpy as np
+
+from nektsrs.io import dataset_options, open_hdf5
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nt", type=int, default=500)
+    parser.add_argument("--npoints", type=int, default=20000)
+    parser.add_argument("--nfields", type=int, default=4)
+    parser.add_argument("--nreads", type=int, default=20)
+    args = parser.parse_args()
+
+    shape = (args.nt, args.nfields, args.npoints)
+    rng = np.random.default_rng(0)
+    data = rng.random(shape)
+    snapshots = rng.choice(args.nt, args.nreads, replace=False)
+    probes = rng.choice(args.npoints, args.nreads, replace=False)
+
+    cases = [
+        ("contiguous", None),
+        ("time-major", None),
+        ("point-major", None),
+        ("time-major", "lzf"),
+        ("point-major", "gzip"),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = os.path.join(tmp, "layout.hdf5")
+        print(f"{args.nreads} reads of {shape}, times in ms per read")
+        print("\t layout      compression  size [MiB]  snapshot  probe")
+        for layout, compression in cases:
+            with h5py.File(fname, "w") as f:
+                f.create_dataset(
+                    "data",
+                    data=data,
+                    **dataset_options(shape, data.dtype, layout, compression),
+                )
+            size = os.path.getsize(fname) / 2**20
+
+            with open_hdf5(fname) as f:
+                start = time.perf_counter()
+                for i in snapshots:
+                    f["data"][i]
+                t_snap = (time.perf_counter() - start) / args.nreads
+
+            with open_hdf5(fname) as f:
+                start = time.perf_counter()
+                for i in probes:
+                    f["data"][:, :, i]
+                t_probe = (time.perf_counter() - start) / args.nreads
+
+            print(
+                f"\t {layout:11s} {str(compression):12s} {size:10.1f}"
+                f"  {t_snap * 1e3:8.2f}  {t_probe * 1e3:5.2f}"
+            )
+            os.remove(fname)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare the interpolation methods of Interpolator1D, 2D and 3D.
+
+Run as ``python benchmarks/bench_interpolation.py``.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from nektsrs.grid import SimpleGrid1D, SimpleGrid2D, SimpleGrid3D
+from nektsrs.interpolator import Interpolator1D, Interpolator2D, Interpolator3D
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"\t {label:30s} {time.perf_counter() - start:8.4f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=16)
+    parser.add_argument("--lx", type=int, default=8)
+    parser.add_argument("--npoints", type=int, default=64)
+    args = parser.parse_args()
+
+    g1 = SimpleGrid1D(0, 1, args.n, args.lx)
+    intp1 = Interpolator1D(g1)
+    data1 = np.sin(7 * g1.gll)
+    x = np.linspace(0, 1, args.npoints**2)
+
+    print(f"1D, {args.n} elements, {x.size} points")
+    ref = timed("interpolate_reference", intp1.interpolate_reference, data1, x)
+    v = timed("interpolate", intp1.interpolate, data1, x)
+    op = timed("operator", intp1.operator, x)
+    w = timed("operator @ data", op.dot, data1)
+    print(
+        f"\t max difference {np.max(np.abs(ref - v)):.2e}, "
+        f"{np.max(np.abs(ref - w)):.2e}"
+    )
+
+    g2 = SimpleGrid2D(0, 1, 0, 1, args.n, args.n, args.lx)
+    intp2 = Interpolator2D(g2)
+    data2 = np.sin(7 * np.add.outer(g2.gll1, g2.gll2))
+    x = np.linspace(0, 1, args.npoints)
+    xx, yy = np.meshgrid(x, x, indexing="ij")
+    p = np.stack((xx.ravel(), yy.ravel()), axis=1)
+
+    print(f"2D, {args.n}x{args.n} elements, {x.size}x{x.size} points")
+    ref = timed("interpolate_reference", intp2.interpolate_reference, data2, p)
+    v = timed("interpolate", intp2.interpolate, data2, p)
+    w = timed("interpolate_grid", intp2.interpolate_grid, data2, x, x)
+    print(
+        f"\t max difference {np.max(np.abs(ref - v)):.2e}, "
+        f"{np.max(np.abs(ref - w.ravel())):.2e}"
+    )
+
+    n3 = max(args.n // 4, 1)
+    g3 = SimpleGrid3D(0, 1, 0, 1, 0, 1, n3, n3, n3, args.lx)
+    intp3 = Interpolator3D(g3)
+    data3 = np.sin(7 * np.add.outer(np.add.outer(g3.gll1, g3.gll2), g3.gll3))
+    x = np.linspace(0, 1, args.npoints // 2)
+    xx, yy, zz = np.meshgrid(x, x, x, indexing="ij")
+    p = np.stack((xx.ravel(), yy.ravel(), zz.ravel()), axis=1)
+
+    print(f"3D, {n3}^3 elements, {x.size}^3 points")
+    v = timed("interpolate", intp3.interpolate, data3, p)
+    w = timed("interpolate_grid", intp3.interpolate_grid, data3, x, x, x)
+    print(f"\t max difference {np.max(np.abs(v - w.ravel())):.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compare the bulk pts reader with the original per-point reader.
+
+Run as ``python benchmarks/bench_time_series_read.py``.
+"""
+import argparse
+import os
+import struct
+import tempfile
+import time
+
+import numpy as np
+
+from nektsrs.io import TimeSeries, write_pts
+from nektsrs.io.helpers import read_int, read_real
+
+
+def read_per_point(fname: str):
+    """The original reader, one read_real per point and snapshot."""
+    infile = open(fname, "rb")
+    header = infile.read(132).split()
+    wdsizet = int(header[1])
+    wdsizef = int(header[2])
+
+    etagb = infile.read(4)
+    if int(struct.unpack("<f", etagb)[0] * 1e5) / 1e5 == 6.54321:
+        emode = "<"
+    else:
+        emode = ">"
+
+    ldim = int(header[3])
+    npoints = int(header[5])
+    nt = int(header[6])
+    nfields = int(header[7])
+
+    t = read_real(infile, emode, wdsizet, nt)
+    ids = np.array(read_int(infile, emode, npoints)) - 1
+    locs = np.zeros((npoints, ldim))
+    for i in range(npoints):
+        locs[i] = read_real(infile, emode, wdsizet, ldim)
+
+    data = np.zeros((npoints, nt, nfields))
+    for i in range(npoints):
+        for j in range(nt):
+            fld = read_real(infile, emode, wdsizef, nfields)
+            for k in range(nfields):
+                data[i][j][k] = fld[k]
+    infile.close()
+    return t, ids, locs, data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--npoints", type=int, default=5000)
+    parser.add_argument("--nt", type=int, default=50)
+    parser.add_argument("--nfields", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    t = np.linspace(0, 1, args.nt)
+    locs = rng.random((args.npoints, 3))
+    data = rng.random((args.npoints, args.nt, args.nfields))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = os.path.join(tmp, "ptsbench0.f00001")
+        write_pts(fname, t, locs, data, wdsizef=4)
+        size = os.path.getsize(fname) / 2**20
+        print(f"File of {size:.1f} MiB, {args.npoints} points, {args.nt} t")
+
+        start = time.perf_counter()
+        read_per_point(fname)
+        legacy = time.perf_counter() - start
+        print(f"\t per-point reader {legacy:.3f} s")
+
+        start = time.perf_counter()
+        TimeSeries.read(fname)
+        bulk = time.perf_counter() - start
+        print(f"\t bulk reader      {bulk:.3f} s ({legacy / bulk:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from . import io
 from . import grid
 from . import interpolator
+from . import statistics
 
-__all__ = ["io", "grid", "interpolator"]
+__all__ = ["io", "grid", "interpolator", "statistics"]
@@ -0,0 +1,101 @@
+from mpi4py import MPI
+import h5py
+import numpy as np
+from nektsrs.statistics import two_point_correlation
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="A utility computing two-point correlations of the \
+                     fluctuations on the uniform planes written by \
+                     nektsrs_interpolate, via the FFT."
+    )
+
+    parser.add_argument(
+        "--input",
+        type=str,
+        help="The input hdf5 file with the interpolated planes.",
+        required=True,
+    )
+
+    parser.add_argument(
+        "--output", type=str, help="The output hdf5 file.", required=True
+    )
+
+    parser.add_argument(
+        "--nonperiodic",
+        type=int,
+        nargs="+",
+        help="The non-periodic axes of the planes, 0 for x and 1 for z, \
+              which are zero-padded. By default both are periodic.",
+        default=[],
+    )
+
+    parser.add_argument(
+        "--fields",
+        type=int,
+        nargs="+",
+        help="The indices of the fields to include, by default all.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--time-range",
+        type=float,
+        nargs=2,
+        help="The start and end time of the snapshots to include.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--normalize",
+        action="store_true",
+        help="Divide the correlations by the variance, i.e. the value \
+              at zero separation.",
+    )
+
+    parser.add_argument(
+        "--budget",
+        type=int,
+        help="The maximum size of the data read at once by a rank, MiB.",
+        default=64,
+    )
+
+    args = parser.parse_args()
+
+    comm = MPI.COMM_WORLD
+    rank = comm.Get_rank()
+
+    with h5py.File(args.input, "r") as f:
+        ndim = len(f["data"].shape) - 2
+    periodic = tuple(i not in args.nonperiodic for i in range(ndim))
+
+    # The snapshots are split between the ranks, all of them get the
+    # summed correlations
+    lags, correlation = two_point_correlation(
+        args.input,
+        periodic,
+        args.fields,
+        args.time_range,
+        args.budget * 2**20,
+        comm,
+    )
+
+    if args.normalize:
+        zero = tuple(int(np.flatnonzero(lag == 0)[0]) for lag in lags)
+        variance = correlation[(slice(None),) + zero]
+        correlation /= variance.reshape((-1,) + (1,) * ndim)
+
+    if rank == 0:
+        with h5py.File(args.output, "w") as out:
+            out.create_dataset("correlation", data=correlation)
+            for i, lag in enumerate(lags):
+                out.create_dataset(f"lags{i + 1}", data=lag)
+            out.attrs["periodic"] = np.array(periodic)
+            out.attrs["normalized"] = args.normalize
+        print("Done")
+
+
+if __name__ == "__main__":
+    main()
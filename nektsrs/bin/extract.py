@@ -0,0 +1,85 @@
+from nektsrs.io import TimeSeries, parse_layout
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="A utility extracting a part of the data in a pts \
+                     file, i.e. some fields at some points over a time \
+                     window, to an hdf5 file."
+    )
+
+    parser.add_argument(
+        "--input", type=str, help="The input pts file.", required=True
+    )
+
+    parser.add_argument(
+        "--output", type=str, help="The output hdf5 file.", required=True
+    )
+
+    parser.add_argument(
+        "--fields",
+        type=int,
+        nargs="+",
+        help="The indices of the fields to extract, by default all.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--points",
+        type=str,
+        nargs="+",
+        help="The 0-based ids of the points to extract, by default all. \
+              Ranges like 100:200 are allowed.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--time-range",
+        type=float,
+        nargs=2,
+        help="The start and end time of the snapshots to extract.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--layout",
+        type=str,
+        help="The chunk layout of the data: time-major, point-major, \
+              contiguous, or an explicit chunk shape, e.g. 16,4,1024.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--compression",
+        type=str,
+        help="Compress the data with gzip, gzip-<level> or lzf.",
+        default=None,
+    )
+
+    args = parser.parse_args()
+
+    points = None
+    if args.points is not None:
+        points = []
+        for i in args.points:
+            if ":" in i:
+                start, end = i.split(":")
+                points.extend(range(int(start), int(end)))
+            else:
+                points.append(int(i))
+
+    ts = TimeSeries.read(
+        args.input,
+        fields=args.fields,
+        points=points,
+        time_range=args.time_range,
+    )
+    ts.collate_data()
+
+    print(f"Extracted data of shape {ts.data.shape}")
+    ts.save(args.output, parse_layout(args.layout), args.compression)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,4 @@
-from nektsrs.io.header import Header
-import glob
-from os.path import join
+from nektsrs.io import Manifest
 import argparse
 import numpy as np
 
@@ -23,15 +21,12 @@ def main():
 
     basename = args.basename
 
-    search_string = join("pts" + basename + "[0-1].f[0-9][0-9][0-9][0-9][0-9]")
-    datafiles = glob.glob(search_string)
-    print(f"Found {len(datafiles)} datafiles")
-    if len(datafiles) == 0:
-        raise FileExistsError("Could not find any data!")
+    # Only new or changed files are opened
+    manifest = Manifest(basename)
+    manifest.refresh()
+    datafiles = manifest.datafiles
 
-    datafiles.sort()
-
-    headers = np.array([Header(i) for i in datafiles])
+    headers = manifest.headers
     ldim = np.array([h.ldim for h in headers])
     npoints = np.array([h.npoints for h in headers])
     nt = np.array([h.nt for h in headers])
@@ -41,6 +36,9 @@ def main():
     for i in range(len(datafiles)):
         print(i, time[i], nt[i])
 
+    for i in manifest.truncated:
+        print(f"WARNING: {i} is truncated!")
+
     print("Information follows in the format: min, max, (mean)")
     print("\t Write time", np.min(time), np.max(time))
     print(
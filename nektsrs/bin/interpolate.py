@@ -1,10 +1,13 @@
 import numpy as np
 from mpi4py import MPI
 import h5py
-from tqdm import trange
+from tqdm import tqdm
 from nektsrs.grid import SimpleGrid1D
 from nektsrs.chunks import chunks_and_offsets
-from nektsrs.interpolator import Interpolator1D
+from nektsrs.interpolator import Interpolator1D, OperatorCache
+from nektsrs.interpolator.interpolator1d import apply_operator
+from nektsrs.io import dataset_options, open_hdf5, parse_layout
+from nektsrs.statistics.averages import read_chunk, time_slice
 import argparse
 
 
@@ -63,6 +66,95 @@ def main():
         required=True,
     )
 
+    parser.add_argument(
+        "--nx-out",
+        type=int,
+        help="The # of uniformly spaced output points in x, by default \
+              the # of gll points.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--nz-out",
+        type=int,
+        help="The # of uniformly spaced output points in z, by default \
+              the # of gll points.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--endpoint",
+        action="store_true",
+        help="Include the end of the domain in the uniform output \
+              points. By default the points are spaced for a periodic \
+              domain, as expected by nektsrs_spectra and \
+              nektsrs_correlations.",
+    )
+
+    parser.add_argument(
+        "--target",
+        type=str,
+        help="An .npz file with the arrays x and z, the coordinates of an \
+              arbitrary tensor grid of output points. Overrides --nx-out \
+              and --nz-out.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--fields",
+        type=int,
+        nargs="+",
+        help="The indices of the fields to interpolate, by default all.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--time-range",
+        type=float,
+        nargs=2,
+        help="The start and end time of the snapshots to interpolate.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--layout",
+        type=str,
+        help="The chunk layout of the output: time-major, point-major, \
+              contiguous, or an explicit chunk shape, e.g. 16,256,256.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--compression",
+        type=str,
+        help="Compress the output with gzip, gzip-<level> or lzf. \
+              Requires an HDF5 build supporting parallel filters.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--dtype",
+        type=str,
+        choices=["float32", "float64"],
+        help="The dtype of the output, by default that of the input.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--batch",
+        type=int,
+        help="The # of snapshots interpolated at once.",
+        default=32,
+    )
+
+    parser.add_argument(
+        "--cache",
+        type=str,
+        help="A directory, shared by the ranks, where the interpolation \
+              operator is cached for later runs.",
+        default=None,
+    )
+
     args = parser.parse_args()
 
     input_file = args.input
@@ -78,55 +170,106 @@ def main():
     nprocs = comm.Get_size()
 
     # The file from which we interpolate
-    pts = h5py.File(input_file, "r", driver="mpio", comm=comm)
+    pts = open_hdf5(input_file, "r", driver="mpio", comm=comm)
 
     # Create 1D grids corresponding to what we have in the
     # simulation as per the .box file
-    eps = 1e-7
-    gridx = SimpleGrid1D(eps, length_x - eps, n=nx, lx=lx)
-    gridz = SimpleGrid1D(eps, length_z - eps, n=nz, lx=lx)
+    gridx = SimpleGrid1D(0, length_x, n=nx, lx=lx)
+    gridz = SimpleGrid1D(0, length_z, n=nz, lx=lx)
 
     npx = gridx.gll.size
     npz = gridz.gll.size
+    if pts["data"].shape[2] != npx * npz:
+        raise ValueError(
+            f"The {pts['data'].shape[2]} points do not match the \
+              {npx} x {npz} gll points of the grid."
+        )
 
-    # The interpolator
-    intp = Interpolator1D(gridx)
+    # The points of the output grid
+    if args.target is not None:
+        target = np.load(args.target)
+        x = np.asarray(target["x"], dtype=np.float64)
+        z = np.asarray(target["z"], dtype=np.float64)
+    else:
+        nx_out = npx if args.nx_out is None else args.nx_out
+        nz_out = npz if args.nz_out is None else args.nz_out
+        x = np.linspace(0, length_x, nx_out, endpoint=args.endpoint)
+        z = np.linspace(0, length_z, nz_out, endpoint=args.endpoint)
+
+    # The interpolation is a tensor product of 1D operators, which are
+    # built once and reused for all lines and snapshots. With a cache,
+    # they are built only by rank 0 and only if not found, the ranks
+    # memory-map the same copy.
+    intpx = Interpolator1D(gridx)
+    intpz = Interpolator1D(gridz)
+    if args.cache is not None:
+        cache = OperatorCache(args.cache)
+        opx = cache.operator(intpx, x, comm)
+        opz = cache.operator(intpz, z, comm)
+    else:
+        opx = intpx.operator(x)
+        opz = intpz.operator(z)
 
-    # interpolation points
-    points = np.linspace(eps, length_x - eps, npx)
-    nt = pts["data"].shape[0]
-    nt = 10
+    t = pts["t"][()]
+    steps = time_slice(t, args.time_range)
+    nt = steps.stop - steps.start
+    if nt <= 0:
+        raise ValueError("No data in the time range.")
+
+    nfields = pts["data"].shape[1] if args.fields is None else len(args.fields)
+    dtype = np.dtype(args.dtype) if args.dtype else pts["data"].dtype
+    shape = (nt, nfields, x.size, z.size)
 
     f = h5py.File(output_file, "w", driver="mpio", comm=comm)
 
-    new_data = f.create_dataset("data", (nt, npx, npz))
-    f.create_dataset("t", data=pts["t"][:nt])
+    new_data = f.create_dataset(
+        "data",
+        shape,
+        dtype=dtype,
+        **dataset_options(
+            shape, dtype, parse_layout(args.layout), args.compression
+        ),
+    )
+    f.create_dataset("t", data=t[steps])
+    f.create_dataset("x", data=x)
+    f.create_dataset("z", data=z)
+    f.attrs["fields"] = (
+        np.arange(nfields) if args.fields is None else args.fields
+    )
+    f.attrs["nt"] = nt
+    f.attrs["nfields"] = nfields
 
     if rank == 0:
         print(
-            f"The time span of the data is {np.min(pts['t'])}, \
-              {np.max(pts['t'])}"
+            f"Interpolating {nt} snapshots of {nfields} fields from \
+              {npx} x {npz} to {x.size} x {z.size} points"
         )
 
-    [chunks, offsets] = chunks_and_offsets(nprocs, nt)
-
-    temp = np.zeros((npx, npz))
+    [chunks, offsets] = chunks_and_offsets(min(nprocs, nt), nt)
+    if rank < chunks.size:
+        first = steps.start + offsets[rank]
+        last = first + chunks[rank]
+    else:
+        first = last = steps.start
 
+    batches = range(first, last, args.batch)
     if rank == 0:
-        loop_range = trange(chunks[rank])
-    else:
-        loop_range = range(chunks[rank])
+        batches = tqdm(batches)
 
-    # Each rank loops through its portion of the time-index
-    for i in loop_range:
-        position = offsets[rank] + i
+    # Each rank loops through its portion of the time-index, a batch
+    # of snapshots at a time
+    for start in batches:
+        end = min(start + args.batch, last)
 
-        # Loop across z index and do 1D interpolation in x
-        datai = np.reshape(pts["data"][position, 0, :], (npx, npz), "F")
-        for i in range(npz):
-            temp[:, i] = intp.interpolate(datai[:, i], points)
+        # The points are ordered x first, so that the data of a
+        # snapshot is [z, x]. Interpolate along z and then x for all
+        # the fields of all the snapshots, one product each.
+        datai = read_chunk(pts["data"], start, end, args.fields)
+        datai = datai.reshape(datai.shape[:2] + (npz, npx))
+        datai = apply_operator(opx, apply_operator(opz, datai, -2), -1)
 
-        new_data[position, :, :] = temp
+        offset = start - steps.start
+        new_data[offset : offset + end - start] = np.swapaxes(datai, -1, -2)
 
     comm.Barrier()
     f.close()
@@ -0,0 +1,99 @@
+from mpi4py import MPI
+from nektsrs.chunks import chunks_and_offsets
+from nektsrs.io import open_hdf5
+from nektsrs.statistics.averages import time_slice
+from nektsrs.statistics.moments import merge_moments, range_moments
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="A utility computing the mean, variance, skewness, \
+                     flatness and cross-covariances of the fields at \
+                     each point of an hdf5 time series in a single pass."
+    )
+
+    parser.add_argument(
+        "--input",
+        type=str,
+        help="The input hdf5 file, e.g. from nektsrs_to_hdf5.",
+        required=True,
+    )
+
+    parser.add_argument(
+        "--output", type=str, help="The output hdf5 file.", required=True
+    )
+
+    parser.add_argument(
+        "--fields",
+        type=int,
+        nargs="+",
+        help="The indices of the fields to include, by default all.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--time-range",
+        type=float,
+        nargs=2,
+        help="The start and end time of the snapshots to include.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--budget",
+        type=int,
+        help="The maximum size of the data read at once by a rank, MiB.",
+        default=64,
+    )
+
+    parser.add_argument(
+        "--compression",
+        type=str,
+        help="Compress the statistics with gzip, gzip-<level> or lzf.",
+        default=None,
+    )
+
+    args = parser.parse_args()
+
+    comm = MPI.COMM_WORLD
+    rank = comm.Get_rank()
+    nprocs = comm.Get_size()
+
+    # the empty range check is broadcast, so that all the ranks raise
+    if rank == 0:
+        with open_hdf5(args.input, "r") as f:
+            t = f["t"][()]
+            locs = f["locs"][()] if "locs" in f else None
+        steps = time_slice(t, args.time_range)
+        if steps.stop > steps.start:
+            timespan = (t[steps.start], t[steps.stop - 1])
+            print(f"Computing the moments over the time span {timespan}")
+    else:
+        steps = None
+    steps = comm.bcast(steps, root=0)
+    if steps.stop <= steps.start:
+        raise ValueError("No data in the time range.")
+
+    # Each rank reduces its own time range in a single pass, the
+    # partial moments are then merged pairwise in one reduction
+    nt = steps.stop - steps.start
+    [chunks, offsets] = chunks_and_offsets(min(nprocs, nt), nt)
+    if rank < chunks.size:
+        start = steps.start + offsets[rank]
+        stop = start + chunks[rank]
+    else:
+        start = stop = steps.start
+
+    partial = range_moments(
+        args.input, start, stop, args.fields, args.budget * 2**20
+    )
+    result = comm.reduce(partial, op=merge_moments, root=0)
+
+    if rank == 0:
+        result.save(args.output, locs, timespan, args.compression)
+        print(f"Done, {result.n} samples of {result.nfields} fields")
+
+
+if __name__ == "__main__":
+    main()
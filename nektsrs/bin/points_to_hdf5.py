@@ -1,10 +1,10 @@
 import numpy as np
 from mpi4py import MPI
 import h5py
-import glob
-from os.path import join
-from nektsrs.io import TimeSeries
+import os
+from nektsrs.io import TimeSeries, Manifest, dataset_options, parse_layout
 from nektsrs.chunks import chunks_and_offsets
+from nektsrs.io.file_combiner import trim_ranges
 import argparse
 
 
@@ -25,6 +25,36 @@ def main():
         "--output", type=str, help="The output hdf5 file.", required=True
     )
 
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="Append the snapshots after the last time in the output.",
+    )
+
+    parser.add_argument(
+        "--layout",
+        type=str,
+        help="The chunk layout of the data: time-major, point-major, \
+              contiguous, or an explicit chunk shape, e.g. 16,4,1024.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--compression",
+        type=str,
+        help="Compress the data with gzip, gzip-<level> or lzf. \
+              Requires an HDF5 build supporting parallel filters.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--dtype",
+        type=str,
+        choices=["float32", "float64"],
+        help="The dtype of the output, by default that of the files.",
+        default=None,
+    )
+
     args = parser.parse_args()
     basename = args.basename
     output_file = args.output
@@ -33,77 +63,143 @@ def main():
     rank = comm.Get_rank()
     nprocs = comm.Get_size()
 
-    search_string = join("pts" + basename + "[0-1].f[0-9][0-9][0-9][0-9][0-9]")
-    datafiles = glob.glob(search_string)
-
+    # Rank 0 refreshes the manifest, the others reuse its file list,
+    # which is sorted by write time. Its errors are broadcast as well,
+    # so that all the ranks raise instead of waiting for the file list
+    append = args.append and os.path.exists(output_file)
+    t_last = -np.inf
+    error = None
+    datafiles = None
     if rank == 0:
-        print(f"Found {len(datafiles)} datafiles")
+        manifest = Manifest(basename)
+        try:
+            manifest.refresh()
+        except FileExistsError as e:
+            error = str(e)
+        else:
+            if manifest.truncated:
+                error = f"Truncated files: {manifest.truncated}"
+            datafiles = manifest.datafiles
+
+        # only read the files with snapshots after the stored ones
+        if append and error is None:
+            with h5py.File(output_file, "r") as f:
+                resizable = f["t"].maxshape[0] is None
+                if f["t"].size > 0:
+                    t_last = f["t"][-1]
+            if not resizable:
+                error = f"Cannot append to {output_file}!"
+            else:
+                datafiles = [
+                    i
+                    for i, t in zip(datafiles, manifest.times)
+                    if t.size > 0 and t[-1] > t_last
+                ]
+                print(f"Appending {len(datafiles)} files after time {t_last}")
+    error, datafiles, t_last = comm.bcast((error, datafiles, t_last), root=0)
+    if error is not None:
+        raise ValueError(error)
 
     if len(datafiles) == 0:
-        raise FileExistsError(f"Rank {rank} could not find any data!")
+        if rank == 0:
+            print("No new data")
+        return
 
-    [chunks, offsets] = chunks_and_offsets(nprocs, len(datafiles))
+    # With fewer files than ranks, e.g. when appending, the extra
+    # ranks read nothing, but still take part in the collective calls
+    nreaders = min(nprocs, len(datafiles))
+    [chunks, offsets] = chunks_and_offsets(nreaders, len(datafiles))
+    nfiles = chunks[rank] if rank < nreaders else 0
 
     if rank == 0:
         print("Reading...")
     datasets = []
-    for i in range(chunks[rank]):
+    for i in range(nfiles):
         position = offsets[rank] + i
-        datasets.append(TimeSeries.read(datafiles[position]))
+        datasets.append(TimeSeries.read(datafiles[position], dtype=args.dtype))
         datasets[i].collate_data()
 
-    print(rank, chunks[rank])
+    print(rank, nfiles)
     # print("length", rank, len(datasets))
 
-    writetimes = [i.writetime for i in datasets]
-    # print("Datasets written at the following timesteps were found")
-    # print(writetimes)
-
     datasets.sort(key=lambda item: item.writetime)
-    writetimes.sort()
-
-    data = np.vstack([i.data for i in datasets])
-    t = np.concatenate([i.t for i in datasets])
-
-    f = h5py.File(output_file, "w", driver="mpio", comm=comm)
 
-    times = comm.gather(t[0], root=0)
-    lengths = np.array(comm.gather(t.size, root=0))
+    # rank 0 always reads a file, its empty slices stand in for the
+    # data of the idle ranks
+    locs, t_empty, data_empty = comm.bcast(
+        (
+            (datasets[0].locs, datasets[0].t[:0], datasets[0].data[:0])
+            if rank == 0
+            else None
+        ),
+        root=0,
+    )
 
-    if rank == 0:
-        starts = np.zeros(nprocs, dtype=np.int64)
+    # The files of the ranks follow each other in time, so each rank
+    # drops the snapshots up to the last one of the previous ranks, or
+    # the last one already in the output
+    t_max = max([i.t[-1] for i in datasets if i.nt > 0], default=-np.inf)
+    t_prev = comm.exscan(t_max, op=MPI.MAX)
+    t_prev = t_last if rank == 0 else max(t_prev, t_last)
+
+    # kill overlap values
+    ranges = trim_ranges([i.t for i in datasets], t_prev)
+    if datasets:
+        data = np.concatenate(
+            [i.data[start:end] for i, (start, end) in zip(datasets, ranges)]
+        )
+        t = np.concatenate(
+            [i.t[start:end] for i, (start, end) in zip(datasets, ranges)]
+        )
     else:
-        starts = np.empty(nprocs, dtype=np.int64)
+        data = data_empty
+        t = t_empty
+    del datasets
+
+    # the widest word size of all the files, if they differ
+    dtype = np.dtype(f"f{comm.allreduce(data.dtype.itemsize, op=MPI.MAX)}")
 
     if rank == 0:
         print("Computing starting indices in global array")
-        starts = np.zeros(nprocs, dtype=np.int64)
-        sort_ind = np.argsort(times)
-
-        #    print("times", times)
-        #    print("lengths", lengths)
+    start = comm.exscan(t.size)
+    start = 0 if rank == 0 else start
+    nt = comm.allreduce(t.size)
 
-        for i in range(starts.size):
-            pos = np.where(sort_ind == i)[0][0]
-            starts[i] = np.sum(lengths[:pos])
-
-    if rank == 0:
-        nt = np.array([np.sum(lengths)], dtype="i")
+    f = h5py.File(
+        output_file, "a" if append else "w", driver="mpio", comm=comm
+    )
+    if append:
+        if not np.array_equal(f["locs"][()], locs):
+            raise ValueError(f"The points do not match those in {output_file}")
     else:
-        nt = np.empty(1, dtype="i")
-    comm.Bcast(nt, root=0)
-
-    comm.Bcast(starts, root=0)
+        f.create_dataset("locs", data=locs)
+        f.create_dataset("t", (0,), dtype=t.dtype, maxshape=(None,))
+        f.create_dataset(
+            "data",
+            (0, data.shape[1], data.shape[2]),
+            dtype=dtype,
+            **dataset_options(
+                (nt, data.shape[1], data.shape[2]),
+                dtype,
+                parse_layout(args.layout),
+                args.compression,
+                resizable=True,
+            ),
+        )
 
     if rank == 0:
         print("Writing data")
-    f_time = f.create_dataset("t", (nt))
-    f_data = f.create_dataset("data", (nt, data.shape[1], data.shape[2]))
+    f_time = f["t"]
+    f_data = f["data"]
+    nt_old = f_time.shape[0]
+    f_time.resize(nt_old + nt, axis=0)
+    f_data.resize(nt_old + nt, axis=0)
+    start += nt_old
 
-    print(rank, starts[rank], starts[rank] + t.size, t.size, nt, data.shape)
+    print(rank, start, start + t.size, t.size, nt, data.shape)
 
-    f_time[starts[rank] : starts[rank] + t.size] = t
-    f_data[starts[rank] : starts[rank] + t.size] = data
+    f_time[start : start + t.size] = t
+    f_data[start : start + t.size] = data
 
     comm.Barrier()
     f.close()
@@ -112,18 +208,5 @@ def main():
         print("Done")
 
 
-# self.timespan = np.array([self.t[0], self.t[-1]])
-# self.nfields = self.data.shape[1]
-# self.npoints = self.data.shape[2]
-# self.ldim = datasets[0].ldim
-# self.locs = datasets[0].locs
-
-# kill overlap values
-# _, idx = np.unique(self.t, return_index=True)
-# self.data = self.data[idx, ...]
-# self.t = self.t[idx]
-# self.nt = self.t.size
-
-
 if __name__ == "__main__":
     main()
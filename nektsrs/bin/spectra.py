@@ -0,0 +1,111 @@
+from mpi4py import MPI
+import h5py
+from nektsrs.statistics import space_time_spectrum, welch
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="A utility computing Welch frequency spectra of the \
+                     fields at each point of an hdf5 time series, or \
+                     wavenumber-frequency spectra of interpolated planes."
+    )
+
+    parser.add_argument(
+        "--input", type=str, help="The input hdf5 file.", required=True
+    )
+
+    parser.add_argument(
+        "--output", type=str, help="The output hdf5 file.", required=True
+    )
+
+    parser.add_argument(
+        "--nperseg",
+        type=int,
+        help="The # of time steps per segment.",
+        required=True,
+    )
+
+    parser.add_argument(
+        "--noverlap",
+        type=int,
+        help="The # of time steps shared by two segments, by default \
+              half of a segment.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--fields",
+        type=int,
+        nargs="+",
+        help="The indices of the fields to include, by default all.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--time-range",
+        type=float,
+        nargs=2,
+        help="The start and end time of the snapshots to include.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--window",
+        type=str,
+        help="The window applied to the segments.",
+        default="hann",
+    )
+
+    parser.add_argument(
+        "--axis",
+        type=int,
+        help="Compute wavenumber-frequency spectra along this periodic \
+              axis of the planes, 0 for x and 1 for z. Requires --dx.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--dx",
+        type=float,
+        help="The spacing of the points along --axis.",
+        default=None,
+    )
+
+    args = parser.parse_args()
+
+    comm = MPI.COMM_WORLD
+    rank = comm.Get_rank()
+
+    options = dict(
+        noverlap=args.noverlap,
+        fields=args.fields,
+        time_range=args.time_range,
+        window=args.window,
+        comm=comm,
+    )
+
+    # The segments are split between the ranks, all of them get the
+    # summed spectra
+    if args.axis is None:
+        f, psd = welch(args.input, args.nperseg, **options)
+        results = {"f": f, "psd": psd}
+    else:
+        if args.dx is None:
+            parser.error("--axis requires --dx")
+        omega, k, spectrum = space_time_spectrum(
+            args.input, args.nperseg, args.axis, args.dx, **options
+        )
+        results = {"omega": omega, "k": k, "spectrum": spectrum}
+
+    if rank == 0:
+        with h5py.File(args.output, "w") as out:
+            for name, value in results.items():
+                out.create_dataset(name, data=value)
+            out.attrs["nperseg"] = args.nperseg
+            out.attrs["window"] = args.window
+        print("Done")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import numpy as np
+from typing import Union
+from nektsrs.grid import Grid1D, Grid2D, Grid3D, flat_data, grid_data
+from nektsrs.reference import reference_element
+from nektsrs.interpolator.interpolator1d import float_dtype
+
+__all__ = ["derivative", "gradient"]
+
+
+def derivative(grid: Grid1D, data: np.ndarray, axis: int = -1) -> np.ndarray:
+    """Spectral derivative of data on the gll points of a Grid1D.
+
+    The elements are gathered into a contiguous (nlines * n, lx)
+    block, so the GLL differentiation matrix is applied to all the
+    elements, and all the other axes of the data, in one matrix
+    product. Each element is scaled by its Jacobian and the values at
+    the nodes shared by two elements are averaged.
+
+    Parameters
+    ----------
+        grid: Grid1D
+            The grid of the data along the axis.
+
+        data: nd.array
+            The data, with grid.gll.size values along the axis.
+
+        axis: int
+            The axis to differentiate along.
+
+    Returns an array of the same shape as the data.
+    """
+    data = np.moveaxis(np.asarray(data), axis, -1)
+    dtype = float_dtype(data)
+    lx = grid.lx
+    npoly = lx - 1
+
+    dmat = reference_element(lx).diff_matrix.astype(dtype)
+    jacobian = (2 / np.diff(grid.edges)).astype(dtype)
+
+    elements = np.ascontiguousarray(grid.element_view(data), dtype=dtype)
+    elements = (elements.reshape((-1, lx)) @ dmat.T).reshape(elements.shape)
+    elements *= jacobian[:, np.newaxis]
+
+    # every element contributes its first lx - 1 nodes, and its last
+    # node is the first node of the next one
+    values = np.empty(data.shape, dtype=dtype)
+    values[..., :-1] = elements[..., :-1].reshape(data.shape[:-1] + (-1,))
+    values[..., -1] = 0
+    values[..., npoly::npoly] += elements[..., -1]
+    values[..., npoly:-1:npoly] /= 2
+
+    return np.moveaxis(values, -1, axis)
+
+
+def gradient(
+    grid: Union[Grid1D, Grid2D, Grid3D],
+    data: np.ndarray,
+    axis: int = None,
+) -> Union[np.ndarray, tuple]:
+    """Spectral derivatives of data on the gll points of a grid.
+
+    The derivative along each direction of the grid is a 1D
+    derivative() along the lines of gll points in that direction.
+
+    Parameters
+    ----------
+        grid: Grid1D, Grid2D or Grid3D
+            The grid of the data.
+
+        data: nd.array of shape (..., gll1.size, gll2.size, ...)
+            The data, the leading dimensions can be, e.g., time and
+            fields. The grid dimensions can also be flattened into
+            the last axis, in the order of grid.gll, see grid_data().
+
+        axis: int
+            The direction of the derivative, 0 for the first direction
+            of the grid and so on. If None, all the derivatives are
+            returned as a tuple.
+
+    Returns arrays of the same shape as the data.
+    """
+    grids = grid.grids
+    shape = grid.shape
+    ndim = len(grids)
+
+    data = np.asarray(data)
+    flat = data.shape[-ndim:] != shape
+    data = grid_data(grid, data)
+
+    if axis is None:
+        axes = range(ndim)
+    elif -ndim <= axis < ndim:
+        axes = [axis % ndim]
+    else:
+        raise ValueError(f"Axis {axis} is out of bounds.")
+
+    values = []
+    for i in axes:
+        d = derivative(grids[i], data, axis=i - ndim)
+        if flat:
+            d = flat_data(grid, d)
+        values.append(d)
+
+    return values[0] if axis is not None else tuple(values)
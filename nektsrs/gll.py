@@ -18,8 +18,7 @@ def gll(n):
         return np.array([-1, 1]), np.array([1, 1])
 
     x, w = roots_jacobi(n - 2, 1, 1)
-    for i in range(x.size):
-        w[i] /= 1 - x[i] ** 2
+    w /= 1 - x**2
 
     x = np.append(-1, np.append(x, 1))
     w = np.append(2 / (n * (n - 1)), np.append(w, 2 / (n * (n - 1))))
@@ -1,6 +1,10 @@
 from .grid1d import *
 from .grid2d import *
+from .grid3d import *
+from .helpers import *
 
-__all__ = ["grid1d", "grid2d"]
+__all__ = ["grid1d", "grid2d", "grid3d", "helpers"]
 __all__.extend(grid1d.__all__)
 __all__.extend(grid2d.__all__)
+__all__.extend(grid3d.__all__)
+__all__.extend(helpers.__all__)
@@ -1,8 +1,12 @@
 import numpy as np
-from nektsrs.gll import gll as gll_points
+from numpy.lib.stride_tricks import as_strided
+from nektsrs.reference import reference_element
 
 __all__ = ["SimpleGrid1D", "Grid1D"]
 
+# upper bound on the size of the element lookup table of stretched grids
+MAX_TABLE_SIZE = 2**20
+
 
 class Grid1D:
     def __init__(self, edges: np.ndarray, lx: int) -> None:
@@ -13,17 +17,131 @@ class Grid1D:
         self.lx = lx
         self.edges = edges
 
-        points, _ = gll_points(lx)
+        points = reference_element(lx).nodes
 
-        gll = np.zeros((self.n, lx))
-        for i in range(self.n):
-            e_start = self.edges[i]
-            e_end = self.edges[i + 1]
-            gll[i, :] = (points + 1) * (e_end - e_start) / 2 + e_start
+        e_start = self.edges[:-1, np.newaxis]
+        e_end = self.edges[1:, np.newaxis]
+        gll = (points + 1) * (e_end - e_start) / 2 + e_start
 
         gll = np.unique(gll.flatten())
         self.gll = gll
 
+        # Element lookup. On a uniform grid the element index follows
+        # directly from the coordinate, otherwise a table maps uniform
+        # bins, not larger than the smallest element, to the element
+        # at the start of each bin.
+        widths = np.diff(self.edges)
+        self.uniform = np.allclose(widths, widths[0], rtol=1e-12, atol=0)
+        if self.uniform:
+            nbins = self.n
+        else:
+            nbins = int(np.ceil((self.end - self.start) / np.min(widths)))
+            nbins = min(max(nbins, self.n), MAX_TABLE_SIZE)
+        self.bin_width = (self.end - self.start) / nbins
+        bins = self.start + self.bin_width * np.arange(nbins)
+        self.table = np.clip(
+            np.searchsorted(self.edges, bins, side="right") - 1, 0, self.n - 1
+        )
+
+    @property
+    def grids(self):
+        """The 1D grids along each direction, just this one."""
+        return (self,)
+
+    @property
+    def shape(self):
+        """The number of gll points along each direction."""
+        return (self.gll.size,)
+
+    def quadrature_weights(self) -> np.ndarray:
+        """GLL quadrature weights of the gll points of the grid.
+
+        The weights of each element are scaled by its Jacobian and
+        summed at the nodes shared by two elements, so that the
+        weights sum to the length of the grid.
+        """
+        weights = reference_element(self.lx).weights
+        elements = np.diff(self.edges)[:, np.newaxis] / 2 * weights
+
+        npoly = self.lx - 1
+        result = np.zeros(self.gll.size)
+        result[:-1] = elements[:, :-1].ravel()
+        result[npoly::npoly] += elements[:, -1]
+        return result
+
+    def locate(self, points: np.ndarray) -> (np.ndarray, np.ndarray):
+        """Find the elements of points and their reference coordinates.
+
+        The element of a point is found as floor((x - start) / h),
+        with h the element width on a uniform grid and the bin width
+        of the lookup table otherwise. Since a bin is not larger than
+        the smallest element, it overlaps at most two elements, and a
+        single local correction step against the edges is typically
+        all that is needed. The correction also takes care of round-off
+        at the element edges.
+
+        A point on an edge shared by two elements is assigned to the
+        element on its right, except the end of the grid, which is
+        assigned to the last element.
+
+        Parameters
+        ----------
+            points: 1d nd.array
+                The points to locate.
+
+        Returns the element indices and the coordinates in the
+        reference element [-1, 1], both of the same shape as points.
+        """
+        points = np.asarray(points, dtype=np.float64)
+
+        if np.any(points < self.start) or np.any(points > self.end):
+            raise ValueError("Point out of bounds of the mesh.")
+
+        bins = np.floor((points - self.start) / self.bin_width)
+        bins = np.clip(bins, 0, self.table.size - 1).astype(np.intp)
+        element_ind = self.table[bins]
+
+        while True:
+            down = points < self.edges[element_ind]
+            up = (points >= self.edges[element_ind + 1]) & (
+                element_ind < self.n - 1
+            )
+            if not (np.any(down) or np.any(up)):
+                break
+            element_ind = element_ind - down + up
+
+        left = self.edges[element_ind]
+        right = self.edges[element_ind + 1]
+        ref_p = np.clip((points - left) / (right - left) * 2 - 1, -1, 1)
+        return element_ind, ref_p
+
+    def element_view(self, data: np.ndarray) -> np.ndarray:
+        """View data on the gll points as an (..., n, lx) array.
+
+        Consecutive elements share their boundary node, so the view
+        is built with stride tricks and does not copy the data. It is
+        read-only, since writing to a shared node through one element
+        would change the other as well.
+
+        Parameters
+        ----------
+            data: nd.array of shape (..., self.gll.size)
+                The data, the leading dimensions can be, e.g., time and
+                fields.
+
+        """
+        data = np.asarray(data)
+        if data.shape[-1] != self.gll.size:
+            raise ValueError("Data is of incorrect size!")
+
+        stride = data.strides[-1]
+        return as_strided(
+            data,
+            shape=data.shape[:-1] + (self.n, self.lx),
+            strides=data.strides[:-1] + ((self.lx - 1) * stride, stride),
+            writeable=False,
+        )
+
     def element_edges(self, i: int):
         """Get the edges of a particular element."""
         if i < 0 or i > self.n - 1:
@@ -1,4 +1,5 @@
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
 from nektsrs.grid import Grid1D
 
 __all__ = ["SimpleGrid2D", "Grid2D"]
@@ -21,12 +22,82 @@ class Grid2D:
         g1 = Grid1D(edges1, lx)
         g2 = Grid1D(edges2, lx)
 
+        self.grid1 = g1
+        self.grid2 = g2
         self.gll1 = g1.gll
         self.gll2 = g2.gll
 
         gllx, glly = np.meshgrid(g1.gll, g2.gll)
         self.gll = np.stack((gllx.flatten(), glly.flatten()), axis=1)
 
+    @property
+    def grids(self):
+        """The 1D grids along each direction."""
+        return (self.grid1, self.grid2)
+
+    @property
+    def shape(self):
+        """The number of gll points along each direction."""
+        return (self.gll1.size, self.gll2.size)
+
+    def quadrature_weights(self) -> np.ndarray:
+        """GLL quadrature weights of the gll points of the grid.
+
+        An (gll1.size, gll2.size) array, the tensor product of the
+        weights along each direction.
+        """
+        return np.outer(
+            self.grid1.quadrature_weights(), self.grid2.quadrature_weights()
+        )
+
+    def locate(self, points: np.ndarray) -> (np.ndarray, np.ndarray):
+        """Find the elements of points and their reference coordinates.
+
+        Each direction is located independently with Grid1D.locate(),
+        so the same conventions for the element edges apply.
+
+        Parameters
+        ----------
+            points: nd.array of shape (npoints, 2)
+                The points to locate.
+
+        Returns the element indices and the coordinates in the
+        reference element, both as (npoints, 2) arrays.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        ind1, ref1 = self.grid1.locate(points[:, 0])
+        ind2, ref2 = self.grid2.locate(points[:, 1])
+        return np.stack((ind1, ind2), axis=1), np.stack((ref1, ref2), axis=1)
+
+    def element_view(self, data: np.ndarray) -> np.ndarray:
+        """View data on the gll points as (..., n1, n2, lx, lx).
+
+        Neighbouring elements share their boundary nodes, so the view
+        is built with stride tricks and does not copy the data. It is
+        read-only, since writing to a shared node through one element
+        would change the other as well.
+
+        Parameters
+        ----------
+            data: nd.array of shape (..., gll1.size, gll2.size)
+                The data, the leading dimensions can be, e.g., time and
+                fields.
+
+        """
+        data = np.asarray(data)
+        if data.shape[-2:] != (self.gll1.size, self.gll2.size):
+            raise ValueError("Data is of incorrect size!")
+
+        stride1, stride2 = data.strides[-2:]
+        npoly = self.lx - 1
+        return as_strided(
+            data,
+            shape=data.shape[:-2] + (self.n1, self.n2, self.lx, self.lx),
+            strides=data.strides[:-2]
+            + (npoly * stride1, npoly * stride2, stride1, stride2),
+            writeable=False,
+        )
+
     def element_edges(self, i: int, j: int):
         """Get the edges of a particular element."""
         if i < 0 or i > self.n1 - 1 or j < 0 or j > self.n2 - 1:
@@ -0,0 +1,208 @@
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from nektsrs.grid import Grid1D
+
+__all__ = ["SimpleGrid3D", "Grid3D"]
+
+
+class Grid3D:
+    """A tensor product grid of spectral elements in 3D.
+
+    Unlike Grid2D, which builds its gll points with an xy-indexed
+    meshgrid, the flattened gll points of a Grid3D are in C order: the
+    index along the third direction varies the fastest. This is also
+    the order of data with the grid dimensions flattened into the last
+    axis, see grid_data().
+
+    Parameters
+    ----------
+        edges1, edges2, edges3: 1d nd.array
+            The edges of the elements along each direction.
+
+        lx: int
+            The number of gll points along an edge of an element.
+
+    """
+
+    def __init__(
+        self,
+        edges1: np.ndarray,
+        edges2: np.ndarray,
+        edges3: np.ndarray,
+        lx: int,
+    ) -> None:
+        self.start1 = edges1[0]
+        self.start2 = edges2[0]
+        self.start3 = edges3[0]
+        self.end1 = edges1[-1]
+        self.end2 = edges2[-1]
+        self.end3 = edges3[-1]
+        self.n1 = edges1.size - 1
+        self.n2 = edges2.size - 1
+        self.n3 = edges3.size - 1
+        self.lx = lx
+        self.edges1 = edges1
+        self.edges2 = edges2
+        self.edges3 = edges3
+
+        g1 = Grid1D(edges1, lx)
+        g2 = Grid1D(edges2, lx)
+        g3 = Grid1D(edges3, lx)
+
+        self.grid1 = g1
+        self.grid2 = g2
+        self.grid3 = g3
+        self.gll1 = g1.gll
+        self.gll2 = g2.gll
+        self.gll3 = g3.gll
+
+    @property
+    def gll(self):
+        """All the gll points as an (npoints, 3) array, in C order.
+
+        Built on demand, since for large boxes it is much bigger than
+        the gll points along each axis.
+        """
+        gllx, glly, gllz = np.meshgrid(
+            self.gll1, self.gll2, self.gll3, indexing="ij"
+        )
+        return np.stack((gllx.ravel(), glly.ravel(), gllz.ravel()), axis=1)
+
+    @property
+    def grids(self):
+        """The 1D grids along each direction."""
+        return (self.grid1, self.grid2, self.grid3)
+
+    @property
+    def shape(self):
+        """The number of gll points along each direction."""
+        return (self.gll1.size, self.gll2.size, self.gll3.size)
+
+    def quadrature_weights(self) -> np.ndarray:
+        """GLL quadrature weights of the gll points of the grid.
+
+        The tensor product of the weights along each direction.
+        """
+        w1, w2, w3 = (g.quadrature_weights() for g in self.grids)
+        return w1[:, np.newaxis, np.newaxis] * np.outer(w2, w3)
+
+    def locate(self, points: np.ndarray) -> (np.ndarray, np.ndarray):
+        """Find the elements of points and their reference coordinates.
+
+        Each direction is located independently with Grid1D.locate(),
+        so the same conventions for the element edges apply.
+
+        Parameters
+        ----------
+            points: nd.array of shape (npoints, 3)
+                The points to locate.
+
+        Returns the element indices and the coordinates in the
+        reference element, both as (npoints, 3) arrays.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        ind1, ref1 = self.grid1.locate(points[:, 0])
+        ind2, ref2 = self.grid2.locate(points[:, 1])
+        ind3, ref3 = self.grid3.locate(points[:, 2])
+        return (
+            np.stack((ind1, ind2, ind3), axis=1),
+            np.stack((ref1, ref2, ref3), axis=1),
+        )
+
+    def element_view(self, data: np.ndarray) -> np.ndarray:
+        """View data on the gll points as (..., n1, n2, n3, lx, lx, lx).
+
+        Neighbouring elements share their boundary nodes, so the view
+        is built with stride tricks and does not copy the data. It is
+        read-only, since writing to a shared node through one element
+        would change the other as well.
+
+        Parameters
+        ----------
+            data: nd.array
+                The data, of shape (..., gll1.size, gll2.size,
+                gll3.size). The leading dimensions can be, e.g., time
+                and fields.
+
+        """
+        data = np.asarray(data)
+        if data.shape[-3:] != (self.gll1.size, self.gll2.size, self.gll3.size):
+            raise ValueError("Data is of incorrect size!")
+
+        strides = data.strides[-3:]
+        npoly = self.lx - 1
+        return as_strided(
+            data,
+            shape=data.shape[:-3]
+            + (self.n1, self.n2, self.n3)
+            + 3 * (self.lx,),
+            strides=data.strides[:-3]
+            + tuple(npoly * s for s in strides)
+            + strides,
+            writeable=False,
+        )
+
+    def check_element(self, i: int, j: int, k: int) -> None:
+        """Raise a ValueError if the element index is out of bounds."""
+        for ind, n in zip((i, j, k), (self.n1, self.n2, self.n3)):
+            if ind < 0 or ind > n - 1:
+                raise ValueError(
+                    f"Element index {i}, {j}, {k} is out of bounds."
+                )
+
+    def element_edges(self, i: int, j: int, k: int):
+        """Get the edges of a particular element."""
+        self.check_element(i, j, k)
+
+        return (
+            self.edges1[i],
+            self.edges1[i + 1],
+            self.edges2[j],
+            self.edges2[j + 1],
+            self.edges3[k],
+            self.edges3[k + 1],
+        )
+
+    def element_gll_indices(self, i: int, j: int, k: int):
+        """Get the indces of the gll point of a particular element."""
+        self.check_element(i, j, k)
+
+        npoly = self.lx - 1
+        return (
+            i * npoly,
+            i * npoly + self.lx,
+            j * npoly,
+            j * npoly + self.lx,
+            k * npoly,
+            k * npoly + self.lx,
+        )
+
+    def element_gll_points(self, i: int, j: int, k: int):
+        """Get gll point of a particular element by its index."""
+        ind = self.element_gll_indices(i, j, k)
+        return (
+            self.gll1[ind[0] : ind[1]],
+            self.gll2[ind[2] : ind[3]],
+            self.gll3[ind[4] : ind[5]],
+        )
+
+
+class SimpleGrid3D(Grid3D):
+    def __init__(
+        self,
+        start1: float,
+        end1: float,
+        start2: float,
+        end2: float,
+        start3: float,
+        end3: float,
+        n1: int,
+        n2: int,
+        n3: int,
+        lx: int,
+    ) -> None:
+
+        edges1 = np.linspace(start1, end1, n1 + 1)
+        edges2 = np.linspace(start2, end2, n2 + 1)
+        edges3 = np.linspace(start3, end3, n3 + 1)
+        Grid3D.__init__(self, edges1, edges2, edges3, lx)
@@ -0,0 +1,39 @@
+import numpy as np
+from nektsrs.grid.grid2d import Grid2D
+
+__all__ = ["grid_data", "flat_data"]
+
+
+def grid_data(grid, data: np.ndarray) -> np.ndarray:
+    """Reshape data with flattened points to the shape of the grid.
+
+    The grid dimensions of the data can be given as they are, or
+    flattened into the last axis in the order of the gll points of the
+    grid. For a Grid2D that is the order of an xy-indexed meshgrid, so
+    the first direction varies the fastest, as in the pts files. For a
+    Grid3D it is C order. Works with any grid with a shape, i.e. the
+    number of gll points along each direction.
+    """
+    data = np.asarray(data)
+    shape = tuple(grid.shape)
+    if data.shape[-len(shape) :] == shape:
+        return data
+    elif data.shape[-1] != np.prod(shape):
+        raise ValueError("Data is of incorrect size!")
+
+    if isinstance(grid, Grid2D):
+        data = data.reshape(data.shape[:-1] + shape[::-1])
+        return np.swapaxes(data, -1, -2)
+    return data.reshape(data.shape[:-1] + shape)
+
+
+def flat_data(grid, data: np.ndarray) -> np.ndarray:
+    """Flatten the grid dimensions of data in the gll point order.
+
+    The inverse of grid_data().
+    """
+    data = grid_data(grid, data)
+    ndim = len(grid.shape)
+    if isinstance(grid, Grid2D):
+        data = np.swapaxes(data, -1, -2)
+    return data.reshape(data.shape[:-ndim] + (-1,))
@@ -1,6 +1,10 @@
 from .interpolator1d import *
 from .interpolator2d import *
+from .interpolator3d import *
+from .cache import *
 
-__all__ = ["interpolator1d", "interpolator2d"]
+__all__ = ["interpolator1d", "interpolator2d", "interpolator3d", "cache"]
 __all__.extend(interpolator1d.__all__)
 __all__.extend(interpolator2d.__all__)
+__all__.extend(interpolator3d.__all__)
+__all__.extend(cache.__all__)
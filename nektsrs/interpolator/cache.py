@@ -0,0 +1,149 @@
+import hashlib
+import os
+import numpy as np
+from os.path import exists, join
+from scipy.sparse import csr_matrix
+
+__all__ = ["OperatorCache"]
+
+# part of the keys, to be bumped when the layout of the operators
+# changes, e.g. the order of the gll points of Interpolator2D in v2
+CACHE_VERSION = 2
+
+
+class OperatorCache:
+    """A disk cache of interpolation operators.
+
+    The weights and gll indices of the operator() of an interpolator
+    are stored as .npy files, keyed by a hash of the grid edges, lx
+    and the target points. Cached operators are memory-mapped, so
+    several processes on a node share one copy in the page cache.
+
+    When the total size of the cache exceeds max_bytes, the least
+    recently used operators are removed.
+
+    Parameters
+    ----------
+        directory: str
+            The directory of the cache, created if needed.
+        max_bytes: int
+            The maximum total size of the cache.
+
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2**34) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(interpolator, points: np.ndarray) -> str:
+        """Hash of the grid, lx and target points of an operator."""
+        h = hashlib.sha256()
+        h.update(f"v{CACHE_VERSION}".encode())
+        h.update(type(interpolator).__name__.encode())
+        h.update(str(interpolator.lx).encode())
+        for name in ["edges", "edges1", "edges2", "edges3"]:
+            if hasattr(interpolator, name):
+                edges = getattr(interpolator, name)
+                h.update(np.ascontiguousarray(edges, np.float64).data)
+        points = np.ascontiguousarray(points, np.float64)
+        h.update(str(points.shape).encode())
+        h.update(points.data)
+        return h.hexdigest()
+
+    def operator(self, interpolator, points: np.ndarray, comm=None):
+        """Get the operator of an interpolator, computing it if needed.
+
+        Parameters
+        ----------
+            interpolator: Interpolator1D or Interpolator2D
+                The interpolator.
+            points: nd.array
+                The points passed to interpolator.operator().
+            comm: MPI communicator
+                If given, only rank 0 computes a missing operator and
+                the others wait for it. The directory should then be
+                on a filesystem shared by the ranks.
+
+        """
+        key = self.key(interpolator, points)
+        rank = 0 if comm is None else comm.Get_rank()
+
+        if rank == 0 and not exists(self.path(key, "weights")):
+            self.store(key, interpolator.operator(points))
+        if comm is not None:
+            comm.Barrier()
+
+        return self.load(key, interpolator)
+
+    def path(self, key: str, name: str) -> str:
+        """The file of an array of a cached operator."""
+        return join(self.directory, f"{key}.{name}.npy")
+
+    def store(self, key: str, op: csr_matrix) -> None:
+        """Save an operator, then evict the old ones over the limit."""
+        nnz_row = op.indptr[1] - op.indptr[0] if op.shape[0] > 0 else 0
+        if np.any(np.diff(op.indptr) != nnz_row):
+            raise ValueError("The operator has a varying # of nonzeros.")
+
+        # int32 indices are used by scipy as they are, without copying
+        itype = np.int32 if max(op.nnz, op.shape[1]) < 2**31 else np.int64
+        arrays = [
+            ("indices", op.indices.astype(itype)),
+            ("weights", op.data),
+        ]
+
+        # the weights are written last and mark a complete entry
+        for name, array in arrays:
+            tmp = self.path(key, name) + f".{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, array.reshape((op.shape[0], nnz_row)))
+            os.replace(tmp, self.path(key, name))
+
+        self.evict(keep=key)
+
+    def load(self, key: str, interpolator) -> csr_matrix:
+        """Memory-map a stored operator."""
+        weights = np.load(self.path(key, "weights"), mmap_mode="r")
+        indices = np.load(self.path(key, "indices"), mmap_mode="r")
+
+        # mark as recently used
+        os.utime(self.path(key, "weights"))
+
+        npoints, nnz_row = weights.shape
+        indptr = np.arange(
+            0, npoints * nnz_row + 1, max(nnz_row, 1), dtype=indices.dtype
+        )
+        return csr_matrix(
+            (weights.reshape(-1), indices.reshape(-1), indptr[: npoints + 1]),
+            shape=(npoints, interpolator.gll.shape[0]),
+            copy=False,
+        )
+
+    def evict(self, keep: str = None) -> None:
+        """Remove the least recently used operators beyond max_bytes."""
+        entries = {}
+        for fname in os.listdir(self.directory):
+            if not fname.endswith(".weights.npy"):
+                continue
+            key = fname[: -len(".weights.npy")]
+            files = [self.path(key, "weights"), self.path(key, "indices")]
+            try:
+                size = sum(os.path.getsize(i) for i in files)
+                entries[key] = (os.path.getmtime(files[0]), size)
+            except OSError:
+                continue
+
+        total = sum(size for _, size in entries.values())
+        for key in sorted(entries, key=lambda item: entries[item][0]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            for name in ["weights", "indices"]:
+                try:
+                    os.remove(self.path(key, name))
+                except OSError:
+                    pass
+            total -= entries[key][1]
@@ -2,19 +2,54 @@ import numpy as np
 from scipy.interpolate import lagrange
 from nektsrs.grid import Grid1D, SimpleGrid1D
 from typing import Union, Dict
-from nektsrs.gll import gll
+from nektsrs.reference import reference_element
 from scipy.interpolate import BarycentricInterpolator
+from scipy.sparse import csr_matrix
 
 
 __all__ = ["Interpolator1D"]
 
 
+def float_dtype(data: np.ndarray) -> np.dtype:
+    """The dtype of the values interpolated from the data.
+
+    Floating point data keeps its precision, anything else is
+    interpolated in double precision.
+    """
+    if np.issubdtype(data.dtype, np.floating):
+        return data.dtype
+    return np.dtype(np.float64)
+
+
+def apply_operator(
+    op: csr_matrix, data: np.ndarray, axis: int = -1
+) -> np.ndarray:
+    """Apply a sparse operator along an axis of batched data.
+
+    The other axes of the data are flattened into the columns of a
+    single sparse-dense product. Floating point data keeps its dtype:
+    the operator is cast to it beforehand, so that single precision
+    data is not upcast by the product. Half precision, which sparse
+    products do not support, is computed in single precision.
+    """
+    data = np.moveaxis(np.asarray(data), axis, 0)
+    shape = data.shape
+    dtype = float_dtype(data)
+    op = op.astype(np.promote_types(dtype, np.float32), copy=False)
+    values = op @ data.reshape((shape[0], -1))
+    values = values.reshape((op.shape[0],) + shape[1:])
+    values = np.moveaxis(values, 0, axis)
+    return values.astype(dtype, copy=False)
+
+
 class Interpolator1D:
     def __init__(self, grid: Union[Grid1D, SimpleGrid1D]) -> None:
         self.grid = grid
-        self.ref_gll, _ = gll(grid.lx)
+        self.reference = reference_element(grid.lx)
+        self.ref_gll = self.reference.nodes
 
         self.interpolator = BarycentricInterpolator(xi=self.ref_gll)
+        self.bary_weights = self.reference.bary_weights
 
     @property
     def edges(self):
@@ -33,15 +68,16 @@ class Interpolator1D:
         return self.grid.n
 
     def data_element_stats(self, data: np.ndarray) -> (np.ndarray, np.ndarray):
-        """Data for normalizing the data within each element."""
-        means = np.zeros(self.nelems)
-        stds = np.zeros(self.nelems)
-        for i in range(self.nelems):
-            ind = self.grid.element_gll_indices(i)
-            means[i] = np.mean(data[ind[0] : ind[1]])
-            stdi = np.std(data[ind[0] : ind[1]])
-            # avoid division by 0 in normalization
-            stds[i] = stdi if stdi != 0 else 1.0
+        """Data for normalizing the data within each element.
+
+        Computed for all elements, and any leading batch dimensions of
+        the data, with single reductions over the element view.
+        """
+        elements = self.grid.element_view(data)
+        means = np.mean(elements, axis=-1, dtype=float_dtype(data))
+        stds = np.std(elements, axis=-1, dtype=float_dtype(data))
+        # avoid division by 0 in normalization
+        stds[stds == 0] = 1.0
         return means, stds
 
     def build_polys(
@@ -74,6 +110,77 @@ class Interpolator1D:
     ) -> np.ndarray:
         """Interpolate to new data points given data on the grid.
 
+        All the points are handled at once: the elements and reference
+        coordinates are found with the grid's locate(), and the
+        barycentric Lagrange weights of all the points form the sparse
+        operator(). The values for all the leading batch dimensions of
+        the data are then one sparse-dense product.
+
+        The weights sum to one, so unlike in interpolate_reference(),
+        the data needs no normalization within the elements.
+
+        Parameters
+        ----------
+            data: nd.array of shape (..., self.gll.size)
+                The data at the points of the given grid, the leading
+                dimensions can be, e.g., time and fields.
+
+            points: 1d nd.array
+                The points where we want the interpolated values.
+
+        Returns an array of shape (..., points.size).
+        """
+
+        if data.shape[-1] != self.gll.size:
+            raise ValueError("Data is of incorrect size!")
+
+        return apply_operator(self.operator(points), data)
+
+    def operator(self, points: Union[float, np.ndarray]) -> csr_matrix:
+        """The interpolation to the points as a sparse matrix.
+
+        The matrix has lx nonzeros per row and maps the data on the
+        grid to the values at the points, so that interpolating a
+        block of data with the shape (self.gll.size, n) is just
+        operator @ data.
+        """
+        gll_ind, weights = self.element_weights(points)
+        rows = np.repeat(np.arange(gll_ind.shape[0]), self.lx)
+        return csr_matrix(
+            (weights.ravel(), (rows, gll_ind.ravel())),
+            shape=(gll_ind.shape[0], self.gll.size),
+        )
+
+    def element_weights(
+        self, points: Union[float, np.ndarray]
+    ) -> (np.ndarray, np.ndarray):
+        """The gll indices and Lagrange weights for points.
+
+        Both are returned as (npoints, lx) arrays, the indices are
+        those of the gll points of the element of each point.
+        """
+        points = np.atleast_1d(np.asarray(points, dtype=np.float64))
+
+        try:
+            element_ind, ref_p = self.grid.locate(points)
+        except ValueError:
+            raise ValueError("Interpolation point out of bound of the mesh.")
+
+        weights = self.reference.interpolation_matrix(ref_p)
+        gll_ind = element_ind[:, np.newaxis] * (self.lx - 1) + np.arange(
+            self.lx
+        )
+        return gll_ind, weights
+
+    def interpolate_reference(
+        self, data: np.ndarray, points: Union[float, np.ndarray]
+    ) -> np.ndarray:
+        """Interpolate to new data points given data on the grid.
+
+        The original, point by point implementation, building a
+        Lagrange polynomial for each element. Kept as a reference for
+        interpolate().
+
         Parameters
         ----------
             data: 1d nd.array of size self.gll
@@ -90,7 +197,7 @@ class Interpolator1D:
 
         if type(points) is float:
             points = points * np.ones(1)
-        values = np.zeros(points.shape[0])
+        values = np.zeros(points.shape[0], dtype=float_dtype(data))
 
         if np.max(points) > np.max(self.gll) or np.min(points) < np.min(
             self.gll
@@ -137,7 +244,7 @@ class Interpolator1D:
 
         if type(points) is float:
             points = points * np.ones(1)
-        values = np.zeros(points.shape[0])
+        values = np.zeros(points.shape[0], dtype=float_dtype(data))
 
         if np.max(points) > np.max(self.gll) or np.min(points) < np.min(
             self.gll
@@ -154,9 +261,9 @@ class Interpolator1D:
         data_means, data_stds = self.data_element_stats(data)
 
         for i, eli in enumerate(element_ind):
-            edges = self.element_edges(eli)
+            edges = self.grid.element_edges(eli)
             ref_p = (points[i] - edges[0]) / (edges[1] - edges[0]) * 2 - 1
-            ind = self.element_gll_indices(eli)
+            ind = self.grid.element_gll_indices(eli)
             self.interpolator.set_yi(
                 (data[ind[0] : ind[1]] - data_means[eli]) / data_stds[eli],
             )
@@ -1,8 +1,14 @@
 import numpy as np
-from nektsrs.grid import Grid2D, SimpleGrid2D
+from nektsrs.grid import Grid2D, SimpleGrid2D, flat_data, grid_data
 from typing import Union
-from nektsrs.gll import gll
+from nektsrs.reference import reference_element
 from scipy.interpolate import BarycentricInterpolator
+from nektsrs.interpolator.interpolator1d import (
+    Interpolator1D,
+    apply_operator,
+    float_dtype,
+)
+from scipy.sparse import csr_matrix
 
 
 __all__ = ["Interpolator2D"]
@@ -11,9 +17,12 @@ __all__ = ["Interpolator2D"]
 class Interpolator2D:
     def __init__(self, grid: Union[Grid2D, SimpleGrid2D]) -> None:
         self.grid = grid
-        self.ref_gll, _ = gll(grid.lx)
+        self.reference = reference_element(grid.lx)
+        self.ref_gll = self.reference.nodes
 
         self.interpolator = BarycentricInterpolator(xi=self.ref_gll)
+        self.interpolator1 = Interpolator1D(grid.grid1)
+        self.interpolator2 = Interpolator1D(grid.grid2)
 
     @property
     def edges1(self):
@@ -48,21 +57,99 @@ class Interpolator2D:
         return self.grid.n2
 
     def data_element_stats(self, data: np.ndarray) -> (np.ndarray, np.ndarray):
-        """Data for normalizing the data within each element."""
-        means = np.zeros((self.nelems1, self.nelems2))
-        stds = np.zeros((self.nelems1, self.nelems2))
-        for i in range(self.nelems1):
-            for j in range(self.nelems2):
-                ind = self.grid.element_gll_indices(i, j)
-                means[i, j] = np.mean(data[ind[0] : ind[1], ind[2] : ind[3]])
-                stdi = np.std(data[ind[0] : ind[1], ind[2] : ind[3]])
-                # avoid division by 0 in normalization
-                stds[i, j] = stdi if stdi != 0 else 1.0
+        """Data for normalizing the data within each element.
+
+        Computed for all elements, and any leading batch dimensions of
+        the data, with single reductions over the element view.
+        """
+        elements = self.grid.element_view(grid_data(self.grid, data))
+        means = np.mean(elements, axis=(-2, -1), dtype=float_dtype(data))
+        stds = np.std(elements, axis=(-2, -1), dtype=float_dtype(data))
+        # avoid division by 0 in normalization
+        stds[stds == 0] = 1.0
         return means, stds
 
+    def operator(self, points: np.ndarray) -> csr_matrix:
+        """The interpolation to the points as a sparse matrix.
+
+        The matrix has lx**2 nonzeros per row and maps the data on the
+        grid, flattened in the order of self.grid.gll, to the values
+        at the points. So, interpolating a block of data with the
+        shape (self.gll1.size * self.gll2.size, n) is just
+        operator @ data.
+        """
+        points = np.atleast_2d(points)
+        npoints = points.shape[0]
+
+        ind1, weights1 = self.interpolator1.element_weights(points[:, 0])
+        ind2, weights2 = self.interpolator2.element_weights(points[:, 1])
+
+        # the first direction varies the fastest in the gll points
+        cols = ind1[:, :, np.newaxis] + ind2[:, np.newaxis] * self.gll1.size
+        weights = weights1[:, :, np.newaxis] * weights2[:, np.newaxis]
+        rows = np.repeat(np.arange(npoints), self.lx**2)
+        return csr_matrix(
+            (weights.ravel(), (rows, cols.ravel())),
+            shape=(npoints, self.gll1.size * self.gll2.size),
+        )
+
     def interpolate(self, data: np.ndarray, points: np.ndarray) -> np.ndarray:
         """Interpolate to new data points given data on the grid.
 
+        Vectorized over the points: the Lagrange weights along each
+        axis are combined into the sparse operator(), which is applied
+        to all the leading batch dimensions of the data in one
+        sparse-dense product.
+
+        Parameters
+        ----------
+            data: nd.array of shape (..., gll1.size, gll2.size)
+                The data at the points of the given grid, the leading
+                dimensions can be, e.g., time and fields. The grid
+                dimensions can also be flattened into the last axis, in
+                the order of the gll points, see grid_data().
+
+            points: 2d nd.array
+                The points where we want the interpolated values.
+
+        Returns an array of shape (..., npoints).
+        """
+        data = flat_data(self.grid, data)
+        return apply_operator(self.operator(points), data)
+
+    def interpolate_grid(
+        self, data: np.ndarray, points1: np.ndarray, points2: np.ndarray
+    ) -> np.ndarray:
+        """Interpolate to a tensor grid of points.
+
+        The interpolation splits into 1D operators along each axis,
+        so the values are op1 @ data @ op2.T, for all the leading
+        batch dimensions of the data.
+
+        Parameters
+        ----------
+            data: nd.array of shape (..., gll1.size, gll2.size)
+                The data at the points of the given grid.
+
+            points1, points2: 1d nd.array
+                The coordinates of the target grid along each axis.
+
+        Returns an array of shape (..., points1.size, points2.size).
+        """
+        data = grid_data(self.grid, data)
+        op1 = self.interpolator1.operator(points1)
+        op2 = self.interpolator2.operator(points2)
+
+        return apply_operator(op2, apply_operator(op1, data, -2), -1)
+
+    def interpolate_reference(
+        self, data: np.ndarray, points: np.ndarray
+    ) -> np.ndarray:
+        """Interpolate to new data points given data on the grid.
+
+        The original, point by point implementation. Kept as a
+        reference for interpolate().
+
         Parameters
         ----------
             data: 2d nd.array of size self.gll1 x self.gll2
@@ -108,7 +195,7 @@ class Interpolator2D:
                 element_ind2[i] = 0
 
         data_means, data_stds = self.data_element_stats(data)
-        values = np.zeros(points.shape[0])
+        values = np.zeros(points.shape[0], dtype=float_dtype(data))
 
         for i in range(points.shape[0]):
             eli = element_ind1[i]
@@ -0,0 +1,207 @@
+import numpy as np
+from nektsrs.grid import Grid3D, SimpleGrid3D, grid_data
+from typing import Union
+from nektsrs.reference import reference_element
+from nektsrs.interpolator.interpolator1d import (
+    Interpolator1D,
+    apply_operator,
+    float_dtype,
+)
+from scipy.sparse import csr_matrix
+
+
+__all__ = ["Interpolator3D"]
+
+
+class Interpolator3D:
+    def __init__(self, grid: Union[Grid3D, SimpleGrid3D]) -> None:
+        self.grid = grid
+        self.reference = reference_element(grid.lx)
+        self.ref_gll = self.reference.nodes
+
+        self.interpolator1 = Interpolator1D(grid.grid1)
+        self.interpolator2 = Interpolator1D(grid.grid2)
+        self.interpolator3 = Interpolator1D(grid.grid3)
+
+    @property
+    def edges1(self):
+        return self.grid.edges1
+
+    @property
+    def edges2(self):
+        return self.grid.edges2
+
+    @property
+    def edges3(self):
+        return self.grid.edges3
+
+    @property
+    def gll1(self):
+        return self.grid.gll1
+
+    @property
+    def gll2(self):
+        return self.grid.gll2
+
+    @property
+    def gll3(self):
+        return self.grid.gll3
+
+    @property
+    def lx(self):
+        return self.grid.lx
+
+    @property
+    def nelems1(self):
+        return self.grid.n1
+
+    @property
+    def nelems2(self):
+        return self.grid.n2
+
+    @property
+    def nelems3(self):
+        return self.grid.n3
+
+    @property
+    def shape(self):
+        return (self.gll1.size, self.gll2.size, self.gll3.size)
+
+    def data_element_stats(self, data: np.ndarray) -> (np.ndarray, np.ndarray):
+        """Data for normalizing the data within each element.
+
+        Computed for all elements, and any leading batch dimensions of
+        the data, with single reductions over the element view.
+        """
+        elements = self.grid.element_view(grid_data(self.grid, data))
+        means = np.mean(elements, axis=(-3, -2, -1), dtype=float_dtype(data))
+        stds = np.std(elements, axis=(-3, -2, -1), dtype=float_dtype(data))
+        # avoid division by 0 in normalization
+        stds[stds == 0] = 1.0
+        return means, stds
+
+    def operator(self, points: np.ndarray) -> csr_matrix:
+        """The interpolation to the points as a sparse matrix.
+
+        The matrix has lx**3 nonzeros per row and maps the data on the
+        grid, flattened in C order, to the values at the points.
+        """
+        points = np.atleast_2d(points)
+        npoints = points.shape[0]
+        n2, n3 = self.gll2.size, self.gll3.size
+
+        ind1, weights1 = self.interpolator1.element_weights(points[:, 0])
+        ind2, weights2 = self.interpolator2.element_weights(points[:, 1])
+        ind3, weights3 = self.interpolator3.element_weights(points[:, 2])
+
+        cols = (
+            ind1[:, :, np.newaxis, np.newaxis] * n2
+            + ind2[:, np.newaxis, :, np.newaxis]
+        ) * n3 + ind3[:, np.newaxis, np.newaxis, :]
+        weights = (
+            weights1[:, :, np.newaxis, np.newaxis]
+            * weights2[:, np.newaxis, :, np.newaxis]
+            * weights3[:, np.newaxis, np.newaxis, :]
+        )
+        rows = np.repeat(np.arange(npoints), self.lx**3)
+        return csr_matrix(
+            (weights.ravel(), (rows, cols.ravel())),
+            shape=(npoints, n2 * n3 * self.gll1.size),
+        )
+
+    def interpolate(
+        self, data: np.ndarray, points: np.ndarray, chunk: int = 4096
+    ) -> np.ndarray:
+        """Interpolate to scattered points given data on the grid.
+
+        The points are processed in chunks, each with its own sparse
+        operator(), which bounds the memory of the operator to
+        chunk * lx**3 nonzeros.
+
+        Parameters
+        ----------
+            data: nd.array
+                The data at the points of the given grid, of shape
+                (..., gll1.size, gll2.size, gll3.size). The leading
+                dimensions can be, e.g., time and fields.
+
+            points: 2d nd.array
+                The points where we want the interpolated values.
+
+            chunk: int
+                The number of points to process at once.
+
+        Returns an array of shape (..., npoints).
+        """
+        data = grid_data(self.grid, data)
+        points = np.atleast_2d(points)
+        npoints = points.shape[0]
+        batch = data.shape[:-3]
+
+        # the batch is moved to the columns once, not for every chunk
+        columns = data.reshape((-1, np.prod(self.shape)))
+        columns = np.ascontiguousarray(columns.T)
+
+        values = np.empty((npoints, columns.shape[1]), float_dtype(data))
+        for start in range(0, npoints, chunk):
+            stop = min(start + chunk, npoints)
+            values[start:stop] = self.operator(points[start:stop]) @ columns
+
+        return np.moveaxis(values.reshape((npoints,) + batch), 0, -1)
+
+    def interpolate_grid(
+        self,
+        data: np.ndarray,
+        points1: np.ndarray,
+        points2: np.ndarray,
+        points3: np.ndarray,
+        slab: int = 32,
+    ) -> np.ndarray:
+        """Interpolate to a tensor grid of points.
+
+        The interpolation splits into 1D operators along each axis.
+        The target grid is processed in slabs of points along the
+        first axis: each slab is interpolated from the planes of the
+        data in its elements along the first axis, and then along the
+        other two axes. So, the memory needed is bounded by the slab,
+        rather than the full target grid times the source grid.
+
+        Parameters
+        ----------
+            data: nd.array
+                The data at the points of the given grid, of shape
+                (..., gll1.size, gll2.size, gll3.size).
+
+            points1, points2, points3: 1d nd.array
+                The coordinates of the target grid along each axis.
+
+            slab: int
+                The number of target points along the first axis to
+                process at once.
+
+        Returns an array of shape
+        (..., points1.size, points2.size, points3.size).
+        """
+        data = grid_data(self.grid, data)
+        op1 = self.interpolator1.operator(points1)
+        op2 = self.interpolator2.operator(points2)
+        op3 = self.interpolator3.operator(points3)
+
+        m1 = op1.shape[0]
+        shape = data.shape[:-3] + (m1, op2.shape[0], op3.shape[0])
+        values = np.empty(shape, dtype=float_dtype(data))
+
+        for start in range(0, m1, slab):
+            stop = min(start + slab, m1)
+            op = op1[start:stop]
+
+            # only the gll planes in the elements of the slab are used
+            first = op.indices.min()
+            last = op.indices.max() + 1
+            block = apply_operator(
+                op[:, first:last], data[..., first:last, :, :], -3
+            )
+            block = apply_operator(op2, block, -2)
+            values[..., start:stop, :, :] = apply_operator(op3, block, -1)
+
+        return values
@@ -3,12 +3,24 @@ from .writer import *
 from .file_combiner import *
 from .helpers import *
 from .header import *
+from .manifest import *
+from .layout import *
 
 
-__all__ = ["time_series", "writer", "file_combiner", "helpers", "header"]
+__all__ = [
+    "time_series",
+    "writer",
+    "file_combiner",
+    "helpers",
+    "header",
+    "manifest",
+    "layout",
+]
 
 __all__.extend(time_series.__all__)
 __all__.extend(writer.__all__)
 __all__.extend(file_combiner.__all__)
 __all__.extend(helpers.__all__)
 __all__.extend(header.__all__)
+__all__.extend(manifest.__all__)
+__all__.extend(layout.__all__)
@@ -1,41 +1,109 @@
 import numpy as np
-import glob
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from os.path import join
-from typing import Optional
+from typing import List, Optional, Tuple, Union
 from nektsrs.io import TimeSeries
+from nektsrs.io.manifest import Manifest, find_datafiles
+from nektsrs.io.layout import dataset_options
 
 __all__ = ["FileCombiner"]
 
 
+def read_datasets(datafiles: List, workers: int = 1, dtype=None) -> List:
+    """Read pts files to TimeSeries with collated data, keeping order.
+
+    With workers > 1 the files are parsed in a process pool. Each
+    worker dumps the data to a temporary .npy file, which is loaded
+    back by the parent, so that the large arrays are not pickled. The
+    files are put in the default temporary directory, see TMPDIR.
+    """
+    if workers <= 1:
+        datasets = [TimeSeries.read(i, dtype=dtype) for i in datafiles]
+
+        # collate the data to a 3d array for each dataset
+        for i in datasets:
+            i.collate_data()
+        return datasets
+
+    datasets = []
+    with tempfile.TemporaryDirectory() as tmpdir, ProcessPoolExecutor(
+        workers
+    ) as pool:
+        npy_files = [join(tmpdir, f"{i}.npy") for i in range(len(datafiles))]
+
+        # map returns the results in the order of the input
+        for npy, t, locs, id_list, ldim, writetime in pool.map(
+            read_to_npy, datafiles, npy_files, [dtype] * len(datafiles)
+        ):
+            data = np.load(npy)
+            os.remove(npy)
+
+            ts = TimeSeries(
+                np.transpose(data, (2, 0, 1)),
+                t,
+                locs,
+                id_list,
+                ldim,
+                writetime,
+                sort=False,
+            )
+            ts.data = data
+            datasets.append(ts)
+
+    return datasets
+
+
+def read_to_npy(fname: str, npy: str, dtype=None):
+    """Read and collate a pts file, saving the data to an .npy file.
+
+    Returns the .npy file name along with the metadata of the file.
+    """
+    ts = TimeSeries.read(fname, dtype=dtype)
+    ts.collate_data()
+    np.save(npy, ts.data)
+    return npy, ts.t, ts.locs, ts.id_list, ts.ldim, ts.writetime
+
+
 class FileCombiner:
     """Combines several pts files into a single hdf5.
 
     Assumes that all the pts files have a similar number of fields,
     points, and have the same locations.
 
-    The datasets are sorted by write time prior to concatenation,
-    afterwards unique time-values are extracted using np.unique on
-    the concatenated time array. So, any duplicates are removed.
+    The datasets are sorted by write time prior to concatenation.
+    From each dataset, only the snapshots after the last one kept from
+    the previous datasets are copied, see trim_ranges(). So, the
+    overlap between the files is removed.
 
-    Note, reads all the data into memory!
-    """
+    Note, reads all the data into memory! Use stream_to_hdf5() to
+    combine the files one at a time instead.
 
-    def __init__(self, basename: str, basepath: Optional[str] = "") -> None:
+    Parameters
+    ----------
+        basename: str
+            The base string, which follows pts in the file names.
+        basepath: str
+            The directory with the files.
+        workers: int
+            The number of processes used to read the files.
+        dtype: np.dtype
+            The dtype of the data, by default that of the files.
 
-        search_string = join(
-            basepath, "pts" + basename + "[0-1].f[0-9][0-9][0-9][0-9][0-9]"
-        )
-        datafiles = glob.glob(search_string)
+    """
 
-        print(f"Found {len(datafiles)} datafiles")
-        if len(datafiles) == 0:
-            raise FileExistsError("Could not find any data!")
+    def __init__(
+        self,
+        basename: str,
+        basepath: Optional[str] = "",
+        workers: int = 1,
+        dtype=None,
+    ) -> None:
 
-        datasets = [TimeSeries.read(i) for i in datafiles]
+        datafiles = find_datafiles(basename, basepath)
 
-        # collate the data to a 3d array for each dataset
-        for i in datasets:
-            i.collate_data()
+        datasets = read_datasets(datafiles, workers, dtype)
 
         writetimes = [i.writetime for i in datasets]
         print("Datasets written at the following timesteps were found")
@@ -43,36 +111,266 @@ class FileCombiner:
 
         datasets.sort(key=lambda item: item.writetime)
 
-        self.data = np.vstack([i.data for i in datasets])
+        # kill overlap values, copying the kept slices one dataset at
+        # a time and freeing it afterwards
+        ranges = trim_ranges([i.t for i in datasets])
+        self.nt = sum(end - start for start, end in ranges)
+        self.t = np.empty(self.nt, np.result_type(*[i.t for i in datasets]))
+        self.data = np.empty(
+            (self.nt,) + datasets[0].data.shape[1:],
+            np.result_type(*[i.data for i in datasets]),
+        )
+
+        pos = 0
+        for ts, (start, end) in zip(datasets, ranges):
+            self.t[pos : pos + end - start] = ts.t[start:end]
+            self.data[pos : pos + end - start] = ts.data[start:end]
+            pos += end - start
+            ts.data = None
 
-        self.t = np.concatenate([i.t for i in datasets])
         self.timespan = np.array([self.t[0], self.t[-1]])
         self.nfields = self.data.shape[1]
         self.npoints = self.data.shape[2]
         self.ldim = datasets[0].ldim
         self.locs = datasets[0].locs
 
-        # kill overlap values
-        _, idx = np.unique(self.t, return_index=True)
-        self.data = self.data[idx, ...]
-        self.t = self.t[idx]
-        self.nt = self.t.size
-
         print(f"Final shape of the data is {self.data.shape}")
 
-    def save(self, filepath: str) -> None:
-        """Save the data to an hdf5 file."""
-        import h5py
+    def save(
+        self,
+        filepath: str,
+        append: bool = False,
+        layout: Union[str, Tuple, None] = None,
+        compression: Optional[str] = None,
+    ) -> None:
+        """Save the data to an hdf5 file.
+
+        With append=True and an existing file, only the snapshots
+        after the last time stored in the file are added to it.
+        See dataset_options() for the chunk layout and compression of
+        a new file.
+        """
+        f, t_last = open_output(
+            filepath,
+            self.locs,
+            self.data.shape,
+            self.ldim,
+            self.t.dtype,
+            self.data.dtype,
+            append,
+            layout,
+            compression,
+        )
+
+        # the times are sorted, so the new ones are at the end
+        first = np.searchsorted(self.t, t_last, side="right")
+        start = extend_output(f, self.nt - first)
+        f["t"][start:] = self.t[first:]
+        f["data"][start:] = self.data[first:]
+
+        close_output(f)
+
+    @staticmethod
+    def stream_to_hdf5(
+        basename: str,
+        filepath: str,
+        basepath: Optional[str] = "",
+        append: bool = False,
+        layout: Union[str, Tuple, None] = None,
+        compression: Optional[str] = None,
+        dtype=None,
+    ) -> None:
+        """Combine the pts files into an hdf5 file one file at a time.
+
+        The output is the same as that of save(). The files are sorted
+        by the write time in their headers, and the overlapping
+        snapshots are found from the time lists only, see
+        trim_ranges(), both taken from the Manifest of the files. Then
+        the data of each file is memory-mapped and its unique snapshots
+        are copied into the output, so the peak memory use is about the
+        size of one file.
+
+        With append=True and an existing output file, only files with
+        snapshots after the last stored time are opened, and only
+        those snapshots are added to the file. See dataset_options()
+        for the chunk layout and compression of a new file. The data
+        keeps the word size of the files, unless a dtype is given.
+
+        """
+        manifest = Manifest(basename, basepath)
+        manifest.refresh()
+        if manifest.truncated:
+            raise ValueError(f"Truncated files: {manifest.truncated}")
+
+        datafiles = manifest.datafiles
+        headers = manifest.headers
+        times = manifest.times
+
+        for h in headers:
+            if (h.npoints, h.nfields, h.ldim) != (
+                headers[0].npoints,
+                headers[0].nfields,
+                headers[0].ldim,
+            ):
+                raise ValueError("The pts files have different layouts!")
+
+        print("Datasets written at the following timesteps were found")
+        print([h.time for h in headers])
+
+        nfields = headers[0].nfields
+        npoints = headers[0].npoints
+        if dtype is None:
+            dtype = np.result_type(
+                *[h.dtypef.newbyteorder("=") for h in headers]
+            )
+
+        ts = TimeSeries.open(datafiles[0])
+        locs = ts.locs[np.argsort(ts.id_list, kind="stable")]
+        f, t_last = open_output(
+            filepath,
+            locs,
+            (sum(i.size for i in times), nfields, npoints),
+            headers[0].ldim,
+            times[0].dtype,
+            dtype,
+            append,
+            layout,
+            compression,
+        )
+
+        # kill overlap values, also with the snapshots already stored
+        ranges = trim_ranges(times, t_last)
+
+        # check the points of all the files before the output grows,
+        # so that a mismatch leaves an appended file as it was
+        for fname, (start, end) in zip(datafiles, ranges):
+            if end == start:
+                continue
+            ts = TimeSeries.open(fname)
+            point_order = np.argsort(ts.id_list, kind="stable")
+            if not np.array_equal(ts.locs[point_order], f["locs"][()]):
+                f.close()
+                raise ValueError(f"The locations in {fname} do not match!")
+
+        pos = extend_output(f, sum(end - start for start, end in ranges))
+        dset = f["data"]
+
+        for fname, t, (start, end) in zip(datafiles, times, ranges):
+            if end == start:
+                continue
+
+            ts = TimeSeries.open(fname)
+            point_order = np.argsort(ts.id_list, kind="stable")
+            block = ts.data[start:end]
+            if np.any(point_order != np.arange(npoints)):
+                block = block[:, :, point_order]
+
+            f["t"][pos : pos + end - start] = t[start:end]
+            dset[pos : pos + end - start] = block
+            pos += end - start
+            del ts, block
+
+        print(f"Final shape of the data is {dset.shape}")
+        close_output(f)
+
+
+def trim_ranges(times: List, t_last: float = -np.inf) -> List:
+    """Find the snapshots to keep from a sequence of time lists.
+
+    The time lists are assumed to be sorted, and the sequence to be
+    sorted by write time. From each list, only the snapshots after
+    the last one kept so far are kept, which removes the overlap
+    between consecutive lists in linear time.
+
+    Parameters
+    ----------
+        times: list of 1d ndarrays
+            The time lists.
+        t_last: float
+            Only keep the times after this one, e.g. those already
+            stored.
+
+    Returns a list with the range (start, end) of indices to keep for
+    each time list.
+    """
+    ranges = []
+    for t in times:
+        start = np.searchsorted(t, t_last, side="right")
+        ranges.append((start, t.size))
+        if t.size > start:
+            t_last = t[-1]
+    return ranges
+
+
+def open_output(
+    filepath: str,
+    locs: np.ndarray,
+    shape: Tuple,
+    ldim: int,
+    t_dtype: np.dtype,
+    dtype: np.dtype,
+    append: bool = False,
+    layout: Union[str, Tuple, None] = None,
+    compression: Optional[str] = None,
+):
+    """Open an hdf5 file for the combined data.
+
+    A new file gets empty t and data datasets, which are resizable
+    along the time axis. The shape of the data, (nt, nfields,
+    npoints), is used to choose the chunks. With append=True and an
+    existing file, the file is checked to be compatible with the data
+    instead.
+
+    Returns the file and the last time stored in it.
+    """
+    import h5py
+
+    _, nfields, npoints = shape
+
+    if append and os.path.exists(filepath):
+        f = h5py.File(filepath, "a")
+        if f["t"].maxshape[0] is not None or f["data"].maxshape[0] is not None:
+            f.close()
+            raise ValueError(f"The datasets in {filepath} are not resizable!")
+        if f["data"].shape[1:] != (nfields, npoints) or not np.array_equal(
+            f["locs"][()], locs
+        ):
+            f.close()
+            raise ValueError(f"The points do not match those in {filepath}!")
+
+        t_last = f["t"][-1] if f["t"].size > 0 else -np.inf
+        print(f"Appending to {filepath} after time {t_last}")
+        return f, t_last
+
+    f = h5py.File(filepath, "w")
+    f.create_dataset("locs", data=locs)
+    f.create_dataset("t", (0,), dtype=t_dtype, maxshape=(None,))
+    f.create_dataset(
+        "data",
+        (0, nfields, npoints),
+        dtype=dtype,
+        **dataset_options(shape, dtype, layout, compression, resizable=True),
+    )
+
+    f.attrs["nfields"] = nfields
+    f.attrs["npoints"] = npoints
+    f.attrs["ldim"] = ldim
+
+    return f, -np.inf
+
 
-        f = h5py.File(filepath, "w")
-        f.create_dataset("locs", data=self.locs)
-        f.create_dataset("t", data=self.t)
-        f.create_dataset("data", data=self.data)
+def extend_output(f, nt: int) -> int:
+    """Add nt snapshots to the output, return the first one's index."""
+    start = f["t"].shape[0]
+    f["t"].resize(start + nt, axis=0)
+    f["data"].resize(start + nt, axis=0)
+    return start
 
-        f.attrs["timespan"] = self.timespan
-        f.attrs["nfields"] = self.nfields
-        f.attrs["npoints"] = self.npoints
-        f.attrs["ldim"] = self.ldim
-        f.attrs["nt"] = self.nt
 
-        f.close()
+def close_output(f) -> None:
+    """Update the time attributes of the output and close it."""
+    t = f["t"]
+    f.attrs["nt"] = t.shape[0]
+    if t.shape[0] > 0:
+        f.attrs["timespan"] = np.array([t[0], t[-1]])
+    f.close()
@@ -1,16 +1,98 @@
+import struct
+from typing import Dict
+from .helpers import real_dtype
+
 __all__ = ["Header"]
 
 
 class Header:
+    """The header of a pts file, and the layout of the blocks after it.
+
+    The file consists of the 132-byte header, a 4-byte endian tag, the
+    time list (nt reals), the global point ids (npoints ints), the
+    coordinates (npoints x ldim reals) and the fields, stored point by
+    point and snapshot by snapshot (npoints x nt x nfields reals).
+    """
+
     def __init__(self, file: str) -> None:
         infile = open(file, "rb")
 
         header = infile.read(132).split()
 
+        # extract word size
+        self.wdsizet = int(header[1])
+        self.wdsizef = int(header[2])
+
         # get simulation parameters
         self.ldim = int(header[3])
         self.npoints = int(header[5])
         self.nt = int(header[6])
         self.nfields = int(header[7])
         self.time = float(header[8])
+
+        # identify endian encoding
+        self.emode = endian(infile.read(4))
         infile.close()
+
+    @classmethod
+    def from_dict(cls, d: Dict):
+        """Create a header from the dictionary given by to_dict()."""
+        h = cls.__new__(cls)
+        h.__dict__.update(d)
+        return h
+
+    def to_dict(self) -> Dict:
+        """Get the parsed header fields as a dictionary."""
+        return dict(self.__dict__)
+
+    @property
+    def dtypet(self):
+        """The dtype of the times and coordinates in the file."""
+        return real_dtype(self.emode, self.wdsizet)
+
+    @property
+    def dtypef(self):
+        """The dtype of the fields in the file."""
+        return real_dtype(self.emode, self.wdsizef)
+
+    @property
+    def t_offset(self) -> int:
+        """Byte offset of the time list."""
+        return 136
+
+    @property
+    def id_offset(self) -> int:
+        """Byte offset of the global point ids."""
+        return self.t_offset + self.nt * self.wdsizet
+
+    @property
+    def locs_offset(self) -> int:
+        """Byte offset of the point coordinates."""
+        return self.id_offset + self.npoints * 4
+
+    @property
+    def data_offset(self) -> int:
+        """Byte offset of the field data."""
+        return self.locs_offset + self.npoints * self.ldim * self.wdsizet
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the file as predicted by the header."""
+        return (
+            self.data_offset
+            + self.npoints * self.nt * self.nfields * self.wdsizef
+        )
+
+
+def endian(etagb: bytes) -> str:
+    """Identify the endian encoding from the 4-byte tag."""
+    etag_l = struct.unpack("<f", etagb)[0]
+    etag_l = int(etag_l * 1e5) / 1e5
+    etag_b = struct.unpack(">f", etagb)[0]
+    etag_b = int(etag_b * 1e5) / 1e5
+    if etag_l == 6.54321:
+        return "<"
+    elif etag_b == 6.54321:
+        return ">"
+    else:
+        raise ValueError("Could not determine endian")
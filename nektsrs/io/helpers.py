@@ -17,7 +17,7 @@ from typing import List
 import struct
 import numpy as np
 
-__all__ = ["read_int", "read_real"]
+__all__ = ["read_int", "read_real", "real_dtype"]
 
 
 def read_int(infile, emode: str, nvar: int) -> List[int]:
@@ -34,6 +34,12 @@ def read_real(
     nvar: int,
 ) -> List[float]:
     """Read a real array."""
+    llist = infile.read(wdsize * nvar)
+    return np.frombuffer(llist, dtype=real_dtype(emode, wdsize), count=nvar)
+
+
+def real_dtype(emode: str, wdsize: int) -> np.dtype:
+    """Get the dtype of a real of a given word size and endianness."""
     if wdsize == 4:
         realtype = "f"
     elif wdsize == 8:
@@ -41,5 +47,4 @@ def read_real(
     else:
         raise ValueError
 
-    llist = infile.read(wdsize * nvar)
-    return np.frombuffer(llist, dtype=emode + realtype, count=nvar)
+    return np.dtype(emode + realtype)
@@ -0,0 +1,168 @@
+import numpy as np
+from typing import Dict, Optional, Tuple, Union
+
+__all__ = [
+    "dataset_options",
+    "compression_options",
+    "parse_layout",
+    "open_hdf5",
+]
+
+# Target size of a chunk in bytes
+CHUNK_BYTES = 2**20
+
+
+def chunk_shape(
+    layout: Union[str, Tuple, None],
+    shape: Tuple,
+    itemsize: int,
+    resizable: bool = False,
+) -> Union[Tuple, bool, None]:
+    """Get the chunk shape of a (nt, nfields, npoints) dataset.
+
+    The points can also span several axes, e.g. (nt, nfields, nx, nz)
+    for planes, the chunks along them then hold npoints values of the
+    last axes.
+
+    Parameters
+    ----------
+        layout: str or tuple
+            "time-major" gives chunks holding one snapshot (or a part
+            of it), which is fast to read snapshot by snapshot.
+            "point-major" gives chunks holding a long stretch of time
+            for a few points, which is fast to read probe by probe.
+            "contiguous" or None means no chunking, unless the dataset
+            is resizable, in which case h5py guesses the chunks. A
+            tuple is used as an explicit chunk shape.
+        shape: tuple
+            The shape of the dataset, nt can be an estimate if the
+            dataset is resizable.
+        itemsize: int
+            The size of the data type in bytes.
+        resizable: bool
+            Whether the dataset is resizable along the time axis.
+
+    """
+    nt, nfields, *space = (max(int(i), 1) for i in shape)
+    npoints = int(np.prod(space))
+    values = max(CHUNK_BYTES // itemsize, 1)
+
+    if layout is None or layout == "contiguous":
+        return True if resizable else None
+    elif layout == "time-major":
+        npc = min(npoints, max(values // nfields, 1))
+        return (1, nfields) + point_chunks(npc, space)
+    elif layout == "point-major":
+        ntc = min(nt, max(values // nfields, 1))
+        npc = min(npoints, max(values // (ntc * nfields), 1))
+        return (ntc, nfields) + point_chunks(npc, space)
+    elif isinstance(layout, str):
+        raise ValueError(f"Unknown layout {layout}")
+
+    chunks = tuple(int(i) for i in layout)
+    if len(chunks) != len(shape) or min(chunks) < 1:
+        raise ValueError(f"Invalid chunk shape {layout}")
+    ntc = chunks[0] if resizable else min(chunks[0], nt)
+    return (ntc, min(chunks[1], nfields)) + tuple(
+        min(c, n) for c, n in zip(chunks[2:], space)
+    )
+
+
+def point_chunks(npc: int, space: list) -> Tuple:
+    """Split a chunk of npc points over the point axes, last first."""
+    chunks = []
+    for n in reversed(space):
+        chunks.insert(0, min(n, npc))
+        npc = max(npc // n, 1)
+    return tuple(chunks)
+
+
+def dataset_options(
+    shape: Tuple,
+    dtype,
+    layout: Union[str, Tuple, None] = None,
+    compression: Optional[str] = None,
+    resizable: bool = False,
+) -> Dict:
+    """Keyword arguments of create_dataset for a time-series dataset.
+
+    The dataset has the shape (nt, nfields, npoints).
+
+    Parameters
+    ----------
+        layout: str or tuple
+            The chunk layout, see chunk_shape().
+        compression: str
+            "gzip", "gzip-<level>" or "lzf". The shuffle filter is
+            then applied as well. Compression requires chunking, so
+            h5py guesses the chunks if no layout is given.
+
+    """
+    options = compression_options(compression)
+    chunks = chunk_shape(layout, shape, np.dtype(dtype).itemsize, resizable)
+
+    if chunks is not None:
+        options["chunks"] = chunks
+    if resizable:
+        options["maxshape"] = (None,) + tuple(shape[1:])
+
+    return options
+
+
+def compression_options(compression: Optional[str] = None) -> Dict:
+    """Keyword arguments of create_dataset for compression alone.
+
+    Meant for datasets of any shape, with the chunks left to h5py. See
+    dataset_options() for the compression.
+    """
+    if compression is None:
+        return dict()
+
+    name, _, level = compression.partition("-")
+    if name not in ["gzip", "lzf"] or (level and name != "gzip"):
+        raise ValueError(f"Unknown compression {compression}")
+    options = {"compression": name, "shuffle": True, "chunks": True}
+    if level:
+        options["compression_opts"] = int(level)
+    return options
+
+
+def parse_layout(layout: Optional[str]) -> Union[str, Tuple, None]:
+    """Parse a layout given on the command line, e.g. 64,1,1024."""
+    if layout is None or "," not in layout:
+        return layout
+    return tuple(int(i) for i in layout.split(","))
+
+
+def open_hdf5(
+    filepath: str,
+    mode: str = "r",
+    cache_bytes: int = 64 * 2**20,
+    **kwargs,
+):
+    """Open an hdf5 file with a chunk cache sized for the time series.
+
+    The default cache of h5py is 1 MiB, which does not even hold a
+    single row of chunks when reading, e.g., all times at a probe of a
+    time-major dataset. The number of hash slots is kept at about 100
+    times the number of chunks fitting into the cache.
+    """
+    import h5py
+
+    nslots = 100 * max(cache_bytes // CHUNK_BYTES, 1)
+    return h5py.File(
+        filepath,
+        mode,
+        rdcc_nbytes=cache_bytes,
+        rdcc_nslots=next_prime(nslots),
+        rdcc_w0=1.0,
+        **kwargs,
+    )
+
+
+def next_prime(n: int) -> int:
+    """The smallest prime not less than n."""
+    n = max(n, 2)
+    while any(n % i == 0 for i in range(2, int(n**0.5) + 1)):
+        n += 1
+    return n
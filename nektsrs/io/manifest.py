@@ -0,0 +1,143 @@
+import glob
+import json
+import os
+import numpy as np
+from os.path import basename as path_basename, join
+from typing import Dict, List, Optional
+from .header import Header
+
+__all__ = ["Manifest", "find_datafiles"]
+
+
+def find_datafiles(basename: str, basepath: Optional[str] = "") -> List:
+    """Find the pts files with a given basename."""
+    search_string = join(
+        basepath, "pts" + basename + "[0-1].f[0-9][0-9][0-9][0-9][0-9]"
+    )
+    datafiles = glob.glob(search_string)
+
+    print(f"Found {len(datafiles)} datafiles")
+    if len(datafiles) == 0:
+        raise FileExistsError("Could not find any data!")
+
+    return datafiles
+
+
+class Manifest:
+    """An index of the headers and time lists of a set of pts files.
+
+    The index is kept in a JSON sidecar next to the data, by default
+    pts<basename>.manifest.json. For each file it stores the size,
+    modification time, header fields, byte offsets of each block and
+    the time list. Calling refresh() only opens the files that are new
+    or changed since the last time, so tools can plan their work
+    without touching the data.
+
+    Files that are smaller than what the header predicts are flagged
+    as truncated.
+
+    Parameters
+    ----------
+        basename: str
+            The base string, which follows pts in the file names.
+        basepath: str
+            The directory with the files.
+        fname: str
+            The manifest file, by default in basepath.
+
+    """
+
+    def __init__(
+        self,
+        basename: str,
+        basepath: Optional[str] = "",
+        fname: Optional[str] = None,
+    ) -> None:
+        self.basename = basename
+        self.basepath = basepath
+        if fname is None:
+            fname = join(basepath, "pts" + basename + ".manifest.json")
+        self.fname = fname
+        self.entries = []
+
+        if os.path.exists(fname):
+            with open(fname, "r") as f:
+                self.entries = json.load(f)["files"]
+
+    def refresh(self) -> None:
+        """Index new and changed files and save the manifest."""
+        old = {i["name"]: i for i in self.entries}
+        entries = []
+        for path in find_datafiles(self.basename, self.basepath):
+            stat = os.stat(path)
+            entry = old.get(path_basename(path))
+            if (
+                entry is None
+                or entry["size"] != stat.st_size
+                or entry["mtime_ns"] != stat.st_mtime_ns
+            ):
+                entry = self.index_file(path, stat)
+            entries.append(entry)
+
+        entries.sort(key=lambda item: (item["header"]["time"], item["name"]))
+        self.entries = entries
+        self.save()
+
+    @staticmethod
+    def index_file(path: str, stat: os.stat_result) -> Dict:
+        """Build the manifest entry of a single file."""
+        h = Header(path)
+        with open(path, "rb") as infile:
+            infile.seek(h.t_offset)
+            t = np.fromfile(infile, dtype=h.dtypet, count=h.nt)
+
+        return {
+            "name": path_basename(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "header": h.to_dict(),
+            "offsets": {
+                "t": h.t_offset,
+                "id": h.id_offset,
+                "locs": h.locs_offset,
+                "data": h.data_offset,
+            },
+            "nbytes": h.nbytes,
+            "truncated": stat.st_size < h.nbytes,
+            "t": t.tolist(),
+        }
+
+    def save(self) -> None:
+        """Write the manifest, warning if that is not possible."""
+        try:
+            with open(self.fname, "w") as f:
+                json.dump({"files": self.entries}, f)
+        except OSError as e:
+            print(f"Could not save the manifest {self.fname}: {e}")
+
+    @property
+    def datafiles(self) -> List:
+        """The paths to the files, sorted by write time."""
+        return [join(self.basepath, i["name"]) for i in self.entries]
+
+    @property
+    def headers(self) -> List:
+        """The headers of the files, sorted by write time."""
+        return [Header.from_dict(i["header"]) for i in self.entries]
+
+    @property
+    def times(self) -> List:
+        """The time lists of the files, sorted by write time."""
+        return [
+            np.array(i["t"], dtype=h.dtypet)
+            for i, h in zip(self.entries, self.headers)
+        ]
+
+    @property
+    def truncated(self) -> List:
+        """The paths to the files that are truncated."""
+        return [
+            join(self.basepath, i["name"])
+            for i in self.entries
+            if i["truncated"]
+        ]
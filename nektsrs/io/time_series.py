@@ -13,9 +13,10 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import numpy as np
-import struct
-from typing import List
-from .helpers import read_int, read_real
+import os
+from typing import Optional, Sequence, Tuple, Union
+from .header import Header
+from .layout import dataset_options
 
 __all__ = ["TimeSeries"]
 
@@ -23,108 +24,188 @@ __all__ = ["TimeSeries"]
 class TimeSeries:
     """Data from a single pts file.
 
-    Use the class method read() to read in the data.
+    Use the class method read() to read in the data, or open() to
+    get a lazy, memory-mapped view of it.
 
-    The data field will be a list with data corresponding to each
-    point. Use the collate_data() method to collate that to a single
-    ndarray. Note: this has to be done prior to calling save()!
+    The data field will be an ndarray of shape (npoints, nt, nfields),
+    i.e. the layout of the pts file. Use the collate_data() method to
+    transpose that to (nt, nfields, npoints). Note: this has to be done
+    prior to calling save()!
     """
 
     def __init__(
         self,
-        data: List,
-        t: List,
+        data: np.ndarray,
+        t: np.ndarray,
+        locs: np.ndarray,
+        id_list: np.ndarray,
         ldim: int,
         writetime: float,
-        nfields: int,
         sort: bool = True,
     ) -> None:
         self.data = data
         self.t = np.array(t)
+        self.locs = locs
+        self.id_list = id_list
         self.ldim = ldim
         self.writetime = writetime
-        self.npoints = len(data)
-        self.nfields = nfields
+        self.npoints = data.shape[0]
+        self.nfields = data.shape[2]
         self.nt = self.t.size
         self.sort = sort
 
         if sort:
-            self.data.sort(key=lambda item: item.id)
+            order = np.argsort(self.id_list, kind="stable")
+            self.data = self.data[order]
+            self.locs = self.locs[order]
+            self.id_list = self.id_list[order]
 
-        self.locs = np.vstack([data[i].pos for i in range(self.npoints)])
-        self.id_list = np.array([data[i].id for i in range(self.npoints)])
+    @classmethod
+    def read(
+        cls,
+        fname: str,
+        sort: bool = True,
+        dtype=None,
+        fields: Optional[Sequence] = None,
+        points: Optional[Sequence] = None,
+        time_range: Optional[Tuple] = None,
+    ):
+        """Read data from an interpolation file
+
+        The data keeps the word size of the file, unless a dtype is
+        given, but is converted to the native byte order.
+
+        A part of the data can be extracted with fields, points and
+        time_range. Then, only the requested records are read from the
+        file, so the cost scales with the size of the output.
+
+        Parameters
+        ----------
+            fields: sequence of ints
+                The indices of the fields to read.
+            points: sequence of ints
+                The 0-based global ids of the points to read.
+            time_range: tuple of two floats
+                Read the snapshots with times in [start, end].
+
+        """
+        h = Header(fname)
+        infile = open(fname, "rb")
+        timelist, id_list, locs = read_metadata(infile, h)
+
+        if dtype is None:
+            dtype = h.dtypef.newbyteorder("=")
+
+        if fields is not None or points is not None or time_range is not None:
+            infile.close()
+            tsel = slice(None)
+            if time_range is not None:
+                tsel = slice(
+                    np.searchsorted(timelist, time_range[0], side="left"),
+                    np.searchsorted(timelist, time_range[1], side="right"),
+                )
+            psel = np.arange(h.npoints)
+            if points is not None:
+                psel = point_positions(id_list, points)
+            fsel = np.arange(h.nfields) if fields is None else fields
+            fsel = np.asarray(fsel, dtype=np.int64)
+            if fsel.size and (fsel.min() < 0 or fsel.max() >= h.nfields):
+                raise ValueError(f"Field index out of bounds in {fields}.")
+
+            # A single gather of the selected records, touching only
+            # the pages of the file that hold them
+            data = map_data(fname, h)[:, tsel]
+            data = data[np.ix_(psel, np.arange(data.shape[1]), fsel)]
+
+            return cls(
+                data.astype(dtype, copy=False),
+                timelist[tsel],
+                locs[psel],
+                id_list[psel],
+                h.ldim,
+                h.time,
+                sort,
+            )
+
+        # read fields, stored point by point, snapshot by snapshot
+        count = h.npoints * h.nt * h.nfields
+        data = np.fromfile(infile, dtype=h.dtypef, count=count)
+        infile.close()
+
+        if data.size != count:
+            raise ValueError(f"File {fname} is truncated.")
+
+        data = data.reshape((h.npoints, h.nt, h.nfields))
+        data = data.astype(dtype, copy=False)
+
+        return cls(data, timelist, locs, id_list, h.ldim, h.time, sort)
 
     @classmethod
-    def read(cls, fname: str, sort: bool = True):
-        """Read data from an interpolation file"""
+    def open(cls, fname: str, mmap: bool = True, dtype=None):
+        """Open a pts file, with the data as (nt, nfields, npoints).
+
+        The points are kept in the order of the file, see id_list,
+        whether the data is memory-mapped or not.
+
+        With mmap=True, the data is a read-only np.memmap view of the
+        field block of the file, so only the pages touched by slicing
+        are ever read, and it has the dtype of the file. Otherwise,
+        this is the same as read() with sort=False followed by
+        collate_data().
+
+        """
+        if not mmap:
+            ts = cls.read(fname, sort=False, dtype=dtype)
+            ts.collate_data()
+            return ts
+        if dtype is not None:
+            raise ValueError("The dtype of memory-mapped data is fixed.")
+
+        h = Header(fname)
+        data = map_data(fname, h)
+
         infile = open(fname, "rb")
+        timelist, id_list, locs = read_metadata(infile, h)
+        infile.close()
 
-        header = infile.read(132).split()
-
-        # extract word size
-        wdsizet = int(header[1])
-        wdsizef = int(header[2])
-
-        # identify endian encoding
-        etagb = infile.read(4)
-        etag_l = struct.unpack("<f", etagb)[0]
-        etag_l = int(etag_l * 1e5) / 1e5
-        etag_b = struct.unpack(">f", etagb)[0]
-        etag_b = int(etag_b * 1e5) / 1e5
-        if etag_l == 6.54321:
-            emode = "<"
-        elif etag_b == 6.54321:
-            emode = ">"
-        else:
-            raise ValueError("Could not determine endian")
-
-        # get simulation parameters
-        ldim = int(header[3])
-        npoints = int(header[5])
-        nt = int(header[6])
-        nfields = int(header[7])
-        time = float(header[8])
-
-        # create main data structure filled with 0
-        data = [Point(ldim, nt, nfields) for _ in range(npoints)]
-
-        # read snapshot time list
-        timelist = read_real(infile, emode, wdsizet, nt)
-
-        # read global point number
-        # NOTE: I convert to 0-based numbering
-        global_id_list = read_int(infile, emode, npoints)
-        for i in range(npoints):
-            data[i].id = global_id_list[i] - 1
-
-        # read coordinates
-        for i in range(npoints):
-            pos = read_real(infile, emode, wdsizet, ldim)
-            data[i].pos = pos
-
-        # read fields
-        for i in range(npoints):
-            for j in range(nt):
-                fld = read_real(infile, emode, wdsizef, nfields)
-                for k in range(nfields):
-                    data[i].data[j][k] = fld[k]
-
-        return cls(data, timelist, ldim, time, nfields, sort)
+        ts = cls(
+            data,
+            timelist,
+            locs,
+            id_list,
+            h.ldim,
+            h.time,
+            sort=False,
+        )
+        ts.data = np.transpose(data, (1, 2, 0))
+        return ts
 
     def collate_data(self) -> None:
-        """Combine data from all points in a single data array."""
-        self.data = np.stack(
-            [self.data[i].data for i in range(self.npoints)], axis=2
-        )
+        """Transpose the data to a (nt, nfields, npoints) array."""
+        self.data = np.ascontiguousarray(np.transpose(self.data, (1, 2, 0)))
 
-    def save(self, filepath: str) -> None:
-        """Save the data to an hdf5 file."""
+    def save(
+        self,
+        filepath: str,
+        layout: Union[str, Tuple, None] = None,
+        compression: Optional[str] = None,
+    ) -> None:
+        """Save the data to an hdf5 file.
+
+        See dataset_options() for the chunk layout and compression.
+        """
         import h5py
 
         f = h5py.File(filepath, "w")
         f.create_dataset("locs", data=self.locs)
         f.create_dataset("t", data=self.t)
-        f.create_dataset("data", data=self.data)
+        f.create_dataset(
+            "data",
+            data=self.data,
+            **dataset_options(
+                self.data.shape, self.data.dtype, layout, compression
+            ),
+        )
 
         f.attrs["writetime"] = self.writetime
         f.attrs["nfields"] = self.nfields
@@ -135,10 +216,47 @@ class TimeSeries:
         f.close()
 
 
-class Point:
-    """Data at a single point."""
+def read_metadata(infile, h: Header):
+    """Read the time list, 0-based point ids and coordinates.
+
+    Each block is read in one go, in the endianness of the file. The
+    file is left positioned at the start of the field data.
+    """
+    # read snapshot time list
+    infile.seek(h.t_offset)
+    timelist = np.fromfile(infile, dtype=h.dtypet, count=h.nt)
+
+    # read global point number
+    # NOTE: I convert to 0-based numbering
+    id_list = np.fromfile(infile, dtype=h.emode + "i4", count=h.npoints)
+    id_list = id_list.astype(np.int64) - 1
+
+    # read coordinates
+    locs = np.fromfile(infile, dtype=h.dtypet, count=h.npoints * h.ldim)
+
+    return timelist, id_list, locs.reshape((h.npoints, h.ldim))
+
+
+def map_data(fname: str, h: Header) -> np.memmap:
+    """Memory-map the field data as a (npoints, nt, nfields) array."""
+    if os.path.getsize(fname) < h.nbytes:
+        raise ValueError(f"File {fname} is truncated.")
+
+    return np.memmap(
+        fname,
+        dtype=h.dtypef,
+        mode="r",
+        offset=h.data_offset,
+        shape=(h.npoints, h.nt, h.nfields),
+    )
+
 
-    def __init__(self, ldim: int, nt: int, nfields: int):
-        self.id = int(np.zeros(1, dtype=np.uint32)[0])
-        self.pos = np.zeros(ldim)
-        self.data = np.zeros((nt, nfields))
+def point_positions(id_list: np.ndarray, points: Sequence) -> np.ndarray:
+    """Find the positions of points, given by their ids, in the file."""
+    points = np.asarray(points, dtype=np.int64)
+    order = np.argsort(id_list, kind="stable")
+    pos = np.searchsorted(id_list, points, sorter=order)
+    pos = np.minimum(pos, id_list.size - 1)
+    if np.any(id_list[order[pos]] != points):
+        raise ValueError(f"Points {points} are not all in the file.")
+    return order[pos]
@@ -14,8 +14,9 @@
 
 import numpy as np
 import struct
+from .helpers import real_dtype
 
-__all__ = ["Writer"]
+__all__ = ["Writer", "write_pts"]
 
 
 class Writer:
@@ -48,3 +49,66 @@ class Writer:
             outfile.write(
                 struct.pack(emode + self.locs.shape[1] * realtype, *pointi)
             )
+
+
+def write_pts(
+    fname: str,
+    t: np.ndarray,
+    locs: np.ndarray,
+    data: np.ndarray,
+    writetime: float = 0.0,
+    ids: np.ndarray = None,
+    wdsizet: int = 8,
+    wdsizef: int = 8,
+    emode: str = "<",
+) -> None:
+    """Write a pts file in the format of the KTH timeseries module.
+
+    Parameters
+    ----------
+        fname: str
+            The name of the file.
+        t: 1d ndarray
+            The snapshot times, of size nt.
+        locs: 2d ndarray
+            The point locations, of shape (npoints, ldim).
+        data: 3d ndarray
+            The field values, of shape (npoints, nt, nfields).
+        writetime: float
+            The time stamp put into the header.
+        ids: 1d ndarray
+            0-based global point ids, defaults to the point order.
+
+    """
+    npoints, nt, nfields = data.shape
+    ldim = locs.shape[1]
+
+    if ids is None:
+        ids = np.arange(npoints)
+
+    header = "#std %1i %1i %1i %11i %11i %11i %4i %19.12E %6i %4i" % (
+        wdsizet,
+        wdsizef,
+        ldim,
+        npoints,
+        npoints,
+        nt,
+        nfields,
+        writetime,
+        0,
+        1,
+    )
+
+    with open(fname, "wb") as outfile:
+        outfile.write(header.ljust(132).encode("utf-8"))
+        outfile.write(struct.pack(emode + "f", 6.54321))
+        outfile.write(
+            np.ascontiguousarray(t, dtype=real_dtype(emode, wdsizet))
+        )
+        outfile.write(np.ascontiguousarray(ids + 1, dtype=emode + "i4"))
+        outfile.write(
+            np.ascontiguousarray(locs, dtype=real_dtype(emode, wdsizet))
+        )
+        outfile.write(
+            np.ascontiguousarray(data, dtype=real_dtype(emode, wdsizef))
+        )
@@ -0,0 +1,103 @@
+import numpy as np
+from functools import lru_cache
+from numpy.polynomial.legendre import legvander
+from nektsrs.gll import gll
+
+__all__ = ["ReferenceElement", "reference_element"]
+
+
+def barycentric_weights(nodes: np.ndarray) -> np.ndarray:
+    """The weights of the barycentric Lagrange interpolation formula."""
+    diff = nodes[:, np.newaxis] - nodes[np.newaxis, :]
+    np.fill_diagonal(diff, 1)
+    return 1 / np.prod(diff, axis=1)
+
+
+def lagrange_weights(
+    nodes: np.ndarray, bary_weights: np.ndarray, x: np.ndarray
+) -> np.ndarray:
+    """Values of the Lagrange polynomials of the nodes at points x.
+
+    Uses the second barycentric formula, vectorized over the points.
+    Returns an (x.size, nodes.size) array, the rows of which sum to
+    one.
+    """
+    diff = x[:, np.newaxis] - nodes[np.newaxis, :]
+    exact = diff == 0
+    diff[exact] = 1
+
+    weights = bary_weights / diff
+    weights /= np.sum(weights, axis=1, keepdims=True)
+
+    # points coinciding with a node
+    rows = np.any(exact, axis=1)
+    weights[rows] = exact[rows]
+    return weights
+
+
+def read_only(array: np.ndarray) -> np.ndarray:
+    """Make an array shared by the users of the cache read-only."""
+    array.setflags(write=False)
+    return array
+
+
+class ReferenceElement:
+    """Operators on the reference element [-1, 1] with lx GLL points.
+
+    Use reference_element() to get an instance, which caches them by
+    lx, instead of creating new ones. The arrays are shared by all the
+    users of the cache and are therefore read-only.
+
+    Parameters
+    ----------
+        lx: int
+            The number of GLL points.
+
+    """
+
+    def __init__(self, lx: int) -> None:
+        self.lx = lx
+
+        nodes, weights = gll(lx)
+        self.nodes = read_only(np.asarray(nodes, dtype=np.float64))
+        self.weights = read_only(np.asarray(weights, dtype=np.float64))
+        self.bary_weights = read_only(barycentric_weights(self.nodes))
+
+        # Spectral differentiation matrix, D[i, j] = l_j'(x_i), from the
+        # barycentric weights. The diagonal makes the rows sum to zero,
+        # so that constants are differentiated exactly.
+        diff = self.nodes[:, np.newaxis] - self.nodes[np.newaxis, :]
+        np.fill_diagonal(diff, 1)
+        dmat = self.bary_weights[np.newaxis, :] / (
+            self.bary_weights[:, np.newaxis] * diff
+        )
+        np.fill_diagonal(dmat, 0)
+        np.fill_diagonal(dmat, -np.sum(dmat, axis=1))
+        self.diff_matrix = read_only(dmat)
+
+        # V[i, j] = P_j(x_i), maps Legendre coefficients to nodal values
+        self.vandermonde = read_only(legvander(self.nodes, lx - 1))
+        self.inv_vandermonde = read_only(np.linalg.inv(self.vandermonde))
+
+    def interpolation_matrix(self, points: np.ndarray) -> np.ndarray:
+        """The interpolation from the nodes to points in [-1, 1].
+
+        Returns an (npoints, lx) array, so that the values at the
+        points are interpolation_matrix(points) @ nodal_values.
+        """
+        points = np.atleast_1d(np.asarray(points, dtype=np.float64))
+        return lagrange_weights(self.nodes, self.bary_weights, points)
+
+
+@lru_cache(maxsize=32)
+def cached_reference_element(lx: int) -> ReferenceElement:
+    return ReferenceElement(lx)
+
+
+def reference_element(lx: int) -> ReferenceElement:
+    """The ReferenceElement with lx GLL points, from an LRU cache.
+
+    The key is normalized to a Python int, so that numpy integers, e.g.
+    read from file attributes, share the cache entries.
+    """
+    return cached_reference_element(int(lx))
@@ -0,0 +1,10 @@
+from .averages import *
+from .moments import *
+from .spectra import *
+from .correlations import *
+
+__all__ = ["averages", "moments", "spectra", "correlations"]
+__all__.extend(averages.__all__)
+__all__.extend(moments.__all__)
+__all__.extend(spectra.__all__)
+__all__.extend(correlations.__all__)
@@ -0,0 +1,161 @@
+import numpy as np
+from typing import Union
+from nektsrs.grid import Grid1D, Grid2D, Grid3D, grid_data
+from nektsrs.io.layout import open_hdf5
+
+__all__ = ["spatial_average", "time_average"]
+
+# default upper bound on the size of a chunk of data read at once
+CHUNK_BUDGET = 64 * 2**20
+
+
+def grid_axes(grid, axes) -> list:
+    """Normalize the averaging directions of a grid to a sorted list."""
+    ndim = len(grid.shape)
+    if axes is None:
+        return list(range(ndim))
+
+    axes = np.atleast_1d(axes)
+    if np.any(axes < -ndim) or np.any(axes >= ndim):
+        raise ValueError(f"Axes {axes} are out of bounds.")
+    return sorted(set(int(a) % ndim for a in axes))
+
+
+def time_slice(t: np.ndarray, time_range=None) -> slice:
+    """The slice of the sorted times t within an inclusive range."""
+    if time_range is None:
+        return slice(0, t.size)
+    return slice(
+        int(np.searchsorted(t, time_range[0], side="left")),
+        int(np.searchsorted(t, time_range[1], side="right")),
+    )
+
+
+def chunk_steps(dset, nrows: int, budget: int = CHUNK_BUDGET) -> int:
+    """The number of time steps to read from a dataset at once.
+
+    Bounded by the budget in bytes and rounded down to whole chunks
+    of the dataset along time, if it is chunked.
+    """
+    row_bytes = nrows * dset.dtype.itemsize * np.prod(dset.shape[2:])
+    steps = max(int(budget // row_bytes), 1)
+    if dset.chunks is not None and steps > dset.chunks[0]:
+        steps -= steps % dset.chunks[0]
+    return steps
+
+
+def read_chunk(dset, start: int, stop: int, fields=None) -> np.ndarray:
+    """Read a range of time steps of some fields of a data dataset.
+
+    Only the requested fields are read from the file. They can be
+    given in any order.
+    """
+    if fields is None:
+        return dset[start:stop]
+
+    fields = np.atleast_1d(fields)
+    unique, inverse = np.unique(fields, return_inverse=True)
+    return dset[start:stop, unique.tolist()][:, inverse]
+
+
+def spatial_average(
+    grid: Union[Grid1D, Grid2D, Grid3D],
+    data: np.ndarray,
+    axes: Union[int, tuple] = None,
+) -> np.ndarray:
+    """Average data on the gll points over directions of the grid.
+
+    The integral along each direction uses the GLL quadrature weights
+    of the elements, so the average is spectrally accurate, unlike the
+    plain mean over the nonuniform gll points.
+
+    Parameters
+    ----------
+        grid: Grid1D, Grid2D or Grid3D
+            The grid of the data.
+
+        data: nd.array of shape (..., gll1.size, gll2.size, ...)
+            The data, the leading dimensions can be, e.g., time and
+            fields. The grid dimensions can also be flattened into
+            the last axis, in the order of grid.gll, see grid_data().
+
+        axes: int or tuple of ints
+            The directions of the grid to average over, by default all
+            of them.
+
+    Returns an array with the averaged directions removed.
+    """
+    data = grid_data(grid, data)
+    ndim = len(grid.shape)
+    lead = data.ndim - ndim
+
+    # contract the last direction first, so the others keep their axis
+    for axis in reversed(grid_axes(grid, axes)):
+        line = grid.grids[axis]
+        weights = line.quadrature_weights() / (line.end - line.start)
+        data = np.tensordot(data, weights, axes=([lead + axis], [0]))
+    return data
+
+
+def time_average(
+    filepath: str,
+    grid: Union[Grid1D, Grid2D, Grid3D],
+    axes: Union[int, tuple] = None,
+    fields: list = None,
+    time_range: tuple = None,
+    budget: int = CHUNK_BUDGET,
+) -> np.ndarray:
+    """Time and spatial average of the data in an hdf5 file.
+
+    The data is read in chunks of time steps. Each chunk is averaged
+    over the given directions of the grid with spatial_average() and
+    accumulated in double precision, so at most one chunk of the data
+    is held in memory. All the time steps get the same weight.
+
+    Parameters
+    ----------
+        filepath: str
+            The hdf5 file, with the t and data datasets written by,
+            e.g., the FileCombiner. The points of the data must be the
+            gll points of the grid, in the order of grid.gll.
+
+        grid: Grid1D, Grid2D or Grid3D
+            The grid of the data.
+
+        axes: int or tuple of ints
+            The directions of the grid to average over, by default all
+            of them. An empty tuple gives just the time average.
+
+        fields: list of ints
+            The fields to average, by default all of them.
+
+        time_range: tuple of two floats
+            The inclusive range of times to average over.
+
+        budget: int
+            The maximum size of a chunk in bytes.
+
+    Returns an array of shape (nfields, ...) with the averaged
+    directions of the grid removed.
+    """
+    with open_hdf5(filepath, "r") as f:
+        dset = f["data"]
+        t = f["t"][()]
+        if dset.shape[-1] != np.prod(grid.shape):
+            raise ValueError("The points do not match the grid!")
+
+        nfields = dset.shape[1] if fields is None else np.size(fields)
+        steps = time_slice(t, time_range)
+        nt = steps.stop - steps.start
+        if nt <= 0:
+            raise ValueError("No data in the time range.")
+
+        total = 0
+        step = chunk_steps(dset, nfields, budget)
+        for start in range(steps.start, steps.stop, step):
+            stop = min(start + step, steps.stop)
+            chunk = read_chunk(dset, start, stop, fields)
+            averaged = spatial_average(grid, chunk, axes)
+            total = total + np.sum(averaged, axis=0, dtype=np.float64)
+
+    return total / nt
@@ -0,0 +1,135 @@
+import numpy as np
+from scipy.fft import next_fast_len
+from nektsrs.io.layout import open_hdf5
+from nektsrs.statistics.averages import (
+    CHUNK_BUDGET,
+    chunk_steps,
+    read_chunk,
+    time_slice,
+)
+from nektsrs.statistics.spectra import rank_segments, sum_ranks
+
+__all__ = ["two_point_correlation", "correlation_sums"]
+
+
+def correlation_sums(
+    planes: np.ndarray, shape: tuple, axes: tuple
+) -> np.ndarray:
+    """Sums over the leading axis of the autocorrelations of planes.
+
+    The autocorrelation of each plane is computed via the FFT, as the
+    inverse transform of the power spectrum, with the planes
+    zero-padded to the given shape. Without padding along an axis,
+    the correlation along it is circular.
+    """
+    coeffs = np.fft.rfftn(planes, s=shape, axes=axes)
+    power = np.sum(coeffs.real**2 + coeffs.imag**2, axis=0)
+    return np.fft.irfftn(power, s=shape, axes=[a - 1 for a in axes])
+
+
+def lag_indices(n: int, size: int, periodic: bool) -> (np.ndarray, np.ndarray):
+    """The lags along an axis and their positions in the FFT output."""
+    if periodic:
+        lags = np.arange(n) - n // 2
+    else:
+        lags = np.arange(-(n - 1), n)
+    return lags, lags % size
+
+
+def two_point_correlation(
+    filepath: str,
+    periodic: tuple = (True, True),
+    fields: list = None,
+    time_range: tuple = None,
+    budget: int = CHUNK_BUDGET,
+    comm=None,
+) -> (list, np.ndarray):
+    """Two-point correlations of the fluctuations on uniform planes.
+
+    Meant for the output of nektsrs_interpolate, with data of shape
+    (nt, nfields, nx, nz). The correlations of each snapshot are
+    computed via the FFT (Wiener-Khinchin), at a cost of O(N log N)
+    instead of the O(N**2) of direct summation. Along non-periodic
+    axes the planes are zero-padded to at least twice their size, so
+    the correlation is not circular, and each lag is normalized by the
+    number of pairs of points it has.
+
+    The data is read a chunk of snapshots at a time. Along with the
+    correlations of the snapshots, the time sum of the planes is
+    accumulated, and the correlation of the mean plane is subtracted
+    at the end. So, the result is the covariance of the fluctuations
+    around the time mean at each point, in a single pass. With an MPI
+    communicator the snapshots are split between the ranks and the
+    sums are added up in one reduction.
+
+    Parameters
+    ----------
+        filepath: str
+            The hdf5 file with the t and data datasets.
+
+        periodic: tuple of bools
+            Whether each of the spatial axes is periodic.
+
+        fields: list of ints
+            The fields to include, by default all of them.
+
+        time_range: tuple of two floats
+            The inclusive range of times to include.
+
+        budget: int
+            The maximum size in bytes of a chunk of snapshots. The FFT
+            work arrays are a few times larger.
+
+        comm: MPI communicator
+            The ranks to split the snapshots between.
+
+    Returns the lags along each axis, in points, and the correlations
+    of shape (nfields, nlags1, nlags2, ...).
+    """
+    with open_hdf5(filepath, "r") as f:
+        dset = f["data"]
+        space = dset.shape[2:]
+        if len(periodic) != len(space):
+            raise ValueError("Periodicity must be given for each axis.")
+
+        steps = time_slice(f["t"][()], time_range)
+        nt = steps.stop - steps.start
+        if nt <= 0:
+            raise ValueError("No data in the time range.")
+
+        axes = tuple(range(2, 2 + len(space)))
+        shape = tuple(
+            n if p else next_fast_len(2 * n - 1)
+            for n, p in zip(space, periodic)
+        )
+
+        nfields = dset.shape[1] if fields is None else np.size(fields)
+        sums = np.zeros((nfields,) + shape)
+        mean = np.zeros((nfields,) + space)
+
+        local = rank_segments(np.arange(steps.start, steps.stop), comm)
+        step = chunk_steps(dset, nfields, budget)
+        for start in range(0, local.size, step):
+            stop = min(start + step, local.size)
+            planes = read_chunk(
+                dset, local[start], local[stop - 1] + 1, fields
+            )
+            sums += correlation_sums(planes, shape, axes)
+            mean += np.sum(planes, axis=0)
+
+    sums = sum_ranks(sums, comm)
+    mean = sum_ranks(mean, comm) / nt
+
+    correlation = sums / nt - correlation_sums(mean[np.newaxis], shape, axes)
+
+    lags = []
+    for axis, (n, size, p) in enumerate(zip(space, shape, periodic)):
+        lag, index = lag_indices(n, size, p)
+        correlation = np.take(correlation, index, axis=axis + 1)
+
+        # the number of pairs of points at each lag
+        pairs = np.full(lag.size, n) if p else n - np.abs(lag)
+        correlation /= pairs.reshape((-1,) + (1,) * (len(space) - axis - 1))
+        lags.append(lag)
+
+    return lags, correlation
@@ -0,0 +1,254 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from nektsrs.chunks import chunks_and_offsets
+from nektsrs.io.layout import compression_options, open_hdf5
+from nektsrs.statistics.averages import (
+    CHUNK_BUDGET,
+    chunk_steps,
+    read_chunk,
+    time_slice,
+)
+
+__all__ = ["Moments", "file_moments", "merge_moments"]
+
+
+class Moments:
+    """Streaming central moments of all fields at all points.
+
+    Keeps the number of samples, the mean, and the sums of the 2nd to
+    4th powers of the deviations from the mean of each field, as well
+    as the sums of the products of the deviations of each pair of
+    fields. Each chunk of data is first reduced on its own, in double
+    precision, and then merged with the running sums using the
+    pairwise update formulas of Chan et al. and Pebay. The same merge
+    combines the partial moments of different time ranges, e.g. from
+    different ranks, in any order. This is numerically stable, unlike
+    accumulating the raw power sums.
+
+    Parameters
+    ----------
+        nfields: int
+            The number of fields.
+
+        npoints: int
+            The number of points.
+
+    """
+
+    def __init__(self, nfields: int, npoints: int) -> None:
+        self.nfields = nfields
+        self.npoints = npoints
+        self.n = 0
+        self.mean = np.zeros((nfields, npoints))
+        self.m2 = np.zeros((nfields, npoints))
+        self.m3 = np.zeros((nfields, npoints))
+        self.m4 = np.zeros((nfields, npoints))
+
+        # the pairs of fields i < j for the cross moments
+        self.pairs = np.triu_indices(nfields, 1)
+        self.c2 = np.zeros((self.pairs[0].size, npoints))
+
+    @property
+    def variance(self):
+        return self.m2 / self.n
+
+    @property
+    def skewness(self):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.sqrt(self.n) * self.m3 / self.m2**1.5
+
+    @property
+    def flatness(self):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.n * self.m4 / self.m2**2
+
+    @property
+    def covariance(self):
+        """The covariances of the pairs of fields, see self.pairs."""
+        return self.c2 / self.n
+
+    @classmethod
+    def from_data(cls, data: np.ndarray) -> "Moments":
+        """The moments of a chunk of data.
+
+        The data is of shape (nt, nfields, npoints). Computed with two
+        passes over the chunk, which is converted to double precision.
+        """
+        result = cls(data.shape[1], data.shape[2])
+        result.n = data.shape[0]
+        if result.n == 0:
+            return result
+
+        result.mean = np.mean(data, axis=0, dtype=np.float64)
+        dev = data - result.mean
+        dev2 = dev**2
+        result.m2 = np.sum(dev2, axis=0)
+        result.m3 = np.einsum("tfp,tfp->fp", dev2, dev)
+        result.m4 = np.einsum("tfp,tfp->fp", dev2, dev2)
+        for k, (i, j) in enumerate(zip(*result.pairs)):
+            result.c2[k] = np.einsum("tp,tp->p", dev[:, i], dev[:, j])
+        return result
+
+    def update(self, data: np.ndarray) -> "Moments":
+        """Add a chunk of data of shape (nt, nfields, npoints)."""
+        return self.merge(Moments.from_data(data))
+
+    def merge(self, other: "Moments") -> "Moments":
+        """Merge the moments of other into these, in place."""
+        if (other.nfields, other.npoints) != (self.nfields, self.npoints):
+            raise ValueError("The moments are of different shapes!")
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n = other.n
+            for name in ["mean", "m2", "m3", "m4", "c2"]:
+                setattr(self, name, np.copy(getattr(other, name)))
+            return self
+
+        na = self.n
+        nb = other.n
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        delta_n2 = delta_n**2
+        corr = delta * delta_n * na * nb
+
+        self.m4 += (
+            other.m4
+            + corr * delta_n2 * (na**2 - na * nb + nb**2)
+            + 6 * delta_n2 * (na**2 * other.m2 + nb**2 * self.m2)
+            + 4 * delta_n * (na * other.m3 - nb * self.m3)
+        )
+        self.m3 += (
+            other.m3
+            + corr * delta_n * (na - nb)
+            + 3 * delta_n * (na * other.m2 - nb * self.m2)
+        )
+        self.m2 += other.m2 + corr
+        i, j = self.pairs
+        self.c2 += other.c2 + delta[i] * delta_n[j] * na * nb
+        self.mean += delta_n * nb
+        self.n = n
+        return self
+
+    def save(
+        self,
+        filepath: str,
+        locs: np.ndarray = None,
+        timespan: tuple = None,
+        compression: str = None,
+    ) -> None:
+        """Save the statistics to an hdf5 file.
+
+        The mean, variance, skewness and flatness are (nfields,
+        npoints) datasets. The covariance holds only the pairs of
+        different fields, listed in the pairs dataset.
+        """
+        import h5py
+
+        stats = {
+            "mean": self.mean,
+            "variance": self.variance,
+            "skewness": self.skewness,
+            "flatness": self.flatness,
+            "covariance": self.covariance,
+        }
+        with h5py.File(filepath, "w") as f:
+            for name, value in stats.items():
+                f.create_dataset(
+                    name, data=value, **compression_options(compression)
+                )
+            f.create_dataset("pairs", data=np.stack(self.pairs, axis=1))
+            if locs is not None:
+                f.create_dataset("locs", data=locs)
+
+            f.attrs["nsamples"] = self.n
+            f.attrs["nfields"] = self.nfields
+            f.attrs["npoints"] = self.npoints
+            if timespan is not None:
+                f.attrs["timespan"] = np.asarray(timespan)
+
+
+def merge_moments(a: Moments, b: Moments) -> Moments:
+    """Merge two partial moments, e.g. as the op of an MPI reduction."""
+    return a.merge(b)
+
+
+def range_moments(
+    filepath: str,
+    start: int,
+    stop: int,
+    fields=None,
+    budget: int = CHUNK_BUDGET,
+) -> Moments:
+    """The moments of a range of time steps of an hdf5 file.
+
+    The data is read and reduced one chunk of time steps at a time.
+    """
+    with open_hdf5(filepath, "r") as f:
+        dset = f["data"]
+        nfields = dset.shape[1] if fields is None else np.size(fields)
+        result = Moments(nfields, dset.shape[2])
+
+        step = chunk_steps(dset, nfields, budget)
+        for i in range(start, stop, step):
+            result.update(read_chunk(dset, i, min(i + step, stop), fields))
+    return result
+
+
+def file_moments(
+    filepath: str,
+    fields: list = None,
+    time_range: tuple = None,
+    workers: int = 1,
+    budget: int = CHUNK_BUDGET,
+) -> Moments:
+    """Single pass moments of the data in an hdf5 file.
+
+    With workers > 1 the time range is split between the processes of
+    a pool with chunks_and_offsets(), and the partial moments are
+    merged in the parent. The budget bounds the memory of each worker.
+
+    Parameters
+    ----------
+        filepath: str
+            The hdf5 file, with the t and data datasets written by,
+            e.g., the FileCombiner.
+
+        fields: list of ints
+            The fields to include, by default all of them.
+
+        time_range: tuple of two floats
+            The inclusive range of times to include.
+
+        workers: int
+            The number of processes.
+
+        budget: int
+            The maximum size of a chunk in bytes.
+
+    """
+    with open_hdf5(filepath, "r") as f:
+        steps = time_slice(f["t"][()], time_range)
+    nt = steps.stop - steps.start
+    if nt <= 0:
+        raise ValueError("No data in the time range.")
+
+    if workers <= 1:
+        return range_moments(filepath, steps.start, steps.stop, fields, budget)
+
+    chunks, offsets = chunks_and_offsets(min(workers, nt), nt)
+    starts = steps.start + offsets
+    with ProcessPoolExecutor(len(chunks)) as pool:
+        partials = pool.map(
+            range_moments,
+            [filepath] * len(chunks),
+            starts,
+            starts + chunks,
+            [fields] * len(chunks),
+            [budget] * len(chunks),
+        )
+        result = next(partials)
+        for partial in partials:
+            result.merge(partial)
+    return result
@@ -0,0 +1,205 @@
+import numpy as np
+from scipy.signal import get_window
+from nektsrs.chunks import chunks_and_offsets
+from nektsrs.io.layout import open_hdf5
+from nektsrs.statistics.averages import read_chunk, time_slice
+
+__all__ = ["welch", "space_time_spectrum", "segment_starts"]
+
+
+def segment_starts(nt: int, nperseg: int, noverlap: int = None) -> np.ndarray:
+    """The first time steps of the overlapping segments of a series.
+
+    By default the segments overlap by half their length, the last
+    time steps not filling a whole segment are left out.
+    """
+    noverlap = nperseg // 2 if noverlap is None else noverlap
+    if nperseg > nt:
+        raise ValueError(f"Segment length {nperseg} exceeds {nt} steps.")
+    if noverlap < 0 or noverlap >= nperseg:
+        raise ValueError(f"Invalid segment overlap {noverlap}.")
+    return np.arange(0, nt - nperseg + 1, nperseg - noverlap)
+
+
+def sampling_rate(t: np.ndarray) -> float:
+    """The sampling rate of a series, which must be uniform."""
+    dt = np.diff(t)
+    if dt.size == 0 or not np.allclose(dt, dt[0], rtol=1e-6, atol=0):
+        raise ValueError("The time steps are not uniform.")
+    return 1 / dt[0]
+
+
+def rank_segments(starts: np.ndarray, comm=None) -> np.ndarray:
+    """The segments processed by this rank, all of them without MPI."""
+    if comm is None:
+        return starts
+
+    nprocs = min(comm.Get_size(), starts.size)
+    [chunks, offsets] = chunks_and_offsets(nprocs, starts.size)
+    rank = comm.Get_rank()
+    if rank >= nprocs:
+        return starts[:0]
+    return starts[offsets[rank] : offsets[rank] + chunks[rank]]
+
+
+def sum_ranks(array: np.ndarray, comm=None) -> np.ndarray:
+    """Sum an array over the ranks in place, a no-op without MPI."""
+    if comm is not None:
+        from mpi4py import MPI
+
+        comm.Allreduce(MPI.IN_PLACE, array, op=MPI.SUM)
+    return array
+
+
+def segments(dset, starts, nperseg: int, window: np.ndarray, fields=None):
+    """Yield the detrended, windowed segments starting at starts."""
+    for start in starts:
+        segment = read_chunk(dset, start, start + nperseg, fields)
+        segment = segment - np.mean(segment, axis=0)
+        segment *= window.reshape((-1,) + (1,) * (segment.ndim - 1))
+        yield segment
+
+
+def welch(
+    filepath: str,
+    nperseg: int,
+    noverlap: int = None,
+    fields: list = None,
+    time_range: tuple = None,
+    window: str = "hann",
+    comm=None,
+) -> (np.ndarray, np.ndarray):
+    """Welch power spectral densities in time at all the points.
+
+    The data is read one segment of time steps at a time, so the
+    memory is bounded by the segment length times the points. The mean
+    of each segment is removed and the window applied, then a single
+    rfft along time covers all the fields and points, and the power
+    is accumulated. The scaling is the one-sided density, as in
+    scipy.signal.welch.
+
+    With an MPI communicator, the segments are split between the
+    ranks, and the partial sums are added up in one reduction. All
+    the ranks get the result.
+
+    Parameters
+    ----------
+        filepath: str
+            The hdf5 file with the t and data datasets, the latter of
+            shape (nt, nfields, ...).
+
+        nperseg: int
+            The number of time steps per segment.
+
+        noverlap: int
+            The overlap of the segments, half of them by default.
+
+        fields: list of ints
+            The fields to include, by default all of them.
+
+        time_range: tuple of two floats
+            The inclusive range of times to include.
+
+        window: str
+            The window, see scipy.signal.get_window.
+
+        comm: MPI communicator
+            The ranks to split the segments between.
+
+    Returns the frequencies and the densities, the latter of shape
+    (nfreq, nfields, ...).
+    """
+    win = get_window(window, nperseg)
+    with open_hdf5(filepath, "r") as f:
+        dset = f["data"]
+        steps = time_slice(f["t"][()], time_range)
+        fs = sampling_rate(f["t"][steps])
+        starts = steps.start + segment_starts(
+            steps.stop - steps.start, nperseg, noverlap
+        )
+
+        nfields = dset.shape[1] if fields is None else np.size(fields)
+        shape = (nperseg // 2 + 1, nfields) + dset.shape[2:]
+        power = np.zeros(shape)
+        for segment in segments(
+            dset, rank_segments(starts, comm), nperseg, win, fields
+        ):
+            power += np.abs(np.fft.rfft(segment, axis=0)) ** 2
+
+    power = sum_ranks(power, comm)
+    power /= fs * np.sum(win**2) * starts.size
+
+    # one-sided, the Nyquist frequency only exists for an even length
+    power[1 : None if nperseg % 2 else -1] *= 2
+    return np.fft.rfftfreq(nperseg, 1 / fs), power
+
+
+def space_time_spectrum(
+    filepath: str,
+    nperseg: int,
+    axis: int,
+    dx: float,
+    noverlap: int = None,
+    fields: list = None,
+    time_range: tuple = None,
+    window: str = "hann",
+    comm=None,
+) -> (np.ndarray, np.ndarray, np.ndarray):
+    """Wavenumber-frequency spectra on uniform, periodic planes.
+
+    Meant for the output of nektsrs_interpolate, with data of shape
+    (nt, nfields, nx, nz). The segments in time are handled as in
+    welch(). Each one is transformed with an rfft along the given
+    periodic axis, without a window, and an fft along time. The power
+    is averaged over the other spatial axes and the segments.
+
+    The spectrum is a density in the angular frequency and wavenumber,
+    two-sided in frequency, so that the direction of propagation is
+    kept, and one-sided in wavenumber. Its integral approximates the
+    variance.
+
+    Parameters
+    ----------
+        axis: int
+            The periodic spatial axis, 0 for the first one after the
+            fields, and so on.
+
+        dx: float
+            The uniform spacing of the points along the axis.
+
+    See welch() for the rest.
+
+    Returns the angular frequencies, in increasing order, the angular
+    wavenumbers and the spectra, the latter of shape
+    (nfreq, nk, nfields).
+    """
+    win = get_window(window, nperseg)
+    with open_hdf5(filepath, "r") as f:
+        dset = f["data"]
+        steps = time_slice(f["t"][()], time_range)
+        fs = sampling_rate(f["t"][steps])
+        starts = steps.start + segment_starts(
+            steps.stop - steps.start, nperseg, noverlap
+        )
+
+        nspace = len(dset.shape) - 2
+        axis = 2 + axis % nspace
+        nx = dset.shape[axis]
+        average = tuple(i for i in range(2, 2 + nspace) if i != axis)
+
+        nfields = dset.shape[1] if fields is None else np.size(fields)
+        power = np.zeros((nperseg, nx // 2 + 1, nfields))
+        for segment in segments(
+            dset, rank_segments(starts, comm), nperseg, win, fields
+        ):
+            coeffs = np.fft.fft(np.fft.rfft(segment, axis=axis), axis=0)
+            coeffs = np.mean(np.abs(coeffs) ** 2, axis=average)
+            power += np.moveaxis(coeffs, -1, 1)
+
+    power = sum_ranks(power, comm)
+    power *= dx / (fs * np.sum(win**2) * nx * starts.size * (2 * np.pi) ** 2)
+    power[:, 1 : None if nx % 2 else -1] *= 2
+
+    omega = 2 * np.pi * np.fft.fftshift(np.fft.fftfreq(nperseg, 1 / fs))
+    k = 2 * np.pi * np.fft.rfftfreq(nx, dx)
+    return omega, k, np.fft.fftshift(power, axes=0)
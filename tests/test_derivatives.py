@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from nektsrs.derivatives import derivative, gradient
+from nektsrs.grid import Grid1D, SimpleGrid1D, SimpleGrid2D, SimpleGrid3D
+from nektsrs.grid import flat_data
+from numpy.testing import assert_array_almost_equal
+
+
+def test_derivative_polynomial():
+    e = np.array([0, 0.1, 0.3, 0.7, 1])
+    g = Grid1D(e, 5)
+
+    # exact within each element, so also at the shared nodes
+    data = g.gll**4 - 3 * g.gll
+    assert_array_almost_equal(derivative(g, data), 4 * g.gll**3 - 3)
+
+
+def test_derivative_batch():
+    g = SimpleGrid1D(0, 2 * np.pi, 8, 8)
+    t = np.arange(3)
+    data = np.sin(g.gll[np.newaxis, :] + t[:, np.newaxis])
+
+    d = derivative(g, data)
+    assert d.shape == (3, g.gll.size)
+    assert_array_almost_equal(d, np.cos(g.gll + t[:, np.newaxis]), decimal=5)
+
+    d = derivative(g, data.T.astype(np.float32), axis=0)
+    assert d.dtype == np.float32
+    assert_array_almost_equal(d.T, np.cos(g.gll + t[:, np.newaxis]), 4)
+
+
+def test_gradient_2d():
+    g = SimpleGrid2D(0, 1, 0, 2, 3, 4, 6)
+    x, y = np.meshgrid(g.gll1, g.gll2, indexing="ij")
+    data = np.stack((x**2 * y, x * y**3))
+
+    dx, dy = gradient(g, data)
+    assert_array_almost_equal(dx, np.stack((2 * x * y, y**3)))
+    assert_array_almost_equal(dy, np.stack((x**2, 3 * x * y**2)))
+
+    flat = flat_data(g, data)
+    assert_array_almost_equal(gradient(g, flat, axis=1), flat_data(g, dy))
+
+    # flat data in the order of the gll points
+    d = gradient(g, g.gll[:, 0] ** 2, axis=0)
+    assert_array_almost_equal(d, 2 * g.gll[:, 0])
+    assert_array_almost_equal(gradient(g, data, axis=-2), dx)
+
+    with pytest.raises(ValueError):
+        gradient(g, data, axis=2)
+
+
+def test_gradient_3d():
+    g = SimpleGrid3D(0, 1, 0, 1, 0, 1, 2, 2, 3, 4)
+    x, y, z = np.meshgrid(g.gll1, g.gll2, g.gll3, indexing="ij")
+
+    assert_array_almost_equal(
+        gradient(g, x * y * z**2, axis=2), 2 * x * y * z
+    )
@@ -1,7 +1,8 @@
 from nektsrs.grid import SimpleGrid1D, Grid1D
 from nektsrs.gll import gll
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 import numpy as np
+import pytest
 
 
 def test_simplegrid1d_element_edges():
@@ -50,3 +51,46 @@ def test_grid1d():
 
     p, _ = gll(4)
     assert_array_almost_equal(g.gll[:4], (p + 1) / 2 * 0.1)
+
+
+def test_grid1d_element_view():
+    g = SimpleGrid1D(0, 1, 5, 4)
+    rng = np.random.default_rng(0)
+    data = rng.random((3, g.gll.size))
+
+    view = g.element_view(data)
+    assert view.shape == (3, 5, 4)
+    assert np.shares_memory(view, data)
+    assert not view.flags.writeable
+    for i in range(g.n):
+        ind = g.element_gll_indices(i)
+        assert_array_almost_equal(view[:, i], data[:, ind[0] : ind[1]])
+
+
+def test_grid1d_locate():
+    g = SimpleGrid1D(0, 1, 10, 4)
+    assert g.uniform
+
+    points = np.array([0, 0.05, 0.1, 0.35, 1])
+    ind, ref = g.locate(points)
+    assert_array_equal(ind, [0, 0, 1, 3, 9])
+    assert_array_almost_equal(ref, [-1, 0, -1, 0, 1])
+
+    with pytest.raises(ValueError):
+        g.locate(np.array([1.1]))
+
+
+def test_grid1d_locate_stretched():
+    e = np.tanh(np.linspace(-2, 2, 33)) / np.tanh(2)
+    g = Grid1D(e, 5)
+    assert not g.uniform
+
+    rng = np.random.default_rng(0)
+    points = np.concatenate((rng.uniform(-1, 1, 1000), e))
+    ind, ref = g.locate(points)
+
+    expected = np.clip(np.searchsorted(e, points, side="right") - 1, 0, 31)
+    assert_array_equal(ind, expected)
+    assert np.all(np.abs(ref) <= 1)
+    left, right = e[ind], e[ind + 1]
+    assert_array_almost_equal(left + (ref + 1) / 2 * (right - left), points)
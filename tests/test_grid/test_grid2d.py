@@ -1,6 +1,6 @@
 from nektsrs.grid import Grid2D, SimpleGrid2D
 from nektsrs.gll import gll
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 import numpy as np
 
 
@@ -63,3 +63,38 @@ def test_grid2d():
 
     g2 = SimpleGrid2D(0, 1, 0, 1, 4, 4, 4)
     assert_array_almost_equal(g.gll, g2.gll)
+
+
+def test_grid2d_element_view():
+    g = SimpleGrid2D(0, 1, 0, 2, 3, 4, 5)
+    rng = np.random.default_rng(0)
+    data = rng.random((2, g.gll1.size, g.gll2.size))
+
+    view = g.element_view(data)
+    assert view.shape == (2, 3, 4, 5, 5)
+    assert np.shares_memory(view, data)
+    for i in range(g.n1):
+        for j in range(g.n2):
+            ind = g.element_gll_indices(i, j)
+            assert_array_almost_equal(
+                view[:, i, j], data[:, ind[0] : ind[1], ind[2] : ind[3]]
+            )
+
+
+def test_grid2d_locate():
+    g = SimpleGrid2D(0, 2, 0, 1, 4, 2, 4)
+
+    points = np.array([[0, 0], [0.75, 0.25], [2, 1]])
+    ind, ref = g.locate(points)
+    assert_array_equal(ind, [[0, 0], [1, 0], [3, 1]])
+    assert_array_almost_equal(ref, [[-1, -1], [0, 0], [1, 1]])
+
+
+def test_grid2d_quadrature_weights():
+    g = Grid2D(np.array([0, 0.3, 1]), np.array([0, 1, 1.5, 2]), 4)
+    w = g.quadrature_weights()
+
+    assert w.shape == g.shape
+    z, x = np.meshgrid(g.gll1, g.gll2, indexing="ij")
+    assert_array_almost_equal(np.sum(w), 2)
+    assert_array_almost_equal(np.sum(w * z**2 * x), 2 / 3)
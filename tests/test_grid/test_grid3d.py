@@ -0,0 +1,52 @@
+from nektsrs.grid import Grid3D, SimpleGrid3D
+from nektsrs.gll import gll
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+import numpy as np
+
+
+def test_simplegrid3d_1elem():
+    g = SimpleGrid3D(-1, 1, -1, 1, -1, 1, 1, 1, 1, 4)
+    assert g.lx == 4
+    assert g.n1 == 1
+    assert g.n2 == 1
+    assert g.n3 == 1
+
+    p, _ = gll(4)
+    assert_array_almost_equal(g.gll1, p)
+    assert_array_almost_equal(g.gll3, p)
+    assert g.gll.shape == (64, 3)
+
+
+def test_grid3d():
+    e = np.linspace(0, 1, 5)
+    g = Grid3D(e, e, 2 * e, 4)
+    assert g.n1 == 4
+    assert g.n3 == 4
+    assert g.end3 == 2
+    assert g.element_edges(1, 2, 3) == (0.25, 0.5, 0.5, 0.75, 1.5, 2)
+
+    g2 = SimpleGrid3D(0, 1, 0, 1, 0, 2, 4, 4, 4, 4)
+    assert_array_almost_equal(g.gll, g2.gll)
+
+
+def test_grid3d_element_view():
+    g = SimpleGrid3D(0, 1, 0, 1, 0, 1, 2, 3, 2, 3)
+    rng = np.random.default_rng(0)
+    data = rng.random((2, g.gll1.size, g.gll2.size, g.gll3.size))
+
+    view = g.element_view(data)
+    assert view.shape == (2, 2, 3, 2, 3, 3, 3)
+    assert np.shares_memory(view, data)
+    ind = g.element_gll_indices(1, 2, 0)
+    assert_array_almost_equal(
+        view[:, 1, 2, 0],
+        data[:, ind[0] : ind[1], ind[2] : ind[3], ind[4] : ind[5]],
+    )
+
+
+def test_grid3d_locate():
+    g = SimpleGrid3D(0, 1, 0, 2, 0, 4, 2, 2, 2, 4)
+
+    ind, ref = g.locate(np.array([[0, 1, 4], [0.75, 0.5, 1]]))
+    assert_array_equal(ind, [[0, 1, 1], [1, 0, 0]])
+    assert_array_almost_equal(ref, [[-1, -1, 1], [0, 0, 0]])
@@ -0,0 +1,40 @@
+from nektsrs.grid import SimpleGrid1D, SimpleGrid2D, SimpleGrid3D
+from nektsrs.grid import flat_data, grid_data
+from numpy.testing import assert_array_equal
+import numpy as np
+import pytest
+
+
+def test_grid_data_flat():
+    g = SimpleGrid3D(0, 1, 0, 2, 0, 3, 2, 1, 3, 3)
+    data = np.arange(2 * np.prod(g.shape)).reshape((2, -1))
+
+    shaped = grid_data(g, data)
+    assert shaped.shape == (2,) + g.shape
+    assert grid_data(g, shaped) is shaped
+
+    # the flattened points follow the order of the gll points
+    x = grid_data(g, g.gll[:, 0])
+    assert_array_equal(x[:, 0, 0], g.gll1)
+    z = grid_data(g, g.gll[:, 2])
+    assert_array_equal(z[0, 0], g.gll3)
+
+
+def test_grid_data_2d():
+    g = SimpleGrid2D(0, 1, 0, 2, 3, 5, 4)
+
+    # the gll points of a Grid2D are ordered with x varying the fastest
+    x = grid_data(g, g.gll[:, 0])
+    y = grid_data(g, g.gll[:, 1])
+    assert x.shape == g.shape
+    assert_array_equal(x[:, 0], g.gll1)
+    assert_array_equal(y[0], g.gll2)
+
+    data = np.stack((g.gll[:, 0], g.gll[:, 1] ** 2))
+    assert_array_equal(flat_data(g, grid_data(g, data)), data)
+
+
+def test_grid_data_incorrect_size():
+    g = SimpleGrid1D(0, 1, 3, 4)
+    with pytest.raises(ValueError):
+        grid_data(g, np.zeros((2, g.gll.size + 1)))
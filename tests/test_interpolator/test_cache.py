@@ -0,0 +1,57 @@
+import numpy as np
+import os
+from nektsrs.interpolator import Interpolator1D, Interpolator2D, OperatorCache
+from nektsrs.grid import SimpleGrid1D, SimpleGrid2D
+from numpy.testing import assert_array_almost_equal
+
+
+def test_cache_operator(tmp_path):
+    cache = OperatorCache(str(tmp_path))
+
+    g = SimpleGrid2D(0, 1, 0, 2, 3, 4, 5)
+    intp = Interpolator2D(g)
+    rng = np.random.default_rng(0)
+    p = np.stack((rng.uniform(0, 1, 11), rng.uniform(0, 2, 11)), axis=1)
+
+    op = cache.operator(intp, p)
+    assert len(os.listdir(str(tmp_path))) == 2
+    op_cached = cache.operator(intp, p)
+    # memory-mapped read-only
+    assert not op_cached.data.flags.writeable
+
+    data = rng.standard_normal(g.gll1.size * g.gll2.size)
+    assert_array_almost_equal(op_cached @ data, intp.operator(p) @ data)
+    assert_array_almost_equal(op @ data, intp.operator(p) @ data)
+
+
+def test_cache_key():
+    intp = Interpolator1D(SimpleGrid1D(0, 1, 3, 4))
+    p = np.linspace(0, 1, 5)
+
+    key = OperatorCache.key(intp, p)
+    assert key == OperatorCache.key(intp, p.copy())
+    assert key != OperatorCache.key(intp, p[:-1])
+    assert key != OperatorCache.key(
+        Interpolator1D(SimpleGrid1D(0, 1, 3, 5)), p
+    )
+    assert key != OperatorCache.key(
+        Interpolator1D(SimpleGrid1D(0, 1, 4, 4)), p
+    )
+
+
+def test_cache_evict(tmp_path):
+    intp = Interpolator1D(SimpleGrid1D(0, 1, 3, 4))
+    cache = OperatorCache(str(tmp_path), max_bytes=2**20)
+
+    keys = []
+    for i in range(3):
+        p = np.linspace(0, 1, 10000 + i)
+        cache.operator(intp, p)
+        keys.append(cache.key(intp, p))
+        os.utime(cache.path(keys[-1], "weights"), (i, i))
+
+    # each operator takes about 0.5 MiB, so only two fit
+    cache.evict()
+    assert not os.path.exists(cache.path(keys[0], "weights"))
+    assert os.path.exists(cache.path(keys[1], "weights"))
+    assert os.path.exists(cache.path(keys[2], "weights"))
@@ -1,7 +1,8 @@
 import numpy as np
 
 from nektsrs.interpolator import Interpolator1D
-from nektsrs.grid import SimpleGrid1D
+from nektsrs.interpolator.interpolator1d import apply_operator
+from nektsrs.grid import Grid1D, SimpleGrid1D
 from numpy.testing import assert_array_almost_equal
 
 
@@ -45,3 +46,91 @@ def test_interpolator1d():
     assert_array_almost_equal(v, data)
 
     pass
+
+
+def test_interpolator1d_float32():
+    g = SimpleGrid1D(0, 1, 5, 4)
+    intp = Interpolator1D(g)
+
+    data = g.gll.astype(np.float32)
+    p = np.linspace(0, 1, 7)
+    v = intp.interpolate(data, p)
+    assert v.dtype == np.float32
+    assert_array_almost_equal(v, p)
+
+
+def test_interpolator1d_reference():
+    rng = np.random.default_rng(0)
+    edges = np.cumsum(rng.random(9))
+    g = Grid1D(edges, 6)
+    intp = Interpolator1D(g)
+
+    data = np.sin(3 * g.gll) + rng.standard_normal(g.gll.size) * 0.1
+    p = np.concatenate((rng.uniform(g.start, g.end, 50), edges, g.gll))
+
+    v = intp.interpolate(data, p)
+    assert_array_almost_equal(v, intp.interpolate_reference(data, p))
+    assert_array_almost_equal(v, intp.interpolate2(data, p))
+    assert_array_almost_equal(intp.interpolate(data, g.gll), data)
+
+
+def test_interpolator1d_operator():
+    g = SimpleGrid1D(0, 2, 7, 5)
+    intp = Interpolator1D(g)
+
+    rng = np.random.default_rng(1)
+    data = rng.standard_normal((g.gll.size, 3))
+    p = np.linspace(0, 2, 23)
+
+    op = intp.operator(p)
+    assert op.shape == (p.size, g.gll.size)
+    assert op.nnz == p.size * g.lx
+    v = op @ data
+    for i in range(3):
+        assert_array_almost_equal(v[:, i], intp.interpolate(data[:, i], p))
+
+
+def test_interpolator1d_batch():
+    g = SimpleGrid1D(0, 1, 4, 6)
+    intp = Interpolator1D(g)
+
+    rng = np.random.default_rng(4)
+    data = rng.standard_normal((5, 2, g.gll.size)).astype(np.float32)
+    p = rng.uniform(0, 1, 13)
+
+    v = intp.interpolate(data, p)
+    assert v.shape == (5, 2, 13)
+    assert v.dtype == np.float32
+    for i in range(5):
+        for j in range(2):
+            assert_array_almost_equal(
+                v[i, j], intp.interpolate(data[i, j], p), decimal=5
+            )
+
+
+def test_apply_operator_dtype():
+    g = SimpleGrid1D(0, 1, 3, 5)
+    op = Interpolator1D(g).operator(np.linspace(0, 1, 7))
+    data = np.stack((g.gll, g.gll**2))
+
+    for dtype in [np.float16, np.float32, np.float64]:
+        v = apply_operator(op, data.astype(dtype))
+        assert v.dtype == dtype
+        assert_array_almost_equal(v[0], np.linspace(0, 1, 7), decimal=2)
+    assert op.dtype == np.float64
+
+
+def test_interpolator1d_element_stats():
+    g = SimpleGrid1D(0, 1, 6, 5)
+    intp = Interpolator1D(g)
+    rng = np.random.default_rng(6)
+    data = rng.random(g.gll.size)
+    data[: g.lx] = 2.0
+
+    means, stds = intp.data_element_stats(data)
+    assert means.shape == (6,)
+    assert stds[0] == 1.0
+    for i in range(1, g.n):
+        ind = g.element_gll_indices(i)
+        assert_array_almost_equal(means[i], np.mean(data[ind[0] : ind[1]]))
+        assert_array_almost_equal(stds[i], np.std(data[ind[0] : ind[1]]))
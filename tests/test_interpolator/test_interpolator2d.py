@@ -1,6 +1,6 @@
 import numpy as np
 from nektsrs.interpolator import Interpolator2D, Interpolator1D
-from nektsrs.grid import SimpleGrid2D, SimpleGrid1D
+from nektsrs.grid import SimpleGrid2D, SimpleGrid1D, flat_data
 from numpy.testing import assert_array_almost_equal
 
 
@@ -62,3 +62,109 @@ def test_interpolator2d_large():
     #    assert_array_almost_equal(v, data)
 
     pass
+
+
+def test_interpolator2d_float32():
+    g = SimpleGrid2D(-1, 1, -1, 1, 2, 2, 4)
+    intp = Interpolator2D(g)
+
+    data = np.add.outer(g.gll1, g.gll2).astype(np.float32)
+    p = np.array([[0.1, 0.2], [-0.5, 0.7]])
+    v = intp.interpolate(data, p)
+    assert v.dtype == np.float32
+    assert_array_almost_equal(v, p[:, 0] + p[:, 1])
+
+
+def test_interpolator2d_operator():
+    g = SimpleGrid2D(0, 1, 0, 2, 3, 4, 4)
+    intp = Interpolator2D(g)
+
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((g.gll1.size, g.gll2.size))
+    p = np.stack((rng.uniform(0, 1, 20), rng.uniform(0, 2, 20)), axis=1)
+
+    op = intp.operator(p)
+    assert op.shape == (20, data.size)
+    assert op.nnz == 20 * g.lx**2
+    assert_array_almost_equal(
+        op @ flat_data(g, data), intp.interpolate(data, p)
+    )
+
+    # flat data in the order of the gll points
+    v = intp.interpolate(g.gll[:, 0] ** 2, [[0.3, 1.1]])
+    assert_array_almost_equal(v, [0.09])
+
+
+def test_interpolator2d_reference():
+    g = SimpleGrid2D(-1, 1, 0, 3, 4, 3, 5)
+    intp = Interpolator2D(g)
+
+    rng = np.random.default_rng(2)
+    data = np.sin(np.add.outer(g.gll1, 2 * g.gll2))
+    data += rng.standard_normal(data.shape) * 0.1
+    p = np.stack((rng.uniform(-1, 1, 30), rng.uniform(0, 3, 30)), axis=1)
+    p = np.concatenate((p, [[-1, 0], [1, 3], [0, 1.5]]))
+
+    v = intp.interpolate(data, p)
+    assert_array_almost_equal(v, intp.interpolate_reference(data, p))
+
+
+def test_interpolator2d_grid():
+    g = SimpleGrid2D(-1, 1, 0, 3, 4, 3, 5)
+    intp = Interpolator2D(g)
+
+    rng = np.random.default_rng(3)
+    data = rng.standard_normal((g.gll1.size, g.gll2.size))
+    x = np.linspace(-1, 1, 9)
+    y = np.linspace(0, 3, 11)
+
+    v = intp.interpolate_grid(data, x, y)
+    assert v.shape == (x.size, y.size)
+
+    xx, yy = np.meshgrid(x, y, indexing="ij")
+    p = np.stack((xx.ravel(), yy.ravel()), axis=1)
+    assert_array_almost_equal(v.ravel(), intp.interpolate(data, p))
+    assert_array_almost_equal(
+        intp.interpolate_grid(data, g.gll1, g.gll2), data
+    )
+
+
+def test_interpolator2d_batch():
+    g = SimpleGrid2D(0, 1, 0, 2, 3, 2, 4)
+    intp = Interpolator2D(g)
+
+    rng = np.random.default_rng(5)
+    data = rng.standard_normal((4, 3, g.gll1.size, g.gll2.size))
+    p = np.stack((rng.uniform(0, 1, 7), rng.uniform(0, 2, 7)), axis=1)
+    x = np.linspace(0, 1, 5)
+    y = np.linspace(0, 2, 6)
+
+    v = intp.interpolate(data, p)
+    w = intp.interpolate_grid(data, x, y)
+    assert v.shape == (4, 3, 7)
+    assert w.shape == (4, 3, 5, 6)
+    for i in range(4):
+        for j in range(3):
+            assert_array_almost_equal(v[i, j], intp.interpolate(data[i, j], p))
+            assert_array_almost_equal(
+                w[i, j], intp.interpolate_grid(data[i, j], x, y)
+            )
+
+    flat = flat_data(g, data)
+    assert_array_almost_equal(intp.interpolate(flat, p), v)
+
+
+def test_interpolator2d_element_stats():
+    g = SimpleGrid2D(0, 1, 0, 1, 3, 2, 4)
+    intp = Interpolator2D(g)
+    rng = np.random.default_rng(6)
+    data = rng.random((g.gll1.size, g.gll2.size))
+
+    means, stds = intp.data_element_stats(flat_data(g, data))
+    assert means.shape == (3, 2)
+    for i in range(g.n1):
+        for j in range(g.n2):
+            ind = g.element_gll_indices(i, j)
+            element = data[ind[0] : ind[1], ind[2] : ind[3]]
+            assert_array_almost_equal(means[i, j], np.mean(element))
+            assert_array_almost_equal(stds[i, j], np.std(element))
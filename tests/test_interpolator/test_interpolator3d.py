@@ -0,0 +1,63 @@
+import numpy as np
+from nektsrs.interpolator import Interpolator3D
+from nektsrs.grid import SimpleGrid3D
+from numpy.testing import assert_array_almost_equal
+
+
+def test_interpolator3d_polynomial():
+    g = SimpleGrid3D(0, 1, 0, 2, -1, 1, 2, 3, 2, 4)
+    intp = Interpolator3D(g)
+
+    # a polynomial of degree lx - 1 along each axis is exact
+    x, y, z = np.meshgrid(g.gll1, g.gll2, g.gll3, indexing="ij")
+    data = x**3 - 2 * x * y**2 + z**3 * y
+
+    rng = np.random.default_rng(1)
+    p = np.stack(
+        (rng.uniform(0, 1, 50), rng.uniform(0, 2, 50), rng.uniform(-1, 1, 50)),
+        axis=1,
+    )
+    expected = (
+        p[:, 0] ** 3 - 2 * p[:, 0] * p[:, 1] ** 2 + p[:, 2] ** 3 * p[:, 1]
+    )
+
+    assert_array_almost_equal(intp.interpolate(data, p), expected)
+    assert_array_almost_equal(intp.interpolate(data, p, chunk=7), expected)
+    assert_array_almost_equal(intp.operator(p) @ data.ravel(), expected)
+
+
+def test_interpolator3d_grid():
+    g = SimpleGrid3D(0, 1, 0, 1, 0, 1, 3, 2, 2, 5)
+    intp = Interpolator3D(g)
+
+    rng = np.random.default_rng(3)
+    data = rng.standard_normal((2, 3) + intp.shape)
+    x = np.linspace(0, 1, 11)
+    y = np.linspace(0, 1, 4)
+    z = np.linspace(0, 1, 6)
+
+    v = intp.interpolate_grid(data, x, y, z, slab=3)
+    assert v.shape == (2, 3, 11, 4, 6)
+    assert_array_almost_equal(v, intp.interpolate_grid(data, x, y, z))
+
+    xx, yy, zz = np.meshgrid(x, y, z, indexing="ij")
+    p = np.stack((xx.ravel(), yy.ravel(), zz.ravel()), axis=1)
+    assert_array_almost_equal(v.reshape((2, 3, -1)), intp.interpolate(data, p))
+    assert_array_almost_equal(
+        intp.interpolate_grid(data, g.gll1, g.gll2, g.gll3), data
+    )
+
+
+def test_interpolator3d_float32():
+    g = SimpleGrid3D(0, 1, 0, 1, 0, 1, 2, 2, 2, 4)
+    intp = Interpolator3D(g)
+    data = np.ones(intp.shape, dtype=np.float32)
+    x = np.linspace(0, 1, 5)
+
+    v = intp.interpolate_grid(data, x, x, x)
+    assert v.dtype == np.float32
+    assert_array_almost_equal(v, 1)
+
+    means, stds = intp.data_element_stats(data.ravel())
+    assert means.shape == (2, 2, 2)
+    assert_array_almost_equal(stds, 1)
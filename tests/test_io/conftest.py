@@ -0,0 +1,33 @@
+from nektsrs.io import write_pts
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def pts_dir(tmp_path):
+    """Three overlapping pts files with basename test and shuffled ids.
+
+    Returns the directory and the expected combined t, locs and data.
+    """
+    rng = np.random.default_rng(42)
+    npoints = 6
+    nfields = 2
+    t = np.arange(20) * 0.1
+    locs = rng.random((npoints, 3))
+    data = rng.random((t.size, nfields, npoints))
+    ids = rng.permutation(npoints)
+
+    # (writetime, first snapshot, end snapshot), written out of order
+    segments = [(1.0, 8, 15), (0.0, 0, 10), (2.0, 14, 20)]
+    for i, (writetime, start, end) in enumerate(segments):
+        fname = tmp_path / f"ptstest{i % 2}.f{i + 1:05d}"
+        write_pts(
+            str(fname),
+            t[start:end],
+            locs[ids],
+            np.transpose(data[start:end, :, ids], (2, 0, 1)),
+            writetime,
+            ids=ids,
+        )
+
+    return str(tmp_path), t, locs, data
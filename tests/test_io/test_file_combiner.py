@@ -1,4 +1,9 @@
-from nektsrs.io import FileCombiner
+from nektsrs.io import FileCombiner, write_pts
+from nektsrs.io.file_combiner import trim_ranges
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+import h5py
+import numpy as np
+import pytest
 import os
 import sys
 
@@ -13,3 +18,124 @@ def test_file_combiner():
 
     fc = FileCombiner("test", f)
     fc
+
+
+def test_file_combiner_overlap(pts_dir):
+    path, t, locs, data = pts_dir
+    fc = FileCombiner("test", path)
+
+    assert fc.nt == t.size
+    assert_array_almost_equal(fc.t, t)
+    assert_array_almost_equal(fc.locs, locs)
+    assert_array_almost_equal(fc.data, data)
+
+
+def test_file_combiner_stream(pts_dir, tmp_path):
+    path, t, locs, data = pts_dir
+    out = str(tmp_path / "stream.hdf5")
+    FileCombiner.stream_to_hdf5("test", out, path)
+
+    fc = FileCombiner("test", path)
+    fc.save(str(tmp_path / "memory.hdf5"))
+
+    with h5py.File(out, "r") as f, h5py.File(
+        str(tmp_path / "memory.hdf5"), "r"
+    ) as g:
+        for key in ["t", "locs", "data"]:
+            assert f[key].dtype == g[key].dtype
+            assert_array_equal(f[key][()], g[key][()])
+        for key in g.attrs:
+            assert_array_equal(f.attrs[key], g.attrs[key])
+        assert_array_almost_equal(f["data"][()], data)
+
+
+def test_file_combiner_workers(pts_dir):
+    path, t, locs, data = pts_dir
+    fc = FileCombiner("test", path)
+    fc_par = FileCombiner("test", path, workers=2)
+
+    assert_array_equal(fc_par.t, fc.t)
+    assert_array_equal(fc_par.locs, fc.locs)
+    assert_array_equal(fc_par.data, fc.data)
+
+
+def test_file_combiner_append(pts_dir, tmp_path):
+    path, t, locs, data = pts_dir
+    last = os.path.join(path, "ptstest0.f00003")
+    os.rename(last, last + ".hidden")
+
+    stream_out = str(tmp_path / "stream.hdf5")
+    save_out = str(tmp_path / "save.hdf5")
+    FileCombiner.stream_to_hdf5("test", stream_out, path)
+    FileCombiner("test", path).save(save_out)
+
+    with h5py.File(stream_out, "r") as f:
+        assert f.attrs["nt"] == 15
+
+    os.rename(last + ".hidden", last)
+    FileCombiner.stream_to_hdf5("test", stream_out, path, append=True)
+    FileCombiner("test", path).save(save_out, append=True)
+
+    for out in [stream_out, save_out]:
+        with h5py.File(out, "r") as f:
+            assert f.attrs["nt"] == t.size
+            assert_array_almost_equal(f.attrs["timespan"], [t[0], t[-1]])
+            assert_array_equal(f["t"][()], t)
+            assert_array_almost_equal(f["data"][()], data)
+
+
+def test_file_combiner_append_mismatch(pts_dir, tmp_path):
+    path, t, locs, data = pts_dir
+    out = str(tmp_path / "out.hdf5")
+    fc = FileCombiner("test", path)
+    fc.save(out)
+
+    fc.locs = fc.locs + 1
+    with pytest.raises(ValueError):
+        fc.save(out, append=True)
+
+
+def test_file_combiner_stream_append_mismatch(pts_dir, tmp_path):
+    path, t, locs, data = pts_dir
+    out = str(tmp_path / "out.hdf5")
+    FileCombiner.stream_to_hdf5("test", out, path)
+
+    # a later file with shifted points
+    t_new = t[-1] + 0.1 * np.arange(1, 4)
+    write_pts(
+        os.path.join(path, "ptstest1.f00004"),
+        t_new,
+        locs + 1,
+        np.zeros((locs.shape[0], t_new.size, data.shape[1])),
+        3.0,
+    )
+    with pytest.raises(ValueError):
+        FileCombiner.stream_to_hdf5("test", out, path, append=True)
+
+    with h5py.File(out, "r") as f:
+        assert f.attrs["nt"] == t.size
+        assert_array_equal(f["t"][()], t)
+        assert f["data"].shape[0] == t.size
+
+
+def test_file_combiner_dtype(pts_dir, tmp_path):
+    path, t, locs, data = pts_dir
+    out = str(tmp_path / "out.hdf5")
+
+    fc = FileCombiner("test", path, dtype=np.float32)
+    assert fc.data.dtype == np.float32
+    fc.save(out)
+    with h5py.File(out, "r") as f:
+        assert f["data"].dtype == np.float32
+
+    FileCombiner.stream_to_hdf5("test", out, path, dtype=np.float32)
+    with h5py.File(out, "r") as f:
+        assert f["data"].dtype == np.float32
+        assert_array_almost_equal(f["data"][()], data)
+
+
+def test_trim_ranges():
+    times = [np.arange(0, 10), np.arange(8, 15), np.arange(3, 9), []]
+    times = [np.asarray(i, dtype=float) for i in times]
+    assert trim_ranges(times) == [(0, 10), (2, 7), (6, 6), (0, 0)]
+    assert trim_ranges(times, 12) == [(10, 10), (5, 7), (6, 6), (0, 0)]
@@ -0,0 +1,64 @@
+from nektsrs.io import FileCombiner, dataset_options, open_hdf5, parse_layout
+from nektsrs.io.layout import chunk_shape
+from numpy.testing import assert_array_equal
+import numpy as np
+import pytest
+
+
+def test_chunk_shape():
+    shape = (1000, 4, 10**6)
+    assert chunk_shape(None, shape, 8) is None
+    assert chunk_shape("contiguous", shape, 8, resizable=True) is True
+    assert chunk_shape("time-major", shape, 8) == (1, 4, 2**15)
+    assert chunk_shape("point-major", shape, 8) == (1000, 4, 32)
+    assert chunk_shape((2000, 8, 10), shape, 8) == (1000, 4, 10)
+    assert chunk_shape((2000, 8, 10), shape, 8, True) == (2000, 4, 10)
+
+    planes = (1000, 4, 500, 300)
+    assert chunk_shape("time-major", planes, 8) == (1, 4, 109, 300)
+    assert chunk_shape((10, 1, 8, 8), planes, 8) == (10, 1, 8, 8)
+
+    with pytest.raises(ValueError):
+        chunk_shape("row-major", shape, 8)
+    with pytest.raises(ValueError):
+        chunk_shape((1, 1), shape, 8)
+
+
+def test_dataset_options():
+    options = dataset_options((10, 2, 5), np.float64, compression="gzip-4")
+    assert options == {
+        "compression": "gzip",
+        "compression_opts": 4,
+        "shuffle": True,
+        "chunks": True,
+    }
+
+    options = dataset_options((10, 2, 5), np.float64, "time-major", "lzf")
+    assert options["chunks"] == (1, 2, 5)
+
+    options = dataset_options((10, 2, 5), np.float64, resizable=True)
+    assert options["maxshape"] == (None, 2, 5)
+
+    with pytest.raises(ValueError):
+        dataset_options((10, 2, 5), np.float64, compression="lzf-3")
+
+
+def test_parse_layout():
+    assert parse_layout(None) is None
+    assert parse_layout("time-major") == "time-major"
+    assert parse_layout("16,4,1024") == (16, 4, 1024)
+
+
+def test_save_layout(pts_dir, tmp_path):
+    path, t, locs, data = pts_dir
+    fc = FileCombiner("test", path)
+
+    for layout, compression in [("point-major", "gzip"), ((4, 1, 2), None)]:
+        out = str(tmp_path / "out.hdf5")
+        fc.save(out, layout=layout, compression=compression)
+
+        with open_hdf5(out) as f:
+            assert f["data"].compression == compression
+            assert_array_equal(f["data"][()], fc.data)
+            if isinstance(layout, tuple):
+                assert f["data"].chunks == layout
@@ -0,0 +1,48 @@
+from nektsrs.io import Manifest, Header
+from numpy.testing import assert_array_equal
+import os
+
+
+def test_manifest_refresh(pts_dir):
+    path, t, _, _ = pts_dir
+    m = Manifest("test", path)
+    m.refresh()
+
+    assert os.path.exists(m.fname)
+    assert len(m.entries) == 3
+    assert [h.time for h in m.headers] == [0.0, 1.0, 2.0]
+    assert_array_equal(m.times[0], t[:10])
+    assert m.truncated == []
+
+    h = Header(m.datafiles[1])
+    assert m.headers[1].to_dict() == h.to_dict()
+    assert m.entries[1]["offsets"]["data"] == h.data_offset
+    assert m.entries[1]["size"] == h.nbytes
+
+
+def test_manifest_incremental(pts_dir, monkeypatch):
+    path, _, _, _ = pts_dir
+    Manifest("test", path).refresh()
+
+    indexed = []
+    index_file = Manifest.index_file
+
+    def spy(fname, stat):
+        indexed.append(fname)
+        return index_file(fname, stat)
+
+    monkeypatch.setattr(Manifest, "index_file", staticmethod(spy))
+
+    m = Manifest("test", path)
+    m.refresh()
+    assert indexed == []
+
+    # truncate one of the files
+    fname = m.datafiles[2]
+    with open(fname, "r+b") as f:
+        f.truncate(os.path.getsize(fname) - 8)
+
+    m = Manifest("test", path)
+    m.refresh()
+    assert indexed == [fname]
+    assert m.truncated == [fname]
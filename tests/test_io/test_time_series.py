@@ -1,4 +1,7 @@
-from nektsrs.io import TimeSeries
+from nektsrs.io import TimeSeries, write_pts
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+import numpy as np
+import pytest
 import os
 import sys
 
@@ -27,3 +30,124 @@ def test_ts_collate():
     ts.collate_data()
 
     assert ts.data.shape == (ts.nt, ts.nfields, ts.npoints)
+
+
+def test_ts_read_roundtrip(tmp_path):
+    rng = np.random.default_rng(0)
+    t = np.linspace(0, 1, 6)
+    locs = rng.random((5, 3))
+    data = rng.random((5, 6, 2))
+    ids = np.array([3, 0, 4, 1, 2])
+
+    for emode in ["<", ">"]:
+        fname = str(tmp_path / f"pts{emode == '<'}.f00001")
+        write_pts(fname, t, locs, data, 1.5, ids=ids, emode=emode)
+        ts = TimeSeries.read(fname)
+
+        order = np.argsort(ids)
+        assert ts.writetime == 1.5
+        assert_array_equal(ts.t, t)
+        assert_array_equal(ts.id_list, np.arange(5))
+        assert_array_equal(ts.locs, locs[order])
+        assert_array_equal(ts.data, data[order])
+
+        ts = TimeSeries.read(fname, sort=False)
+        assert_array_equal(ts.id_list, ids)
+        assert_array_equal(ts.data, data)
+
+
+def test_ts_open_mmap(tmp_path):
+    rng = np.random.default_rng(1)
+    t = np.linspace(0, 1, 7)
+    locs = rng.random((4, 2))
+    data = rng.random((4, 7, 3))
+    fname = str(tmp_path / "pts.f00001")
+    write_pts(fname, t, locs, data, wdsizef=4, emode=">")
+
+    ts = TimeSeries.open(fname)
+    assert isinstance(ts.data, np.memmap)
+    assert ts.data.shape == (ts.nt, ts.nfields, ts.npoints)
+    assert_array_equal(ts.t, t)
+    assert_array_equal(ts.locs, locs)
+    assert_array_almost_equal(ts.data[2:5, 1, [0, 3]], data[[0, 3], 2:5, 1].T)
+
+    ts_eager = TimeSeries.open(fname, mmap=False)
+    assert_array_equal(ts.data, ts_eager.data)
+
+
+def test_ts_open_order(tmp_path):
+    rng = np.random.default_rng(2)
+    t = np.linspace(0, 1, 5)
+    locs = rng.random((6, 3))
+    data = rng.random((6, 5, 2))
+    ids = np.array([4, 1, 5, 0, 3, 2])
+    fname = str(tmp_path / "pts.f00001")
+    write_pts(fname, t, locs, data, ids=ids)
+
+    ts = TimeSeries.open(fname, mmap=True)
+    ts_eager = TimeSeries.open(fname, mmap=False)
+    assert_array_equal(ts.id_list, ts_eager.id_list)
+    assert_array_equal(ts.locs, ts_eager.locs)
+    assert_array_equal(ts.data, ts_eager.data)
+    assert_array_equal(ts.id_list, ids)
+
+
+def test_ts_open_truncated(tmp_path):
+    fname = str(tmp_path / "pts.f00001")
+    write_pts(fname, np.zeros(3), np.zeros((2, 2)), np.zeros((2, 3, 1)))
+    with open(fname, "r+b") as f:
+        f.truncate(os.path.getsize(fname) - 8)
+
+    with pytest.raises(ValueError):
+        TimeSeries.open(fname)
+    with pytest.raises(ValueError):
+        TimeSeries.read(fname)
+
+
+def test_ts_read_dtype(tmp_path):
+    fname = str(tmp_path / "pts.f00001")
+    data = np.random.default_rng(2).random((3, 4, 2))
+    write_pts(fname, np.arange(4.0), np.zeros((3, 2)), data, wdsizef=4)
+
+    ts = TimeSeries.read(fname)
+    assert ts.data.dtype == np.float32
+    assert_array_almost_equal(ts.data, data)
+
+    ts = TimeSeries.read(fname, dtype=np.float64)
+    assert ts.data.dtype == np.float64
+
+    write_pts(fname, np.arange(4.0), np.zeros((3, 2)), data, emode=">")
+    ts = TimeSeries.open(fname, mmap=False, dtype=np.float32)
+    assert ts.data.dtype == np.float32
+    assert ts.data.dtype.isnative
+    with pytest.raises(ValueError):
+        TimeSeries.open(fname, dtype=np.float32)
+
+
+def test_ts_read_selection(tmp_path):
+    rng = np.random.default_rng(3)
+    t = np.arange(10) * 0.5
+    locs = rng.random((6, 3))
+    data = rng.random((6, 10, 4))
+    ids = np.array([4, 2, 0, 5, 1, 3])
+    fname = str(tmp_path / "pts.f00001")
+    write_pts(fname, t, locs, data, ids=ids, emode=">")
+
+    ts = TimeSeries.read(
+        fname, fields=[3, 1], points=[5, 0, 2], time_range=(1.0, 3.0)
+    )
+    pos = [2, 1, 3]
+    assert ts.data.shape == (3, 5, 2)
+    assert ts.nfields == 2
+    assert_array_equal(ts.id_list, [0, 2, 5])
+    assert_array_equal(ts.t, t[2:7])
+    assert_array_equal(ts.locs, locs[pos])
+    assert_array_equal(ts.data, data[pos][:, 2:7][:, :, [3, 1]])
+
+    ts = TimeSeries.read(fname, fields=[0])
+    assert_array_equal(ts.data[..., 0], data[np.argsort(ids), :, 0])
+
+    with pytest.raises(ValueError):
+        TimeSeries.read(fname, points=[6])
+    with pytest.raises(ValueError):
+        TimeSeries.read(fname, fields=[4])
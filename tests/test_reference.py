@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from nektsrs.gll import gll
+from nektsrs.reference import ReferenceElement, reference_element
+from numpy.polynomial.legendre import legval
+from numpy.testing import assert_array_almost_equal
+
+
+def test_reference_element_cached():
+    ref = reference_element(6)
+    assert reference_element(6) is ref
+    assert reference_element(np.int64(6)) is ref
+    assert reference_element(5) is not ref
+
+    with pytest.raises(ValueError):
+        ref.nodes[0] = 0
+
+
+def test_reference_element_gll():
+    ref = ReferenceElement(7)
+    p, w = gll(7)
+    assert_array_almost_equal(ref.nodes, p)
+    assert_array_almost_equal(ref.weights, w)
+    assert_array_almost_equal(np.sum(ref.weights), 2)
+
+
+@pytest.mark.parametrize("lx", [2, 5, 8])
+def test_reference_element_differentiation(lx):
+    ref = reference_element(lx)
+    x = ref.nodes
+
+    # polynomials of degree lx - 1 are differentiated exactly
+    assert_array_almost_equal(
+        ref.diff_matrix @ x ** (lx - 1), (lx - 1) * x ** (lx - 2)
+    )
+    assert_array_almost_equal(ref.diff_matrix @ np.ones(lx), 0)
+
+
+def test_reference_element_vandermonde():
+    ref = reference_element(6)
+    coeffs = np.random.default_rng(0).random(6)
+
+    values = ref.vandermonde @ coeffs
+    assert_array_almost_equal(values, legval(ref.nodes, coeffs))
+    assert_array_almost_equal(ref.inv_vandermonde @ values, coeffs)
+
+
+def test_reference_element_interpolation_matrix():
+    ref = reference_element(5)
+    points = np.array([-1, -0.3, 0.2, 1])
+
+    mat = ref.interpolation_matrix(points)
+    assert mat.shape == (4, 5)
+    assert_array_almost_equal(mat @ ref.nodes**3, points**3)
+    assert_array_almost_equal(mat[0], np.eye(5)[0])
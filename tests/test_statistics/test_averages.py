@@ -0,0 +1,68 @@
+import h5py
+import numpy as np
+import pytest
+from nektsrs.grid import Grid1D, SimpleGrid2D, flat_data
+from nektsrs.statistics import spatial_average, time_average
+from numpy.testing import assert_array_almost_equal
+
+
+@pytest.fixture
+def plane(tmp_path):
+    """An hdf5 file with u = t * (z + x**2) and v = 1 on a 2D grid."""
+    g = SimpleGrid2D(0, 1, 0, 2, 3, 4, 5)
+    z, x = g.gll[:, 0], g.gll[:, 1]
+    t = np.linspace(0, 1, 21)
+
+    # the points of the file are in the order of the gll points
+    data = np.empty((t.size, 2, z.size))
+    data[:, 0] = t[:, np.newaxis] * (z + x**2)
+    data[:, 1] = 1
+
+    path = tmp_path / "plane.hdf5"
+    with h5py.File(path, "w") as f:
+        f.create_dataset("t", data=t)
+        f.create_dataset("data", data=data, chunks=(4, 2, z.size))
+    return path, g, t, data
+
+
+def test_spatial_average():
+    g = Grid1D(np.array([0, 0.2, 0.5, 1]), 5)
+
+    # exact for polynomials, unlike the plain mean
+    assert_array_almost_equal(spatial_average(g, g.gll**3), 0.25)
+    assert_array_almost_equal(np.sum(g.quadrature_weights()), 1)
+
+    g2 = SimpleGrid2D(0, 1, 0, 2, 3, 4, 5)
+    z, x = np.meshgrid(g2.gll1, g2.gll2, indexing="ij")
+    data = np.stack((z * x, z + x**2))
+
+    assert_array_almost_equal(
+        spatial_average(g2, data, axes=1), [z[:, 0], z[:, 0] + 4 / 3]
+    )
+    assert_array_almost_equal(
+        spatial_average(g2, flat_data(g2, data)), [0.5, 0.5 + 4 / 3]
+    )
+    assert_array_almost_equal(spatial_average(g2, data, axes=()), data)
+
+    # flat data in the order of the gll points
+    flat = g2.gll[:, 0] ** 2
+    assert_array_almost_equal(spatial_average(g2, flat, axes=1), g2.gll1**2)
+
+
+def test_time_average(plane):
+    path, g, t, data = plane
+    z = g.gll1
+
+    mean = time_average(path, g, axes=1, budget=1)
+    assert mean.shape == (2, z.size)
+    assert_array_almost_equal(mean[0], 0.5 * (z + 4 / 3))
+    assert_array_almost_equal(mean[1], 1)
+
+    mean = time_average(path, g, fields=[1, 0], time_range=(0.5, 1))
+    assert_array_almost_equal(mean, [1, 0.75 * (0.5 + 4 / 3)])
+
+    mean = time_average(path, g, axes=())
+    assert_array_almost_equal(flat_data(g, mean), np.mean(data, axis=0))
+
+    with pytest.raises(ValueError):
+        time_average(path, g, time_range=(2, 3))
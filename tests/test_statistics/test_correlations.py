@@ -0,0 +1,69 @@
+import h5py
+import numpy as np
+import pytest
+from nektsrs.statistics import two_point_correlation
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+
+def direct_correlation(data, lag1, lag2, periodic):
+    """R(lag1, lag2) of the fluctuations by direct summation."""
+    fluct = data - np.mean(data, axis=0)
+    n1, n2 = data.shape[-2:]
+    total = 0
+    count = 0
+    for i in range(n1):
+        for j in range(n2):
+            k, m = i + lag1, j + lag2
+            if periodic[0]:
+                k %= n1
+            if periodic[1]:
+                m %= n2
+            if 0 <= k < n1 and 0 <= m < n2:
+                total = total + np.mean(fluct[..., i, j] * fluct[..., k, m], 0)
+                count += 1
+    return total / count
+
+
+@pytest.fixture
+def planes(tmp_path):
+    rng = np.random.default_rng(6)
+    t = np.arange(12) * 0.1
+    data = 2 + rng.standard_normal((t.size, 2, 6, 5))
+    data[:, 1] += np.roll(data[:, 1], 1, axis=-1)
+
+    path = tmp_path / "planes.hdf5"
+    with h5py.File(path, "w") as f:
+        f.create_dataset("t", data=t)
+        f.create_dataset("data", data=data)
+    return path, data
+
+
+@pytest.mark.parametrize(
+    "periodic", [(True, True), (True, False), (False, False)]
+)
+def test_two_point_correlation(planes, periodic):
+    path, data = planes
+
+    lags, corr = two_point_correlation(path, periodic, budget=1)
+    assert corr.shape == (2, lags[0].size, lags[1].size)
+    for i, lag1 in enumerate(lags[0]):
+        for j, lag2 in enumerate(lags[1]):
+            assert_array_almost_equal(
+                corr[:, i, j], direct_correlation(data, lag1, lag2, periodic)
+            )
+
+
+def test_two_point_correlation_options(planes):
+    path, data = planes
+
+    lags, corr = two_point_correlation(
+        path, (False, True), fields=[1], time_range=(0.2, 0.8)
+    )
+    assert_array_equal(lags[0], np.arange(-5, 6))
+    assert_array_equal(lags[1], np.arange(-2, 3))
+    assert_array_almost_equal(
+        corr[:, 5, 2], np.mean(np.var(data[2:9, [1]], axis=0), axis=(-2, -1))
+    )
+
+    with pytest.raises(ValueError):
+        two_point_correlation(path, (True,))
@@ -0,0 +1,101 @@
+import h5py
+import numpy as np
+import pytest
+from nektsrs.statistics import Moments, file_moments
+from numpy.testing import assert_array_almost_equal
+
+
+def reference_moments(data):
+    mean = np.mean(data, axis=0)
+    dev = data - mean
+    var = np.mean(dev**2, axis=0)
+    return (
+        mean,
+        var,
+        np.mean(dev**3, axis=0) / var**1.5,
+        np.mean(dev**4, axis=0) / var**2,
+        np.mean(dev[:, 0] * dev[:, 2], axis=0),
+    )
+
+
+@pytest.fixture
+def series(tmp_path):
+    rng = np.random.default_rng(4)
+    t = np.arange(50) * 0.1
+    data = 3 + rng.gamma(2.0, size=(t.size, 3, 8))
+    data[:, 2] += 2 * data[:, 0]
+
+    path = tmp_path / "series.hdf5"
+    with h5py.File(path, "w") as f:
+        f.create_dataset("t", data=t)
+        f.create_dataset("data", data=data, chunks=(5, 3, 8))
+    return path, t, data
+
+
+def check(moments, data):
+    mean, var, skew, flat, cov = reference_moments(data)
+    assert moments.n == data.shape[0]
+    assert_array_almost_equal(moments.mean, mean)
+    assert_array_almost_equal(moments.variance, var)
+    assert_array_almost_equal(moments.skewness, skew)
+    assert_array_almost_equal(moments.flatness, flat)
+    assert_array_almost_equal(moments.covariance[1], cov)
+
+
+def test_moments_merge(series):
+    _, _, data = series
+
+    # uneven chunks, merged in a different order than the data
+    a = Moments(3, 8).update(data[:7]).update(data[7:30])
+    b = Moments(3, 8).update(data[30:31]).update(data[31:])
+    check(Moments(3, 8).merge(b).merge(a), data)
+    check(Moments.from_data(data.astype(np.float32)), data)
+
+    with pytest.raises(ValueError):
+        a.merge(Moments(2, 8))
+
+
+def test_moments_stable():
+    # a large mean relative to the fluctuations
+    rng = np.random.default_rng(0)
+    data = 1e8 + rng.standard_normal((1000, 1, 4))
+
+    m = Moments(1, 4)
+    for i in range(0, 1000, 10):
+        m.update(data[i : i + 10])
+    assert_array_almost_equal(m.variance, np.var(data, axis=0), decimal=6)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_file_moments(series, workers):
+    path, t, data = series
+
+    m = file_moments(path, workers=workers, budget=1)
+    check(m, data)
+
+    m = file_moments(path, fields=[2, 1], time_range=(1, 3), workers=workers)
+    sub = data[10:31][:, [2, 1]]
+    assert m.n == 21
+    assert_array_almost_equal(m.mean, np.mean(sub, axis=0))
+    dev = sub - np.mean(sub, axis=0)
+    assert_array_almost_equal(
+        m.covariance[0], np.mean(dev[:, 0] * dev[:, 1], axis=0)
+    )
+
+
+def test_moments_save(series, tmp_path):
+    _, t, data = series
+    m = Moments.from_data(data)
+
+    path = tmp_path / "stats.hdf5"
+    m.save(path, timespan=(t[0], t[-1]))
+    with h5py.File(path, "r") as f:
+        assert f.attrs["nsamples"] == 50
+        assert f["covariance"].shape == (3, 8)
+        assert_array_almost_equal(f["pairs"][()], [[0, 1], [0, 2], [1, 2]])
+        assert_array_almost_equal(f["flatness"][()], m.flatness)
+
+    m.save(path, compression="gzip")
+    with h5py.File(path, "r") as f:
+        assert f["mean"].compression == "gzip"
+        assert_array_almost_equal(f["mean"][()], m.mean)
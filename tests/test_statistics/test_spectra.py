@@ -0,0 +1,72 @@
+import h5py
+import numpy as np
+import pytest
+from nektsrs.statistics import segment_starts, space_time_spectrum, welch
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from scipy import signal
+
+
+def write_series(path, t, data):
+    with h5py.File(path, "w") as f:
+        f.create_dataset("t", data=t)
+        f.create_dataset("data", data=data)
+    return path
+
+
+def test_segment_starts():
+    assert_array_equal(segment_starts(10, 4), [0, 2, 4, 6])
+    assert_array_equal(segment_starts(10, 4, 0), [0, 4])
+
+    with pytest.raises(ValueError):
+        segment_starts(3, 4)
+    with pytest.raises(ValueError):
+        segment_starts(10, 4, 4)
+
+
+@pytest.mark.parametrize("nperseg", [32, 33])
+def test_welch(tmp_path, nperseg):
+    rng = np.random.default_rng(2)
+    t = 0.5 + np.arange(200) * 0.01
+    data = rng.standard_normal((t.size, 2, 5))
+    data[:, 1] += np.sin(2 * np.pi * 10 * t)[:, np.newaxis]
+    path = write_series(tmp_path / "series.hdf5", t, data)
+
+    f, psd = welch(path, nperseg)
+    f_ref, psd_ref = signal.welch(data, fs=100, nperseg=nperseg, axis=0)
+    assert psd.shape == (f.size, 2, 5)
+    assert_array_almost_equal(f, f_ref)
+    assert_array_almost_equal(psd, psd_ref)
+
+    f, psd = welch(path, nperseg, fields=[1], time_range=(1, 2))
+    _, psd_ref = signal.welch(
+        data[50:151, [1]], fs=100, nperseg=nperseg, axis=0
+    )
+    assert_array_almost_equal(psd, psd_ref)
+
+
+def test_space_time_spectrum(tmp_path):
+    # a wave travelling in x, with a phase varying in z
+    nt, nx, nz = 256, 32, 4
+    dt, dx = 0.05, 2 * np.pi / nx
+    t = np.arange(nt) * dt
+    x = np.arange(nx) * dx
+    z = np.arange(nz)
+    omega0, k0 = 2 * np.pi * 10 / 64 / dt, 3
+    phase = k0 * x[:, np.newaxis] - omega0 * t[:, np.newaxis, np.newaxis]
+    data = np.cos(phase + z)[:, np.newaxis]
+    path = write_series(tmp_path / "plane.hdf5", t, data)
+
+    omega, k, spectrum = space_time_spectrum(
+        path, 64, axis=0, dx=dx, window="boxcar"
+    )
+    assert spectrum.shape == (64, nx // 2 + 1, 1)
+    assert_array_almost_equal(k[:4], [0, 1, 2, 3])
+
+    # the peak is at negative frequencies for a wave moving towards +x
+    i, j = np.unravel_index(np.argmax(spectrum[:, :, 0]), spectrum.shape[:2])
+    assert k[j] == k0
+    assert omega[i] == pytest.approx(-omega0)
+
+    domega = omega[1] - omega[0]
+    dk = k[1] - k[0]
+    assert np.sum(spectrum) * domega * dk == pytest.approx(np.var(data))